@@ -30,6 +30,46 @@ class Settings(BaseSettings):
     app_version: str = "1.0.0"
     api_prefix: str = "/api/v1"
     
+    # Background Jobs (seconds, 0 disables)
+    overdue_sweep_interval_seconds: int = 3600
+    
+    # Dashboard rollups are rebuilt from the sheet after this many seconds
+    # to pick up edits made directly in Google Sheets (0 = never)
+    dashboard_rollup_ttl_seconds: int = 300
+    # Dashboard aggregation engine: "decimal" or "numpy" (identical results)
+    dashboard_engine: str = "decimal"
+    # Live dashboard stream re-reads the sheets this often while anyone is
+    # connected, to push direct sheet edits (0 = app writes only)
+    dashboard_stream_refresh_seconds: int = 60
+    # Lifetime of the tokens browsers connect to the dashboard stream with
+    stream_token_ttl_seconds: int = 60
+    
+    # Cached Invoices table (listing and date-range filters) is reloaded
+    # after this many seconds to pick up direct sheet edits (0 = never)
+    invoice_table_ttl_seconds: int = 60
+    # Cached Support_Tickets table (indexed filters and sorting for ticket
+    # lists), reloaded like the invoice table (0 = never)
+    ticket_table_ttl_seconds: int = 60
+    
+    # Search index: re-read indexed sheets after this many seconds to pick
+    # up direct sheet edits (0 = never)
+    search_index_ttl_seconds: int = 60
+    # Minimum trigram similarity of typo-tolerant search hits (0 = off)
+    search_fuzzy_threshold: float = 0.4
+    # Wait this long for a sheet's first index build before answering
+    # without it (0 = always wait)
+    search_source_timeout_seconds: float = 2.0
+    
+    # Conditional GETs: sheet versions of live-read lists (clients, tickets)
+    # are trusted this long after a full read before re-reading
+    etag_revalidate_seconds: int = 30
+    
+    # Invoice PDF Rendering
+    pdf_cache_dir: str = "cache/pdf"
+    pdf_render_workers: int = 2
+    # Least recently used PDFs are evicted above this size (0 = unbounded)
+    pdf_cache_max_mb: int = 512
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
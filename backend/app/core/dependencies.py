@@ -1,8 +1,15 @@
 """Dependency injection for FastAPI."""
 
-from fastapi import Header, HTTPException, status
+from typing import Optional
+import hashlib
+import hmac
+import time
+from fastapi import Header, HTTPException, Query, status
 from app.core.config import settings
 
+# Scope signed into stream tokens, so they cannot be used for anything else
+STREAM_TOKEN_SCOPE = "dashboard-stream"
+
 
 async def verify_api_key(x_api_key: str = Header(...)):
     """
@@ -23,3 +30,51 @@ async def verify_api_key(x_api_key: str = Header(...)):
             detail="Invalid API Key"
         )
     return x_api_key
+
+
+def _sign_stream_token(expires: int) -> str:
+    message = f"{STREAM_TOKEN_SCOPE}:{expires}".encode()
+    return hmac.new(settings.api_key.encode(), message, hashlib.sha256).hexdigest()
+
+
+def create_stream_token() -> str:
+    """
+    Create a short-lived token for connecting to a Server-Sent Events stream.
+    
+    The token is signed with the API key and only accepted by
+    verify_stream_token until it expires, so URLs that end up in logs do
+    not leak the API key.
+    
+    Returns:
+        str: Token ("<expiry>.<signature>")
+    """
+    expires = int(time.time()) + settings.stream_token_ttl_seconds
+    return f"{expires}.{_sign_stream_token(expires)}"
+
+
+async def verify_stream_token(
+    x_api_key: Optional[str] = Header(None),
+    token: Optional[str] = Query(None, description="Stream token from POST /dashboard/stream/token")
+):
+    """
+    Verify the X-API-Key header or a stream token query parameter.
+    
+    Used by Server-Sent Events endpoints, since browser EventSource
+    connections cannot send custom headers.
+    
+    Raises:
+        HTTPException: If neither the API key nor the token is valid
+    """
+    if x_api_key is not None and hmac.compare_digest(x_api_key.encode(), settings.api_key.encode()):
+        return
+    
+    expires, _, signature = (token or "").partition(".")
+    if not (
+        expires.isdigit()
+        and int(expires) >= time.time()
+        and hmac.compare_digest(signature.encode(), _sign_stream_token(int(expires)).encode())
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired stream token"
+        )
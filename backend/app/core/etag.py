@@ -0,0 +1,74 @@
+"""
+Conditional GET support.
+
+Strong ETags are derived from the version of the data behind a response
+plus the request path and query parameters, so a matching If-None-Match
+is answered with 304 before any aggregation or serialization runs.
+"""
+
+from typing import Any, Optional, Sequence
+import hashlib
+import uuid
+
+from fastapi import Request, Response
+
+from app.core.serialization import dumps
+from app.services.sheets_service import sheet_version
+
+# Versions are per process; keep ETags from one process from matching another
+_PROCESS_TOKEN = uuid.uuid4().hex
+
+
+def make_etag(request: Request, *versions: Any) -> str:
+    """
+    Strong ETag for a request given the versions of its underlying data.
+
+    Args:
+        request: Incoming request (path and query parameters are included)
+        versions: JSON-serializable values that change whenever the
+            response body may change
+
+    Returns:
+        Quoted ETag value
+    """
+    key = dumps([
+        _PROCESS_TOKEN,
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+        list(versions)
+    ])
+    return f'"{hashlib.blake2b(key, digest_size=16).hexdigest()}"'
+
+
+def sheet_etag(
+    request: Request,
+    sheet_names: Sequence[str],
+    max_age_seconds: Optional[float] = None
+) -> Optional[str]:
+    """
+    ETag from sheet versions, or None when a sheet was not read recently enough.
+
+    Args:
+        request: Incoming request
+        sheet_names: Sheets the response is built from
+        max_age_seconds: How long after a full read a version is trusted
+            (None = any age, for tagging a response that just read them)
+    """
+    versions = [sheet_version(name, max_age_seconds) for name in sheet_names]
+    if any(version is None for version in versions):
+        return None
+    return make_etag(request, *versions)
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """True when If-None-Match lists etag (strong comparison) or is *."""
+    header = request.headers.get("if-none-match")
+    if not header or not etag:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the current ETag."""
+    return Response(status_code=304, headers={"ETag": etag})
@@ -0,0 +1,110 @@
+"""
+Fast JSON serialization for high-volume responses.
+Converts raw sheet rows straight to JSON bytes with orjson, skipping
+the pydantic model round-trip used by the regular response path.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+import orjson
+from fastapi import Response
+
+logger = logging.getLogger(__name__)
+
+# (output key, source column, converter or None for passthrough, default value)
+FieldSpec = Tuple[str, str, Optional[Callable[[Any], Any]], Any]
+
+
+def to_float(value: Any) -> float:
+    """Convert a stored amount to float, matching Decimal -> float encoding."""
+    return float(value)
+
+
+def to_decimal_str(value: Any) -> str:
+    """Convert a stored amount to a Decimal string, as pydantic encodes Decimal fields."""
+    return str(Decimal(value))
+
+
+def to_int(value: Any) -> int:
+    """Convert a stored count to int."""
+    return int(value)
+
+
+def to_date(value: Any) -> date:
+    """Parse an ISO date; orjson encodes it back as YYYY-MM-DD."""
+    return date.fromisoformat(value)
+
+
+def to_datetime(value: Any) -> datetime:
+    """Parse an ISO datetime; orjson encodes it back in ISO format."""
+    return datetime.fromisoformat(value)
+
+
+class RowSerializer:
+    """Pre-built serializer for one response shape."""
+
+    def __init__(self, fields: Sequence[FieldSpec], constants: Optional[Dict[str, Any]] = None):
+        """
+        Build serializer.
+
+        Args:
+            fields: Field specs in output order
+            constants: Fixed values added to every serialized row
+        """
+        self.fields = tuple(fields)
+        self.constants = dict(constants or {})
+
+    def serialize(self, row: Dict) -> Dict:
+        """
+        Convert a single sheet row to a JSON-ready dict.
+
+        Raises:
+            ValueError, TypeError, ArithmeticError: If a field cannot be converted
+        """
+        out = {}
+        for key, column, convert, default in self.fields:
+            value = row.get(column, default)
+            out[key] = convert(value) if convert is not None else value
+        if self.constants:
+            out.update(self.constants)
+        return out
+
+    def serialize_many(self, rows: Iterable[Dict]) -> List[Dict]:
+        """Serialize rows, skipping (and logging) rows that fail to convert."""
+        serialized = []
+        for row in rows:
+            try:
+                serialized.append(self.serialize(row))
+            except (ValueError, TypeError, ArithmeticError) as e:
+                logger.error(f"Error serializing row: {e}")
+                continue
+        return serialized
+
+
+def _default(value: Any) -> Any:
+    """Fallback encoder for types orjson does not handle natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialize payload to JSON bytes."""
+    return orjson.dumps(payload, default=_default)
+
+
+def json_response(
+    payload: Any,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Build a JSON response without re-validating the payload."""
+    return Response(
+        content=dumps(payload),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json"
+    )
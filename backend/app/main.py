@@ -5,10 +5,12 @@ Main application entry point.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
 import logging
 
 from app.core.config import settings
 from app.routers import invoice, client, dashboard, task, search, ticket, activity
+from app.services.sheets_service import set_listener_loop
 
 # Configure logging
 logging.basicConfig(
@@ -64,6 +66,26 @@ app.include_router(
     activity.router
 )
 
+@app.on_event("startup")
+async def start_background_jobs():
+    """Start background maintenance jobs."""
+    # Writes from background jobs update in-memory caches on this loop
+    set_listener_loop(asyncio.get_running_loop())
+    invoice.overdue_sweeper.start(settings.overdue_sweep_interval_seconds)
+    dashboard.dashboard_stream.start(settings.dashboard_stream_refresh_seconds)
+    search.search_index.warm()
+
+
+@app.on_event("shutdown")
+async def stop_background_jobs():
+    """Stop background maintenance jobs."""
+    set_listener_loop(None)
+    invoice.overdue_sweeper.stop()
+    dashboard.dashboard_stream.stop()
+    invoice.invoice_pdf_service.shutdown()
+    search.search_index.shutdown()
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API health check."""
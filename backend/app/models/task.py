@@ -2,7 +2,7 @@
 Task models for Operations Dashboard Kanban board.
 """
 from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 from datetime import date
 
 
@@ -45,6 +45,16 @@ class TaskStatusUpdate(BaseModel):
     status: TaskStatus
 
 
+class TaskBulkUpdateItem(TaskUpdate):
+    """Changes for one task in a bulk update."""
+    task_id: str = Field(..., min_length=1)
+
+
+class TaskBulkUpdate(BaseModel):
+    """Model for updating many tasks at once."""
+    updates: List[TaskBulkUpdateItem] = Field(..., min_items=1, max_items=1000)
+
+
 class Task(TaskBase):
     """Complete task model with all fields."""
     task_id: str
@@ -1,15 +1,17 @@
 """
 Client API endpoints.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from typing import List
 from app.schemas.client import Client, ClientCreate
 from app.services.client_service import ClientService
 from app.services.sheets_service import SheetsService
 from app.services.activity_service import ActivityService
+from app.services.client_totals_service import ClientTotalsService
 from app.schemas.activity import ActivityLogCreate
 from app.core.config import settings
 from app.core.dependencies import verify_api_key
+from app.core.etag import sheet_etag, etag_matches, not_modified
 import logging
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,8 @@ sheets_service = SheetsService(
 )
 client_service = ClientService(sheets_service)
 activity_service = ActivityService(sheets_service)
+# Subscribes to invoice writes to keep total_invoices / total_revenue current
+client_totals_service = ClientTotalsService(sheets_service)
 
 
 @router.post("", response_model=dict, status_code=status.HTTP_201_CREATED)
@@ -81,6 +85,8 @@ async def create_client(
 
 @router.get("", response_model=dict)
 async def list_clients(
+    request: Request,
+    response: Response,
     limit: int = None,
     api_key: str = Depends(verify_api_key)
 ):
@@ -89,13 +95,22 @@ async def list_clients(
     
     - **limit**: Optional limit for number of clients to return
     
-    Returns list of all clients with their details.
+    Returns list of all clients with their details. Supports
+    If-None-Match; unchanged lists return 304.
     """
+    etag = sheet_etag(request, ["Clients"], settings.etag_revalidate_seconds)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
     try:
         logger.info("Fetching clients list")
         clients = client_service.list_clients(limit=limit)
         logger.info(f"Retrieved {len(clients)} clients")
         
+        etag = sheet_etag(request, ["Clients"])
+        if etag:
+            response.headers["ETag"] = etag
+        
         return {
             "success": True,
             "count": len(clients),
@@ -109,6 +124,34 @@ async def list_clients(
         )
 
 
+@router.post("/rebuild-totals", response_model=dict)
+async def rebuild_client_totals(
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Recompute total_invoices / total_revenue for every client.
+    
+    Totals are maintained incrementally on invoice writes; use this after
+    invoices were edited directly in the sheet, or once to backfill.
+    Returns the clients whose stored totals were corrected.
+    """
+    try:
+        logger.info("Rebuilding client totals")
+        result = client_totals_service.rebuild()
+        
+        return {
+            "success": True,
+            "message": f"Corrected totals for {result['clients_corrected']} clients",
+            "data": result
+        }
+    except Exception as e:
+        logger.error(f"Error rebuilding client totals: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to rebuild client totals: {str(e)}"
+        )
+
+
 @router.get("/{client_id}", response_model=dict)
 async def get_client(
     client_id: str,
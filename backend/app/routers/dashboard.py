@@ -1,12 +1,18 @@
 """
 Dashboard router for aggregated metrics.
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from typing import Optional
-from app.core.dependencies import verify_api_key
+from app.core.dependencies import verify_api_key, verify_stream_token, create_stream_token
 from app.services.sheets_service import SheetsService
-from app.services.dashboard_service import DashboardService
+from app.services.dashboard_service import DashboardService, DASHBOARD_SECTIONS
+from app.services.revenue_index import GRANULARITIES
+from app.services.leaderboards import LEADERBOARD_DIMENSIONS, LEADERBOARD_WINDOWS
+from app.services.dashboard_stream import DashboardStream
 from app.core.config import settings
+from app.core.serialization import json_response
+from app.core.etag import make_etag, etag_matches, not_modified
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -15,11 +21,17 @@ sheets_service = SheetsService(
     credentials_path=settings.google_sheets_credentials_path,
     spreadsheet_id=settings.spreadsheet_id
 )
-dashboard_service = DashboardService(sheets_service)
+dashboard_service = DashboardService(
+    sheets_service,
+    rollup_ttl_seconds=settings.dashboard_rollup_ttl_seconds,
+    engine=settings.dashboard_engine
+)
+dashboard_stream = DashboardStream(sheets_service, dashboard_service)
 
 
 @router.get("/executive")
 async def get_executive_dashboard(
+    request: Request,
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     api_key: str = Depends(verify_api_key)
@@ -30,11 +42,15 @@ async def get_executive_dashboard(
     Returns KPIs, revenue trends, growth rates, and top clients.
     """
     try:
+        etag = make_etag(request, dashboard_service.state_version())
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
         metrics = dashboard_service.get_executive_metrics(start_date, end_date)
-        return {
+        return json_response({
             "success": True,
             "data": metrics
-        }
+        }, headers={"ETag": etag})
     except Exception as e:
         return {
             "success": False,
@@ -44,6 +60,7 @@ async def get_executive_dashboard(
 
 @router.get("/sales")
 async def get_sales_dashboard(
+    request: Request,
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     api_key: str = Depends(verify_api_key)
@@ -54,11 +71,15 @@ async def get_sales_dashboard(
     Returns sales totals, trends, and salesperson leaderboard.
     """
     try:
+        etag = make_etag(request, dashboard_service.state_version())
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
         metrics = dashboard_service.get_sales_metrics(start_date, end_date)
-        return {
+        return json_response({
             "success": True,
             "data": metrics
-        }
+        }, headers={"ETag": etag})
     except Exception as e:
         return {
             "success": False,
@@ -68,6 +89,7 @@ async def get_sales_dashboard(
 
 @router.get("/financial")
 async def get_financial_dashboard(
+    request: Request,
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     api_key: str = Depends(verify_api_key)
@@ -78,13 +100,221 @@ async def get_financial_dashboard(
     Returns revenue, tax, discounts, and payment status breakdown.
     """
     try:
+        etag = make_etag(request, dashboard_service.state_version())
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
         metrics = dashboard_service.get_financial_metrics(start_date, end_date)
-        return {
+        return json_response({
             "success": True,
             "data": metrics
+        }, headers={"ETag": etag})
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/all")
+async def get_all_dashboards(
+    request: Request,
+    start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    sections: Optional[str] = Query(
+        None,
+        description=f"Comma-separated sections ({', '.join(DASHBOARD_SECTIONS)}); default all"
+    ),
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Get executive, sales and financial dashboards in one request.
+    
+    All sections are computed from one shared fetch and aggregation
+    pass. `timings_ms` reports the cost of each step.
+    """
+    requested = [name.strip() for name in sections.split(",") if name.strip()] if sections else None
+    
+    try:
+        etag = make_etag(request, dashboard_service.state_version())
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
+        result = dashboard_service.get_dashboard(start_date, end_date, requested)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+    
+    return json_response({
+        "success": True,
+        "data": result["sections"],
+        "timings_ms": result["timings_ms"]
+    }, headers={"ETag": etag})
+
+
+@router.get("/compare")
+async def compare_periods(
+    request: Request,
+    periods: int = Query(12, ge=1, le=366, description="Number of periods"),
+    granularity: str = Query("month", description=f"One of: {', '.join(GRANULARITIES)}"),
+    end_date: Optional[str] = Query(None, description="Date inside the last period (YYYY-MM-DD)"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Only invoices with this status"),
+    sales_person: Optional[str] = Query(None, description="Only invoices of this salesperson"),
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Compare revenue period-by-period (e.g. last 12 months month-by-month).
+    
+    Answered from per-day prefix sums, so cost does not depend on the
+    number of invoices.
+    """
+    try:
+        etag = make_etag(request, dashboard_service.state_version())
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
+        periods_data = dashboard_service.compare_periods(
+            periods, granularity, end_date, status_filter, sales_person
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
         }
+    
+    return json_response({
+        "success": True,
+        "data": periods_data
+    }, headers={"ETag": etag})
+
+
+@router.get("/leaderboard")
+async def get_leaderboard(
+    request: Request,
+    board: str = Query("clients", description=f"One of: {', '.join(LEADERBOARD_DIMENSIONS)}"),
+    window: str = Query("all", description=f"One of: {', '.join(LEADERBOARD_WINDOWS)}"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum results to return"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Get a page of the client or salesperson revenue leaderboard.
+    
+    Rankings are maintained incrementally on invoice writes, all time
+    and over rolling 7, 30 and 90 day windows.
+    """
+    try:
+        etag = make_etag(request, dashboard_service.state_version())
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
+        result = dashboard_service.get_leaderboard(board, window, limit, offset)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+    
+    return json_response({
+        "success": True,
+        "data": {
+            "board": board,
+            "window": window,
+            "entries": result["entries"],
+            "total": result["total"],
+            "limit": limit,
+            "offset": offset
+        }
+    }, headers={"ETag": etag})
+
+
+@router.get("/cohorts")
+async def get_client_cohorts(
+    request: Request,
+    start_date: Optional[str] = Query(None, description="First client creation date (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="Last client creation date (YYYY-MM-DD)"),
+    months: int = Query(12, ge=1, le=60, description="Activation / retention curve length in months"),
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Get client cohort analytics.
+    
+    Clients are grouped by creation month; each cohort reports its
+    activation (first invoice) and retention (months with invoices)
+    curves.
+    """
+    try:
+        etag = make_etag(request, dashboard_service.state_version())
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
+        cohorts = dashboard_service.get_client_cohorts(start_date, end_date, months)
+        return json_response({
+            "success": True,
+            "data": cohorts
+        }, headers={"ETag": etag})
     except Exception as e:
         return {
             "success": False,
             "error": str(e)
         }
+
+
+@router.post("/stream/token")
+async def create_dashboard_stream_token(
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Get a short-lived token for connecting to the dashboard stream.
+    
+    Browsers' EventSource cannot send the X-API-Key header; pass the token
+    as `?token=` instead of the API key, so the key stays out of URLs.
+    """
+    return {
+        "success": True,
+        "data": {
+            "token": create_stream_token(),
+            "expires_in": settings.stream_token_ttl_seconds
+        }
+    }
+
+
+@router.get("/stream")
+async def stream_dashboard(
+    _: None = Depends(verify_stream_token)
+):
+    """
+    Live dashboard metrics as Server-Sent Events.
+    
+    Sends a `snapshot` event with every metric (dotted names such as
+    `executive.total_revenue` or `support.tickets_by_status.open`), then
+    `delta` events with only the values that changed after invoice,
+    client, ticket or task writes or a periodic sheet refresh.
+    Authenticate with the X-API-Key header or with `?token=` from
+    POST /dashboard/stream/token.
+    """
+    return StreamingResponse(
+        dashboard_stream.events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
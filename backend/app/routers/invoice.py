@@ -3,22 +3,40 @@ Invoice API Router.
 Handles all invoice-related endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional
+from datetime import date
+import io
 
 from app.core.config import settings
 from app.core.dependencies import verify_api_key
 from app.services.sheets_service import SheetsService
 from app.services.invoice_service import InvoiceService
+from app.services.invoice_table import InvoiceTable
+from app.services.invoice_import_service import (
+    InvoiceImportService,
+    iter_csv_records,
+    iter_ndjson_records
+)
 from app.services.activity_service import ActivityService
+from app.services.overdue_sweeper import OverdueSweeper
+from app.services.pdf_service import InvoicePdfService
+from app.services.export_service import InvoiceExportService, EXPORT_FORMATS
+from app.services.audit_service import InvoiceAuditService
 from app.schemas.activity import ActivityLogCreate
 from app.schemas.invoice import (
     InvoiceCreate,
     InvoiceResponse,
     InvoiceListResponse,
     InvoiceStatusUpdate,
-    ApiResponse
+    InvoiceBulkStatusUpdate,
+    ApiResponse,
+    INVOICE_SUMMARY_SERIALIZER
 )
+from app.core.serialization import json_response
+from app.core.etag import make_etag, etag_matches, not_modified
 import logging
 
 logger = logging.getLogger(__name__)
@@ -33,8 +51,18 @@ sheets_service = SheetsService(
     credentials_path=settings.google_sheets_credentials_path,
     spreadsheet_id=settings.spreadsheet_id
 )
-invoice_service = InvoiceService(sheets_service)
+invoice_table = InvoiceTable(sheets_service, ttl_seconds=settings.invoice_table_ttl_seconds)
+invoice_service = InvoiceService(sheets_service, invoice_table)
+invoice_import_service = InvoiceImportService(sheets_service, invoice_service)
 activity_service = ActivityService(sheets_service)
+overdue_sweeper = OverdueSweeper(sheets_service, activity_service)
+invoice_export_service = InvoiceExportService(sheets_service)
+invoice_audit_service = InvoiceAuditService(sheets_service)
+invoice_pdf_service = InvoicePdfService(
+    cache_dir=settings.pdf_cache_dir,
+    max_workers=settings.pdf_render_workers,
+    max_cache_bytes=settings.pdf_cache_max_mb * 1024 * 1024
+)
 
 
 @router.post(
@@ -91,6 +119,235 @@ async def create_invoice(
         )
 
 
+@router.post(
+    "/import",
+    response_model=ApiResponse,
+    summary="Bulk import invoices",
+    description="Import many invoices with items from a CSV or NDJSON upload using batched writes"
+)
+async def import_invoices(
+    file: UploadFile = File(..., description="CSV (one item per row) or NDJSON (one invoice per line)"),
+    format: Optional[str] = Query(None, description="Upload format: csv or ndjson (default: from file extension)"),
+    chunk_size: int = Query(500, ge=1, le=5000, description="Invoices validated and written per batch"),
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Bulk import invoices.
+    
+    - **CSV**: invoice columns (invoice_id, client_id, client_name, invoice_date,
+      due_date, sales_person, status) plus item columns (service, description,
+      quantity, unit_price, tax_percent, discount_percent). Consecutive rows with
+      the same invoice_ref / invoice_id form one invoice.
+    - **NDJSON**: one invoice object per line, same shape as POST /invoices
+      with an optional status.
+    
+    Invalid rows are reported per line and do not abort the import.
+    """
+    import_format = (format or (file.filename or "").rsplit(".", 1)[-1]).lower()
+    if import_format in ("jsonl", "json"):
+        import_format = "ndjson"
+    if import_format not in ("csv", "ndjson"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported import format. Use csv or ndjson"
+        )
+    
+    try:
+        # Stream the upload line by line instead of loading it into memory
+        lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+        records = (
+            iter_csv_records(lines) if import_format == "csv"
+            else iter_ndjson_records(lines)
+        )
+        result = invoice_import_service.import_invoices(records, chunk_size=chunk_size)
+        
+        # Log one activity for the whole import
+        activity_service.log_activity(ActivityLogCreate(
+            type="invoices_imported",
+            title="Invoices Imported",
+            description=f"Imported {result.imported} invoices from {file.filename} ({result.failed} failed)",
+            entity_type="invoice",
+            user="Admin"
+        ))
+        
+        return ApiResponse(
+            success=result.failed == 0,
+            message=f"Imported {result.imported} invoices, {result.failed} failed",
+            data=result.dict()
+        )
+    
+    except Exception as e:
+        logger.error(f"Error importing invoices: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to import invoices"
+        )
+
+
+@router.get(
+    "/export",
+    summary="Export invoices",
+    description="Stream all matching invoices as CSV, NDJSON or XLSX (no pagination limit)"
+)
+async def export_invoices(
+    format: str = Query("csv", description="Export format: csv, ndjson or xlsx"),
+    start_date: Optional[date] = Query(None, description="Earliest invoice date (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="Latest invoice date (YYYY-MM-DD)"),
+    status_filter: Optional[str] = Query(None, description="Filter by status (draft, pending, paid, overdue)"),
+    client_id: Optional[str] = Query(None, description="Filter by client ID"),
+    expand_items: bool = Query(False, description="One row per line item instead of per invoice"),
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Streaming invoice export.
+    
+    Rows are read from the sheet in chunks and written out as they arrive,
+    so memory stays flat regardless of the number of invoices exported.
+    """
+    export_format = format.lower()
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported export format. Use one of: {', '.join(EXPORT_FORMATS)}"
+        )
+    
+    stream = getattr(invoice_export_service, f"stream_{export_format}")
+    filename = f"invoices-{date.today().isoformat()}.{export_format}"
+    
+    return StreamingResponse(
+        stream(
+            expand_items=expand_items,
+            start_date=start_date,
+            end_date=end_date,
+            status=status_filter,
+            client_id=client_id
+        ),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get(
+    "/pdf",
+    summary="Download invoice PDFs as ZIP",
+    description="Render many invoices to PDF server-side and stream them as one ZIP archive"
+)
+async def export_invoice_pdfs(
+    invoice_ids: Optional[str] = Query(None, description="Comma-separated invoice IDs"),
+    status_filter: Optional[str] = Query(None, description="Filter by status (draft, pending, paid, overdue)"),
+    start_date: Optional[date] = Query(None, description="Earliest invoice date (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="Latest invoice date (YYYY-MM-DD)"),
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Batch PDF export.
+    
+    Select invoices by **invoice_ids** or by **status_filter** / date range
+    (e.g. a whole month). PDFs of unchanged invoices come from the cache.
+    """
+    ids = None
+    if invoice_ids:
+        ids = list(dict.fromkeys(i.strip() for i in invoice_ids.split(",") if i.strip()))
+    
+    if not ids and not (status_filter or start_date or end_date):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide invoice_ids or at least one filter"
+        )
+    
+    invoices = invoice_service.get_invoices(
+        invoice_ids=ids,
+        status=status_filter,
+        start_date=start_date,
+        end_date=end_date
+    )
+    
+    if not invoices:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No invoices matched"
+        )
+    
+    return StreamingResponse(
+        invoice_pdf_service.iter_zip(invoices),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="invoices.zip"'}
+    )
+
+
+@router.get(
+    "/{invoice_id}/pdf",
+    summary="Download invoice PDF",
+    description="Render an invoice to PDF server-side (cached by invoice content)"
+)
+async def get_invoice_pdf(
+    invoice_id: str,
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Get invoice PDF.
+    
+    - **invoice_id**: Invoice ID (format: INV-YYYY-XXX)
+    """
+    invoice = invoice_service.get_invoice(invoice_id)
+    
+    if not invoice:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Invoice {invoice_id} not found"
+        )
+    
+    try:
+        pdf = await invoice_pdf_service.render(invoice)
+    except Exception as e:
+        logger.error(f"Error rendering PDF for {invoice_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to render invoice PDF"
+        )
+    
+    return Response(
+        content=pdf,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'inline; filename="{invoice_id}.pdf"'}
+    )
+
+
+@router.get(
+    "/audit",
+    response_model=ApiResponse,
+    summary="Audit invoice totals",
+    description="Recompute line and header totals from Invoice_Items and report mismatches and orphaned items"
+)
+async def audit_invoices(
+    tolerance: float = Query(0.01, ge=0, description="Allowed absolute difference per amount"),
+    max_results: int = Query(1000, ge=1, le=100000, description="Max listed entries per finding type"),
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Audit stored invoice totals against their line items.
+    
+    Both sheets are read once, column-wise, and all totals are
+    recomputed in vectorized form. Counts in `summary` are exact;
+    detail lists are capped at `max_results`.
+    """
+    try:
+        report = invoice_audit_service.audit(tolerance=tolerance, max_results=max_results)
+        
+        return json_response({
+            "success": True,
+            "message": f"Audited {report['invoices_checked']} invoices",
+            "data": report
+        })
+    
+    except Exception as e:
+        logger.error(f"Error auditing invoices: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to audit invoices"
+        )
+
+
 @router.get(
     "/{invoice_id}",
     response_model=ApiResponse,
@@ -130,8 +387,11 @@ async def get_invoice(
     description="Get list of invoices with optional filtering and pagination"
 )
 async def list_invoices(
+    request: Request,
     status_filter: Optional[str] = Query(None, description="Filter by status (draft, pending, paid, overdue)"),
     client_id: Optional[str] = Query(None, description="Filter by client ID"),
+    start_date: Optional[date] = Query(None, description="Earliest invoice date (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="Latest invoice date (YYYY-MM-DD)"),
     limit: int = Query(50, ge=1, le=100, description="Maximum results to return"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
     api_key: str = Depends(verify_api_key)
@@ -141,31 +401,42 @@ async def list_invoices(
     
     - **status**: Filter by invoice status
     - **client_id**: Filter by client ID
+    - **start_date** / **end_date**: Invoice date range (inclusive)
     - **limit**: Maximum results (1-100, default 50)
     - **offset**: Pagination offset (default 0)
     
     Returns paginated list of invoices.
     """
     try:
-        invoices, total = invoice_service.list_invoices(
+        invoice_table.ensure_loaded()
+        etag = make_etag(request, invoice_table.version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
+        rows, total = invoice_service.list_invoice_rows(
             status=status_filter,
             client_id=client_id,
             limit=limit,
-            offset=offset
+            offset=offset,
+            start_date=start_date,
+            end_date=end_date
         )
         
+        # Fast path: rows go straight to JSON bytes, no per-row models
+        invoices = INVOICE_SUMMARY_SERIALIZER.serialize_many(rows)
+        
         response_data = {
-            "invoices": [inv.dict() for inv in invoices],
+            "invoices": invoices,
             "total": total,
             "limit": limit,
             "offset": offset
         }
         
-        return ApiResponse(
-            success=True,
-            message=f"Retrieved {len(invoices)} invoices",
-            data=response_data
-        )
+        return json_response({
+            "success": True,
+            "message": f"Retrieved {len(invoices)} invoices",
+            "data": response_data
+        }, headers={"ETag": etag})
     
     except Exception as e:
         logger.error(f"Error listing invoices: {e}")
@@ -194,9 +465,9 @@ async def update_invoice_status(
     
     Returns success message.
     """
-    success = invoice_service.update_status(invoice_id, status_update)
+    invoice_row = invoice_service.update_status(invoice_id, status_update)
     
-    if not success:
+    if invoice_row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Invoice {invoice_id} not found"
@@ -205,5 +476,92 @@ async def update_invoice_status(
     return ApiResponse(
         success=True,
         message=f"Invoice status updated to {status_update.status}",
-        data={"invoice_id": invoice_id, "status": status_update.status}
+        data={
+            "invoice_id": invoice_id,
+            "status": invoice_row.get("status", status_update.status),
+            "updated_at": invoice_row.get("updated_at", "")
+        }
     )
+
+
+@router.patch(
+    "/bulk",
+    response_model=ApiResponse,
+    summary="Bulk update invoice status",
+    description="Update the status of many invoices with one sheet read and one batched write"
+)
+async def bulk_update_invoice_status(
+    bulk_update: InvoiceBulkStatusUpdate,
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Bulk update invoice status.
+    
+    - **updates**: List of {invoice_id, status} pairs
+    
+    Returns a result per invoice; unknown IDs are reported, not fatal.
+    """
+    try:
+        results = invoice_service.bulk_update_status(bulk_update.updates)
+        
+        updated_ids = [r["invoice_id"] for r in results if r["success"]]
+        failed = len(results) - len(updated_ids)
+        
+        # Log one activity for the whole batch
+        if updated_ids:
+            activity_service.log_bulk_activity(
+                type="invoices_bulk_updated",
+                title="Invoices Updated",
+                entity_type="invoice",
+                entity_ids=updated_ids,
+                user="Admin"
+            )
+        
+        return ApiResponse(
+            success=failed == 0,
+            message=f"Updated {len(updated_ids)} invoices, {failed} failed",
+            data={
+                "results": results,
+                "updated": len(updated_ids),
+                "failed": failed
+            }
+        )
+    
+    except Exception as e:
+        logger.error(f"Error bulk updating invoices: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to update invoices"
+        )
+
+
+@router.post(
+    "/sweep-overdue",
+    response_model=ApiResponse,
+    summary="Mark overdue invoices",
+    description="Flip pending invoices past their due date to overdue (also runs in the background)"
+)
+async def sweep_overdue_invoices(
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Run the overdue sweeper now.
+    
+    Only invoices whose due date passed since the last sweep are touched.
+    Returns the IDs flipped to overdue.
+    """
+    try:
+        flipped = await run_in_threadpool(overdue_sweeper.sweep)
+        
+        return ApiResponse(
+            success=True,
+            message=f"Marked {len(flipped)} invoices overdue",
+            data={"invoice_ids": flipped}
+        )
+    
+    except Exception as e:
+        logger.error(f"Error sweeping overdue invoices: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to sweep overdue invoices"
+        )
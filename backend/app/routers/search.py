@@ -1,10 +1,12 @@
 """
-Search router for searching across clients and invoices.
+Search router for searching across clients, invoices, tickets, tasks and activity logs.
 """
-from fastapi import APIRouter, Depends, Query
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Optional, Dict, Any, Callable, Tuple
 from app.core.dependencies import verify_api_key
 from app.services.sheets_service import SheetsService
+from app.services.search_index import SearchIndex, SEARCH_SOURCES, SUGGEST_FIELDS
 from app.core.config import settings
 import logging
 
@@ -17,142 +19,256 @@ sheets_service = SheetsService(
     credentials_path=settings.google_sheets_credentials_path,
     spreadsheet_id=settings.spreadsheet_id
 )
+search_index = SearchIndex(
+    sheets_service,
+    ttl_seconds=settings.search_index_ttl_seconds,
+    fuzzy_threshold=settings.search_fuzzy_threshold,
+    source_timeout_seconds=settings.search_source_timeout_seconds
+)
 
 
-def search_clients(query: str) -> List[Dict[str, Any]]:
-    """
-    Search clients by ID, name, email, or phone.
-    
-    Args:
-        query: Search query string
-        
-    Returns:
-        List of matching clients
-    """
-    try:
-        all_clients = sheets_service.get_all_rows("Clients")
-        query_lower = query.lower()
-        
-        results = []
-        for client in all_clients:
-            # Search in client_id, name, email, phone
-            if (
-                query_lower in client.get('client_id', '').lower() or
-                query_lower in client.get('name', '').lower() or
-                query_lower in client.get('email', '').lower() or
-                query_lower in client.get('phone', '').lower()
-            ):
-                results.append({
-                    'type': 'client',
-                    'id': client.get('client_id', ''),
-                    'name': client.get('name', ''),
-                    'email': client.get('email', ''),
-                    'phone': client.get('phone', ''),
-                    'company': client.get('company', '')
-                })
-        
-        return results
-    except Exception as e:
-        logger.error(f"Error searching clients: {e}")
-        return []
+def client_hit(client: Dict) -> Dict[str, Any]:
+    """Search result for a client row."""
+    return {
+        'type': 'client',
+        'id': client.get('client_id', ''),
+        'name': client.get('name', ''),
+        'email': client.get('email', ''),
+        'phone': client.get('phone', ''),
+        'company': client.get('company', '')
+    }
 
 
-def search_invoices(query: str) -> List[Dict[str, Any]]:
-    """
-    Search invoices by invoice ID or client ID.
-    
-    Args:
-        query: Search query string
-        
-    Returns:
-        List of matching invoices
-    """
+def invoice_hit(invoice: Dict) -> Dict[str, Any]:
+    """Search result for an invoice row."""
     try:
-        all_invoices = sheets_service.get_all_rows("Invoices")
-        query_lower = query.lower()
-        
-        results = []
-        for invoice in all_invoices:
-            # Search in invoice_id, client_id
-            if (
-                query_lower in invoice.get('invoice_id', '').lower() or
-                query_lower in invoice.get('client_id', '').lower()
-            ):
-                results.append({
-                    'type': 'invoice',
-                    'id': invoice.get('invoice_id', ''),
-                    'client_id': invoice.get('client_id', ''),
-                    'client_name': invoice.get('client_name', ''),
-                    'grand_total': float(invoice.get('grand_total', 0)),
-                    'status': invoice.get('status', ''),
-                    'invoice_date': invoice.get('invoice_date', '')
-                })
-        
-        return results
-    except Exception as e:
-        logger.error(f"Error searching invoices: {e}")
-        return []
+        grand_total = float(invoice.get('grand_total') or 0)
+    except ValueError:
+        grand_total = 0.0
+    return {
+        'type': 'invoice',
+        'id': invoice.get('invoice_id', ''),
+        'client_id': invoice.get('client_id', ''),
+        'client_name': invoice.get('client_name', ''),
+        'grand_total': grand_total,
+        'status': invoice.get('status', ''),
+        'invoice_date': invoice.get('invoice_date', '')
+    }
+
+
+def ticket_hit(ticket: Dict) -> Dict[str, Any]:
+    """Search result for a support ticket row."""
+    return {
+        'type': 'ticket',
+        'id': ticket.get('ticket_id', ''),
+        'title': ticket.get('title', ''),
+        'client_id': ticket.get('client_id', ''),
+        'client_name': ticket.get('client_name', ''),
+        'status': ticket.get('status', ''),
+        'priority': ticket.get('priority', '')
+    }
+
+
+def task_hit(task: Dict) -> Dict[str, Any]:
+    """Search result for a task row."""
+    return {
+        'type': 'task',
+        'id': task.get('task_id', ''),
+        'title': task.get('title', ''),
+        'status': task.get('status', ''),
+        'priority': task.get('priority', ''),
+        'assigned_to': task.get('assigned_to', ''),
+        'due_date': task.get('due_date', '')
+    }
+
+
+def activity_hit(log: Dict) -> Dict[str, Any]:
+    """Search result for an activity log row."""
+    return {
+        'type': 'activity',
+        'id': log.get('log_id', ''),
+        'title': log.get('title', ''),
+        'description': log.get('description', ''),
+        'entity_id': log.get('entity_id', ''),
+        'entity_type': log.get('entity_type', ''),
+        'timestamp': log.get('timestamp', '')
+    }
+
+
+# Entity type -> (results key, hit builder); sheets come from SEARCH_SOURCES
+SEARCH_TYPES: Dict[str, Tuple[str, Callable[[Dict], Dict[str, Any]]]] = {
+    "client": ("clients", client_hit),
+    "invoice": ("invoices", invoice_hit),
+    "ticket": ("tickets", ticket_hit),
+    "task": ("tasks", task_hit),
+    "activity": ("activities", activity_hit),
+}
+SHEET_TYPES = {sheet_name: source[0] for sheet_name, source in SEARCH_SOURCES.items()}
+
+
+def _hit(sheet_name: str, score: float, row: Dict) -> Dict[str, Any]:
+    """Search result for a row of an indexed sheet, with its score."""
+    hit = SEARCH_TYPES[SHEET_TYPES[sheet_name]][1](row)
+    hit['score'] = score
+    return hit
 
 
 @router.get("")
 async def search(
     q: str = Query(..., min_length=1, description="Search query"),
-    type: Optional[str] = Query(None, description="Filter by type: 'client', 'invoice', or 'all'"),
+    type: Optional[str] = Query(
+        None,
+        description="Filter by type: 'client', 'invoice', 'ticket', 'task', 'activity', or 'all'"
+    ),
     limit: int = Query(10, ge=1, le=50, description="Maximum results to return"),
+    fuzzy_threshold: Optional[float] = Query(
+        None, ge=0, le=1,
+        description="Minimum trigram similarity of typo-tolerant hits (0 = exact only)"
+    ),
     api_key: str = Depends(verify_api_key)
 ):
     """
-    Search across clients and invoices.
+    Search across clients, invoices, tickets, tasks and activity logs.
+    
+    Answered from an in-memory ranked index: every query word must start
+    a word of an indexed field (or appear among a phone number's digits).
+    Hits are ranked by field weight: an exact ID first, then IDs, then
+    names and titles, then references and descriptions; whole-word matches
+    outrank prefixes. When a type has fewer than `limit` exact hits,
+    client names and emails and ticket titles are also matched by trigram
+    similarity, so "Acme Copr" still finds "Acme Corp".
+    
+    Sheets are indexed concurrently on first use; one not ready within
+    SEARCH_SOURCE_TIMEOUT_SECONDS is left out and listed in `partial`.
     
     Query parameters:
     - q: Search query (required)
-    - type: Filter by 'client', 'invoice', or 'all' (optional, default: 'all')
-    - limit: Max results per type (optional, default: 10)
+    - type: Filter by 'client', 'invoice', 'ticket', 'task', 'activity',
+      or 'all' (optional, default: 'all')
+    - limit: Max results per type and in `top` (optional, default: 10)
+    - fuzzy_threshold: Share of the query's trigrams a fuzzy hit must
+      contain (optional, default: SEARCH_FUZZY_THRESHOLD)
     
     Returns:
     {
         "query": "search term",
         "results": {
+            "top": [...],
             "clients": [...],
-            "invoices": [...]
+            "invoices": [...],
+            "tickets": [...],
+            "tasks": [...],
+            "activities": [...]
         },
-        "total": 15
+        "total": 15,
+        "partial": []
     }
+    with `top` holding the best hits of every type, each with a `score`,
+    and `partial` the types left out because their index was not ready.
     """
+    if type is not None and type != "all" and type not in SEARCH_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"type must be one of: {', '.join(SEARCH_TYPES)}, all"
+        )
+    
+    results: Dict[str, List[Dict[str, Any]]] = {"top": []}
+    results.update({key: [] for key, _ in SEARCH_TYPES.values()})
     try:
-        results = {
-            "clients": [],
-            "invoices": []
-        }
+        sheet_names = [
+            sheet_name for sheet_name, entity_type in SHEET_TYPES.items()
+            if type is None or type == "all" or type == entity_type
+        ]
+        # Off the event loop: a cold index waits up to the source deadline
+        per_sheet, best, timed_out = await run_in_threadpool(
+            search_index.search_all, q, limit, sheet_names, fuzzy_threshold
+        )
         
-        # Search clients
-        if type is None or type == "all" or type == "client":
-            client_results = search_clients(q)
-            results["clients"] = client_results[:limit]
+        for sheet_name, hits in per_sheet.items():
+            key = SEARCH_TYPES[SHEET_TYPES[sheet_name]][0]
+            results[key] = [_hit(sheet_name, score, row) for score, row in hits]
+        results["top"] = [_hit(sheet_name, score, row) for score, sheet_name, row in best]
         
-        # Search invoices
-        if type is None or type == "all" or type == "invoice":
-            invoice_results = search_invoices(q)
-            results["invoices"] = invoice_results[:limit]
-        
-        total = len(results["clients"]) + len(results["invoices"])
+        total = sum(len(results[key]) for key, _ in SEARCH_TYPES.values())
         
         return {
             "success": True,
             "query": q,
             "results": results,
-            "total": total
+            "total": total,
+            "partial": [SHEET_TYPES[sheet_name] for sheet_name in timed_out]
         }
-        
+    
     except Exception as e:
         logger.error(f"Search error: {e}")
         return {
             "success": False,
             "query": q,
-            "results": {
-                "clients": [],
-                "invoices": []
-            },
+            "results": results,
             "total": 0,
             "error": str(e)
         }
+
+
+@router.get("/suggest")
+async def suggest(
+    q: str = Query(..., min_length=1, description="Typed prefix"),
+    type: Optional[str] = Query(
+        None,
+        description="Filter by type: 'client', 'invoice', 'ticket', or 'all'"
+    ),
+    limit: int = Query(8, ge=1, le=20, description="Maximum suggestions to return"),
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Typeahead completions for a prefix.
+    
+    Completes client names and IDs, invoice IDs and ticket IDs from a
+    sorted prefix index, so it is cheap enough to call on every
+    keystroke. Values matching from their start come first (an exact
+    value is always first), then values with a later word matching
+    ("corp" suggests "Acme Corp").
+    
+    Query parameters:
+    - q: Typed prefix (required)
+    - type: Filter by 'client', 'invoice', 'ticket', or 'all' (optional)
+    - limit: Max suggestions (optional, default: 8)
+    
+    Returns:
+    {
+        "query": "acm",
+        "suggestions": [{"type": "client", "id": "CLT001", "name": "Acme Corp", ...}]
+    }
+    with suggestions in the same shape as search hits.
+    """
+    suggest_types = {SHEET_TYPES[sheet_name] for sheet_name in SUGGEST_FIELDS}
+    if type is not None and type != "all" and type not in suggest_types:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"type must be one of: {', '.join(sorted(suggest_types))}, all"
+        )
+    
+    sheet_names = [
+        sheet_name for sheet_name in SUGGEST_FIELDS
+        if type is None or type == "all" or type == SHEET_TYPES[sheet_name]
+    ]
+    try:
+        completions = await run_in_threadpool(search_index.suggest, q, limit, sheet_names)
+        suggestions = [
+            SEARCH_TYPES[SHEET_TYPES[sheet_name]][1](row)
+            for sheet_name, row in completions
+        ]
+        return {
+            "success": True,
+            "query": q,
+            "suggestions": suggestions
+        }
+    
+    except Exception as e:
+        logger.error(f"Suggest error: {e}")
+        return {
+            "success": False,
+            "query": q,
+            "suggestions": [],
+            "error": str(e)
+        }
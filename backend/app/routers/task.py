@@ -6,7 +6,8 @@ from typing import List, Optional
 from app.core.dependencies import verify_api_key
 from app.services.sheets_service import SheetsService
 from app.services.task_service import TaskService
-from app.models.task import Task, TaskCreate, TaskUpdate, TaskStatusUpdate
+from app.services.activity_service import ActivityService
+from app.models.task import Task, TaskCreate, TaskUpdate, TaskStatusUpdate, TaskBulkUpdate
 from app.core.config import settings
 import logging
 
@@ -20,6 +21,7 @@ sheets_service = SheetsService(
     spreadsheet_id=settings.spreadsheet_id
 )
 task_service = TaskService(sheets_service)
+activity_service = ActivityService(sheets_service)
 
 
 @router.get("", response_model=List[Task])
@@ -41,6 +43,47 @@ async def list_tasks(
         )
 
 
+@router.patch("/bulk", response_model=dict)
+async def bulk_update_tasks(
+    bulk_update: TaskBulkUpdate,
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Update many tasks in one call (one sheet read, one batched write).
+    """
+    try:
+        results = task_service.bulk_update_tasks(bulk_update.updates)
+        
+        updated_ids = [r["task_id"] for r in results if r["success"]]
+        failed = len(results) - len(updated_ids)
+        
+        # Log one activity for the whole batch
+        if updated_ids:
+            activity_service.log_bulk_activity(
+                type="tasks_bulk_updated",
+                title="Tasks Updated",
+                entity_type="task",
+                entity_ids=updated_ids
+            )
+        
+        logger.info(f"Bulk updated {len(updated_ids)} tasks ({failed} failed)")
+        return {
+            "success": failed == 0,
+            "message": f"Updated {len(updated_ids)} tasks, {failed} failed",
+            "data": {
+                "results": results,
+                "updated": len(updated_ids),
+                "failed": failed
+            }
+        }
+    except Exception as e:
+        logger.error(f"Error bulk updating tasks: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to update tasks: {str(e)}"
+        )
+
+
 @router.get("/{task_id}", response_model=Task)
 async def get_task(
     task_id: str,
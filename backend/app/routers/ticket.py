@@ -2,15 +2,17 @@
 API Router for Support Tickets.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
 from typing import List, Optional
-from app.schemas.ticket import Ticket, TicketCreate, TicketUpdate
-from app.services.ticket_service import TicketService
+from app.schemas.ticket import Ticket, TicketCreate, TicketUpdate, TicketBulkUpdate
+from app.services.ticket_service import TicketService, TICKET_STATUSES
+from app.services.ticket_table import TicketTable
 from app.services.sheets_service import SheetsService
 from app.services.activity_service import ActivityService
 from app.schemas.activity import ActivityLogCreate
 from app.core.config import settings
 from app.core.dependencies import verify_api_key
+from app.core.etag import make_etag, etag_matches, not_modified
 import logging
 
 logger = logging.getLogger(__name__)
@@ -26,7 +28,8 @@ sheets_service = SheetsService(
     credentials_path=settings.google_sheets_credentials_path,
     spreadsheet_id=settings.spreadsheet_id
 )
-ticket_service = TicketService(sheets_service)
+ticket_table = TicketTable(sheets_service, ttl_seconds=settings.ticket_table_ttl_seconds)
+ticket_service = TicketService(sheets_service, ticket_table)
 activity_service = ActivityService(sheets_service)
 
 
@@ -63,36 +66,65 @@ async def create_ticket(ticket_data: TicketCreate):
 
 @router.get("", response_model=dict)
 async def list_tickets(
+    request: Request,
+    response: Response,
     status: Optional[str] = Query(None, description="Filter by status"),
     priority: Optional[str] = Query(None, description="Filter by priority"),
     client_id: Optional[str] = Query(None, description="Filter by client ID"),
-    limit: Optional[int] = Query(50, ge=1, le=500, description="Max tickets to return")
+    assigned_to: Optional[str] = Query(None, description="Filter by assignee"),
+    sort: Optional[str] = Query(None, pattern="^created_date$", description="Sort field"),
+    order: str = Query("asc", pattern="^(asc|desc)$", description="Sort order"),
+    limit: Optional[int] = Query(50, ge=1, le=500, description="Max tickets to return"),
+    offset: int = Query(0, ge=0, description="Number of tickets to skip")
 ):
     """
-    List all tickets with optional filters.
+    List tickets with optional filters, sorting and pagination.
     
     Query params:
     - status: Filter by status (open, in_progress, resolved, closed)
     - priority: Filter by priority (low, medium, high, critical)
     - client_id: Filter by client ID
+    - assigned_to: Filter by assignee
+    - sort: created_date (default: sheet order)
+    - order: asc or desc (default asc)
     - limit: Maximum number of tickets (default 50)
+    - offset: Pagination offset (default 0)
+    
+    Filters and sorting use the cached ticket table's indexes, so only
+    matching tickets are visited. `total` counts all matching tickets.
+    Supports If-None-Match; unchanged lists return 304.
     """
     try:
-        logger.info(f"Fetching tickets with filters: status={status}, priority={priority}, client_id={client_id}")
-        tickets = ticket_service.list_tickets(
+        ticket_table.ensure_loaded()
+        etag = make_etag(request, ticket_table.version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
+        logger.info(
+            f"Fetching tickets with filters: status={status}, priority={priority}, "
+            f"client_id={client_id}, assigned_to={assigned_to}"
+        )
+        tickets, total = ticket_service.list_tickets(
             status=status,
             priority=priority,
             client_id=client_id,
-            limit=limit
+            limit=limit,
+            assigned_to=assigned_to,
+            offset=offset,
+            sort=sort,
+            descending=order == "desc"
         )
         
+        response.headers["ETag"] = etag
+        
         return {
             "success": True,
             "message": f"Retrieved {len(tickets)} tickets",
             "data": {
                 "tickets": [ticket.dict() for ticket in tickets],
-                "total": len(tickets),
-                "limit": limit
+                "total": total,
+                "limit": limit,
+                "offset": offset
             }
         }
     except Exception as e:
@@ -100,6 +132,45 @@ async def list_tickets(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.patch("/bulk", response_model=dict)
+async def bulk_update_tickets(bulk_update: TicketBulkUpdate):
+    """
+    Update many tickets in one call.
+    
+    Each entry carries a ticket_id plus the fields to change. All tickets are
+    resolved with one sheet read and written with one batched update.
+    Returns a result per ticket.
+    """
+    try:
+        logger.info(f"Bulk updating {len(bulk_update.updates)} tickets")
+        results = ticket_service.bulk_update_tickets(bulk_update.updates)
+        
+        updated_ids = [r["ticket_id"] for r in results if r["success"]]
+        failed = len(results) - len(updated_ids)
+        
+        # Log one activity for the whole batch
+        if updated_ids:
+            activity_service.log_bulk_activity(
+                type="tickets_bulk_updated",
+                title="Support Tickets Updated",
+                entity_type="ticket",
+                entity_ids=updated_ids
+            )
+        
+        return {
+            "success": failed == 0,
+            "message": f"Updated {len(updated_ids)} tickets, {failed} failed",
+            "data": {
+                "results": results,
+                "updated": len(updated_ids),
+                "failed": failed
+            }
+        }
+    except Exception as e:
+        logger.error(f"Error bulk updating tickets: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/{ticket_id}", response_model=dict)
 async def get_ticket(ticket_id: str):
     """
@@ -133,12 +204,9 @@ async def update_ticket(ticket_id: str, updates: TicketUpdate):
     try:
         logger.info(f"Updating ticket: {ticket_id}")
         
-        # Check if ticket exists
-        existing = ticket_service.get_ticket(ticket_id)
-        if not existing:
-            raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
-        
         updated_ticket = ticket_service.update_ticket(ticket_id, updates)
+        if not updated_ticket:
+            raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
         
         return {
             "success": True,
@@ -165,19 +233,15 @@ async def update_ticket_status(ticket_id: str, status: str = Query(..., descript
         logger.info(f"Updating ticket {ticket_id} status to {status}")
         
         # Validate status
-        valid_statuses = ["open", "in_progress", "resolved", "closed"]
-        if status not in valid_statuses:
+        if status not in TICKET_STATUSES:
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
+                detail=f"Invalid status. Must be one of: {', '.join(TICKET_STATUSES)}"
             )
         
-        # Check if ticket exists
-        existing = ticket_service.get_ticket(ticket_id)
-        if not existing:
-            raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
-        
         updated_ticket = ticket_service.update_status(ticket_id, status)
+        if not updated_ticket:
+            raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
         
         return {
             "success": True,
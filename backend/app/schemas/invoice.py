@@ -8,6 +8,8 @@ from typing import List, Optional
 from datetime import date, datetime
 from decimal import Decimal
 
+from app.core.serialization import RowSerializer, to_date, to_datetime, to_decimal_str
+
 
 class InvoiceItemCreate(BaseModel):
     """Schema for creating an invoice item."""
@@ -16,7 +18,7 @@ class InvoiceItemCreate(BaseModel):
     quantity: int = Field(..., gt=0)
     unit_price: Decimal = Field(..., ge=0)
     tax_percent: Decimal = Field(..., ge=0, le=100)
-    discount_percent: Decimal = Field(default=0, ge=0, le=100)
+    discount_percent: Decimal = Field(default=Decimal(0), ge=0, le=100)
     
     class Config:
         json_schema_extra = {
@@ -125,8 +127,71 @@ class InvoiceStatusUpdate(BaseModel):
         }
 
 
+class InvoiceBulkStatusItem(InvoiceStatusUpdate):
+    """Status change for one invoice in a bulk update."""
+    invoice_id: str = Field(..., min_length=1)
+
+
+class InvoiceBulkStatusUpdate(BaseModel):
+    """Schema for updating the status of many invoices at once."""
+    updates: List[InvoiceBulkStatusItem] = Field(..., min_items=1, max_items=1000)
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "updates": [
+                    {"invoice_id": "INV-2026-001", "status": "paid"},
+                    {"invoice_id": "INV-2026-002", "status": "paid"}
+                ]
+            }
+        }
+
+
+class InvoiceImportRecord(InvoiceCreate):
+    """Schema for one invoice in a bulk import (historical invoices may carry a status)."""
+    status: str = Field(default="draft", pattern="^(draft|pending|paid|overdue)$")
+
+
+class InvoiceImportError(BaseModel):
+    """Per-record error reported by a bulk import."""
+    line: int
+    invoice_id: Optional[str] = None
+    error: str
+
+
+class InvoiceImportResult(BaseModel):
+    """Summary of a bulk invoice import."""
+    imported: int
+    failed: int
+    items_imported: int
+    invoice_ids: List[str]
+    errors: List[InvoiceImportError]
+    elapsed_seconds: float
+    invoices_per_minute: float
+
+
 class ApiResponse(BaseModel):
     """Standard API response wrapper."""
     success: bool
     message: str
     data: Optional[dict] = None
+
+
+# Fast-path serializer with the same fields and encoding as InvoiceResponse (list view, no items)
+INVOICE_SUMMARY_SERIALIZER = RowSerializer(
+    fields=[
+        ("invoice_id", "invoice_id", None, ""),
+        ("client_id", "client_id", None, ""),
+        ("client_name", "client_name", None, ""),
+        ("invoice_date", "invoice_date", to_date, ""),
+        ("due_date", "due_date", to_date, ""),
+        ("subtotal", "subtotal", to_decimal_str, 0),
+        ("total_tax", "total_tax", to_decimal_str, 0),
+        ("total_discount", "total_discount", to_decimal_str, 0),
+        ("grand_total", "grand_total", to_decimal_str, 0),
+        ("status", "status", None, "draft"),
+        ("sales_person", "sales_person", None, ""),
+        ("created_at", "created_at", to_datetime, ""),
+    ],
+    constants={"items": []}
+)
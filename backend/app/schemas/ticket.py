@@ -3,7 +3,7 @@ Pydantic schemas for Support Tickets.
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import date
 
 
@@ -28,6 +28,16 @@ class TicketUpdate(BaseModel):
     status: Optional[str] = None
 
 
+class TicketBulkUpdateItem(TicketUpdate):
+    """Changes for one ticket in a bulk update."""
+    ticket_id: str = Field(..., min_length=1)
+
+
+class TicketBulkUpdate(BaseModel):
+    """Schema for updating many tickets at once."""
+    updates: List[TicketBulkUpdateItem] = Field(..., min_items=1, max_items=1000)
+
+
 class Ticket(BaseModel):
     """Complete ticket model."""
     ticket_id: str
@@ -49,6 +49,28 @@ class ActivityService:
                 status="error"
             )
 
+    def log_bulk_activity(
+        self,
+        type: str,
+        title: str,
+        entity_type: str,
+        entity_ids: List[str],
+        user: str = "System"
+    ) -> ActivityLog:
+        """
+        Log one consolidated activity for a bulk operation.
+        """
+        shown = ", ".join(entity_ids[:10])
+        more = f" and {len(entity_ids) - 10} more" if len(entity_ids) > 10 else ""
+        
+        return self.log_activity(ActivityLogCreate(
+            type=type,
+            title=title,
+            description=f"Updated {len(entity_ids)} {entity_type}s: {shown}{more}",
+            entity_type=entity_type,
+            user=user
+        ))
+
     def get_recent_activities(self, limit: int = 20) -> List[ActivityLog]:
         """
         Get recent activities, sorted by timestamp descending.
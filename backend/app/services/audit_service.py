@@ -0,0 +1,205 @@
+"""
+Invoice Audit Service - Integrity checks between Invoices and Invoice_Items.
+Loads both tabs as columns and recomputes line and header totals with
+vectorized NumPy group-bys.
+"""
+
+from typing import Dict, List
+import logging
+import time
+
+import numpy as np
+
+from app.services.sheets_service import SheetsService
+
+logger = logging.getLogger(__name__)
+
+INVOICE_AUDIT_COLUMNS = [
+    "invoice_id", "subtotal", "total_tax", "total_discount", "grand_total"
+]
+ITEM_AUDIT_COLUMNS = [
+    "item_id", "invoice_id", "quantity", "unit_price",
+    "tax_percent", "discount_percent", "line_total"
+]
+
+
+def _to_float_array(values: List[str]) -> np.ndarray:
+    """
+    Parse a column of stored numbers; blanks and bad cells become NaN.
+
+    Converts the whole column in one call, falling back to per-cell
+    parsing only when the column contains blank or unparsable cells.
+    """
+    try:
+        return np.array(values, dtype=np.float64)
+    except (ValueError, TypeError):
+        parsed = np.empty(len(values), dtype=np.float64)
+        for i, value in enumerate(values):
+            try:
+                parsed[i] = float(value)
+            except (ValueError, TypeError):
+                parsed[i] = np.nan
+        return parsed
+
+
+class InvoiceAuditService:
+    """Service for auditing stored invoice totals."""
+
+    def __init__(self, sheets_service: SheetsService):
+        """
+        Initialize audit service.
+
+        Args:
+            sheets_service: Google Sheets service instance
+        """
+        self.sheets = sheets_service
+
+    def _drop_blank_rows(self, columns: Dict[str, List[str]], key: str) -> Dict[str, List[str]]:
+        """Remove rows whose key column is empty."""
+        keep = [i for i, value in enumerate(columns[key]) if value]
+        if len(keep) == len(columns[key]):
+            return columns
+        return {name: [values[i] for i in keep] for name, values in columns.items()}
+
+    def audit(self, tolerance: float = 0.01, max_results: int = 1000) -> Dict:
+        """
+        Recompute every line and header total and report discrepancies.
+
+        Checks:
+            - line_total vs quantity * unit_price with tax and discount
+            - subtotal / total_tax / total_discount vs the sum of the items
+            - grand_total vs recomputed subtotal + tax - discount
+            - items whose invoice_id has no invoice (orphans)
+            - invoices without items and unparsable amounts
+
+        Args:
+            tolerance: Allowed absolute difference per amount
+            max_results: Cap on listed entries per finding type
+
+        Returns:
+            Audit report with counts and (capped) details
+        """
+        started = time.perf_counter()
+
+        invoices = self.sheets.get_columns("Invoices", INVOICE_AUDIT_COLUMNS)
+        items = self.sheets.get_columns("Invoice_Items", ITEM_AUDIT_COLUMNS)
+        load_seconds = time.perf_counter() - started
+
+        # Skip blank rows left behind by manual edits
+        invoices = self._drop_blank_rows(invoices, "invoice_id")
+        items = self._drop_blank_rows(items, "item_id")
+
+        invoice_ids = np.asarray(invoices["invoice_id"], dtype=object)
+        item_invoice_ids = np.asarray(items["invoice_id"], dtype=object)
+        item_ids = np.asarray(items["item_id"], dtype=object)
+
+        # Line level: recompute each line total
+        quantity = _to_float_array(items["quantity"])
+        unit_price = _to_float_array(items["unit_price"])
+        tax_percent = _to_float_array(items["tax_percent"])
+        discount_percent = _to_float_array(items["discount_percent"])
+        stored_line_total = _to_float_array(items["line_total"])
+
+        line_subtotal = quantity * unit_price
+        line_tax = line_subtotal * tax_percent / 100
+        line_discount = line_subtotal * discount_percent / 100
+        line_total = line_subtotal + line_tax - line_discount
+
+        bad_items = np.isnan(line_total) | np.isnan(stored_line_total)
+        line_mismatch = ~bad_items & (np.abs(line_total - stored_line_total) > tolerance)
+
+        # Map each item to its invoice row (-1 when the invoice is missing)
+        n_invoices = len(invoice_ids)
+        row_of = {invoice_id: i for i, invoice_id in enumerate(invoices["invoice_id"])}
+        invoice_index = np.fromiter(
+            (row_of.get(invoice_id, -1) for invoice_id in items["invoice_id"]),
+            dtype=np.int64,
+            count=len(item_ids)
+        )
+        matched = invoice_index >= 0
+        orphaned = ~matched
+
+        # Header level: group-by invoice over matched, parsable items
+        use = matched & ~bad_items
+        group = invoice_index[use]
+        sum_subtotal = np.bincount(group, weights=line_subtotal[use], minlength=n_invoices)
+        sum_tax = np.bincount(group, weights=line_tax[use], minlength=n_invoices)
+        sum_discount = np.bincount(group, weights=line_discount[use], minlength=n_invoices)
+        item_count = np.bincount(invoice_index[matched], minlength=n_invoices)
+        sum_grand = sum_subtotal + sum_tax - sum_discount
+
+        header_fields = {
+            "subtotal": sum_subtotal,
+            "total_tax": sum_tax,
+            "total_discount": sum_discount,
+            "grand_total": sum_grand,
+        }
+        has_items = item_count > 0
+
+        header_mismatches = []
+        header_mismatch_count = 0
+        mismatched_invoices = np.zeros(n_invoices, dtype=bool)
+        unparsable_invoices = np.zeros(n_invoices, dtype=bool)
+        for field, computed in header_fields.items():
+            stored = _to_float_array(invoices[field])
+            unparsable_invoices |= np.isnan(stored)
+            diff = stored - computed
+            mismatch = has_items & ~np.isnan(stored) & (np.abs(diff) > tolerance)
+            mismatched_invoices |= mismatch
+            header_mismatch_count += int(mismatch.sum())
+            remaining = max_results - len(header_mismatches)
+            for i in np.flatnonzero(mismatch)[:max(remaining, 0)]:
+                header_mismatches.append({
+                    "invoice_id": invoice_ids[i],
+                    "field": field,
+                    "stored": float(stored[i]),
+                    "computed": round(float(computed[i]), 2),
+                    "difference": round(float(diff[i]), 2),
+                })
+
+        line_mismatches = [
+            {
+                "item_id": item_ids[i],
+                "invoice_id": item_invoice_ids[i],
+                "stored": float(stored_line_total[i]),
+                "computed": round(float(line_total[i]), 2),
+                "difference": round(float(stored_line_total[i] - line_total[i]), 2),
+            }
+            for i in np.flatnonzero(line_mismatch)[:max_results]
+        ]
+
+        unique_ids, id_counts = np.unique(invoice_ids.astype(str), return_counts=True)
+        duplicate_ids = unique_ids[id_counts > 1]
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Audited {n_invoices} invoices / {len(item_ids)} items in {elapsed:.2f}s"
+        )
+
+        return {
+            "invoices_checked": n_invoices,
+            "items_checked": int(len(item_ids)),
+            "summary": {
+                "invoices_with_mismatches": int(mismatched_invoices.sum()),
+                "header_mismatches": header_mismatch_count,
+                "line_mismatches": int(line_mismatch.sum()),
+                "orphaned_items": int(orphaned.sum()),
+                "invoices_without_items": int((~has_items).sum()),
+                "unparsable_items": int(bad_items.sum()),
+                "unparsable_invoices": int(unparsable_invoices.sum()),
+                "duplicate_invoice_ids": int(len(duplicate_ids)),
+            },
+            "header_mismatches": header_mismatches,
+            "line_mismatches": line_mismatches,
+            "orphaned_items": [
+                {"item_id": item_ids[i], "invoice_id": item_invoice_ids[i]}
+                for i in np.flatnonzero(orphaned)[:max_results]
+            ],
+            "invoices_without_items": [
+                invoice_ids[i] for i in np.flatnonzero(~has_items)[:max_results]
+            ],
+            "duplicate_invoice_ids": duplicate_ids[:max_results].tolist(),
+            "tolerance": tolerance,
+            "load_seconds": round(load_seconds, 3),
+            "elapsed_seconds": round(elapsed, 3),
+        }
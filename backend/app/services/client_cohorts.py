@@ -0,0 +1,303 @@
+"""
+Client Cohorts - New-client growth, activation and retention analytics.
+Clients are indexed by creation date and joined to their invoice days
+(kept from the revenue rollups), so range counts are binary searches and
+cohort curves come from precomputed per-month tables.
+"""
+
+from typing import Dict, List, Optional
+from datetime import date
+import bisect
+import logging
+
+from app.services.sheets_service import SheetsService, RowChange, add_row_listener
+from app.services.revenue_rollup import CellKey, RevenueRollupStore, RollupCell, parse_date
+
+logger = logging.getLogger(__name__)
+
+# Client creation date columns, in order of preference
+CLIENT_CREATED_FIELDS = ("created_date", "joined_date", "created_at")
+
+
+def month_index(day: date) -> int:
+    """Months since year 0, so month offsets are subtractions."""
+    return day.year * 12 + day.month - 1
+
+
+def month_label(index: int) -> str:
+    """YYYY-MM for a month index."""
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+class CohortRow:
+    """Precomputed curves of one creation-month cohort."""
+
+    __slots__ = ("size", "activated", "activation", "retention", "days_to_first_invoice")
+
+    def __init__(self):
+        self.size = 0
+        self.activated = 0
+        # activation[k]: clients whose first invoice is k months after creation
+        self.activation: List[int] = []
+        # retention[k]: activated clients with invoices k months after their first
+        self.retention: List[int] = []
+        self.days_to_first_invoice = 0
+
+
+def _bump(counts: List[int], offset: int) -> None:
+    if offset >= len(counts):
+        counts.extend([0] * (offset + 1 - len(counts)))
+    counts[offset] += 1
+
+
+class ClientCohortStore:
+    """Client creation index joined to first-invoice and activity dates."""
+
+    def __init__(self, sheets_service: SheetsService, rollups: RevenueRollupStore):
+        """
+        Initialize cohort store over the Clients sheet and revenue rollups.
+
+        Clients are read when the rollups are (re)built and kept current
+        from client writes; invoice days follow rollup changes.
+
+        Args:
+            sheets_service: Google Sheets service instance
+            rollups: Rollup store supplying per-client invoice days
+        """
+        self.sheets = sheets_service
+        self.rollups = rollups
+        self._generation: Optional[int] = None
+
+        self.created: Dict[str, date] = {}
+        # Sorted creation dates, for range counts
+        self._created_days: List[date] = []
+        # client_id -> day -> invoices that day
+        self.invoice_days: Dict[str, Dict[date, int]] = {}
+
+        # Bumped on every change; cohort tables are rebuilt when it moves
+        self.version = 0
+        self._tables_version: Optional[int] = None
+        self._tables: Dict[int, CohortRow] = {}
+        self._table_months: List[int] = []
+
+        rollups.add_cell_listener(self._on_cell_change)
+        add_row_listener(self._on_row_change)
+
+    @staticmethod
+    def _created_date(client: Dict) -> Optional[date]:
+        for field in CLIENT_CREATED_FIELDS:
+            day = parse_date(client.get(field, ""))
+            if day:
+                return day
+        return None
+
+    def _add_client(self, client_id: str, created: Optional[date]) -> None:
+        old = self.created.pop(client_id, None)
+        if old is not None:
+            self._created_days.pop(bisect.bisect_left(self._created_days, old))
+        if created is not None:
+            self.created[client_id] = created
+            bisect.insort(self._created_days, created)
+
+    def _build(self) -> None:
+        """Index clients by creation date and invoices by client and day."""
+        self.created = {}
+        self._created_days = []
+        for client in self.sheets.get_all_rows("Clients"):
+            client_id = client.get("client_id")
+            if client_id:
+                self._add_client(client_id, self._created_date(client))
+
+        self.invoice_days = {}
+        for day, (status, client_id, sales_person), cell in self.rollups.iter_cells(dated_only=True):
+            if client_id:
+                days = self.invoice_days.setdefault(client_id, {})
+                days[day] = days.get(day, 0) + cell.count
+
+        self._generation = self.rollups.generation
+        self.version += 1
+        logger.info(
+            f"Indexed {len(self.created)} clients by creation date, "
+            f"{len(self.invoice_days)} with invoices"
+        )
+
+    def ensure_built(self) -> None:
+        """Build (or rebuild after a rollup rebuild) on first use."""
+        self.rollups.ensure_loaded()
+        with self.rollups.lock:
+            if self._generation != self.rollups.generation:
+                self._build()
+
+    def _on_cell_change(
+        self,
+        day: Optional[date],
+        key: CellKey,
+        cell: Optional[RollupCell],
+        delta: RollupCell
+    ) -> None:
+        """Track invoice days per client from rollup changes."""
+        client_id = key[1]
+        if self._generation != self.rollups.generation or day is None or not client_id:
+            return
+
+        days = self.invoice_days.setdefault(client_id, {})
+        had_day = day in days
+        count = days.get(day, 0) + delta.count
+        if count > 0:
+            days[day] = count
+        else:
+            days.pop(day, None)
+            if not days:
+                del self.invoice_days[client_id]
+        # Cohort tables only depend on which days a client invoiced
+        if had_day != (count > 0):
+            self.version += 1
+
+    def _on_row_change(self, sheet_name: str, changes: List[RowChange]) -> None:
+        """
+        Index clients created or edited through the app.
+
+        Only ID and creation date changes move the version; other client
+        writes (e.g. invoice totals) leave cohorts and dashboard caches alone.
+        """
+        if sheet_name != "Clients":
+            return
+        # Same lock as the rollups: dashboards read both together
+        with self.rollups.lock:
+            if self._generation is None:
+                return
+            changed = False
+            for before, after in changes:
+                if before and before.get("client_id") and (
+                    after is None or after.get("client_id") != before.get("client_id")
+                ) and before["client_id"] in self.created:
+                    self._add_client(before["client_id"], None)
+                    changed = True
+                if after and after.get("client_id"):
+                    created = self._created_date(after)
+                    if self.created.get(after["client_id"]) != created:
+                        self._add_client(after["client_id"], created)
+                        changed = True
+            if changed:
+                self.version += 1
+
+    def _ensure_tables(self) -> None:
+        """Rebuild the per-month cohort tables after changes."""
+        self.ensure_built()
+        if self._tables_version == self.version:
+            return
+
+        today = month_index(date.today())
+        tables: Dict[int, CohortRow] = {}
+        for client_id, created in self.created.items():
+            row = tables.get(month_index(created))
+            if row is None:
+                row = tables[month_index(created)] = CohortRow()
+            row.size += 1
+
+            days = self.invoice_days.get(client_id)
+            if not days:
+                continue
+            # Invoices dated before the client record count from creation
+            first = min(days)
+            row.activated += 1
+            row.days_to_first_invoice += max((first - created).days, 0)
+            _bump(row.activation, max(month_index(first) - month_index(created), 0))
+
+            first_month = month_index(first)
+            for month in {month_index(day) for day in days}:
+                if first_month <= month <= today:
+                    _bump(row.retention, month - first_month)
+
+        self._tables = tables
+        self._table_months = sorted(tables)
+        self._tables_version = self.version
+
+    def new_clients(self, start: Optional[date] = None, end: Optional[date] = None) -> int:
+        """
+        Clients created within [start, end] (two binary searches).
+
+        Args:
+            start: First day (inclusive), None for unbounded
+            end: Last day (inclusive), None for unbounded
+
+        Returns:
+            Number of clients
+        """
+        self.ensure_built()
+        lo = bisect.bisect_left(self._created_days, start) if start else 0
+        hi = bisect.bisect_right(self._created_days, end) if end else len(self._created_days)
+        return max(hi - lo, 0)
+
+    def get_cohorts(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        months: int = 12
+    ) -> Dict:
+        """
+        Activation and retention curves per creation-month cohort.
+
+        Cohorts are whole months overlapping [start, end]; the summary's
+        new_clients counts exact creation days.
+
+        Args:
+            start: First creation day (inclusive), None for unbounded
+            end: Last creation day (inclusive), None for unbounded
+            months: Curve length in months
+
+        Returns:
+            {"summary": {...}, "cohorts": [{cohort, clients, activated,
+            activation_rate, activation_curve, retention_curve}]}
+            with curves as cumulative activation % and retention % by
+            month offset
+        """
+        self._ensure_tables()
+        today = month_index(date.today())
+
+        lo = bisect.bisect_left(self._table_months, month_index(start)) if start else 0
+        hi = (
+            bisect.bisect_right(self._table_months, month_index(end))
+            if end else len(self._table_months)
+        )
+
+        cohorts = []
+        size = activated = days_to_first = 0
+        for month in self._table_months[lo:hi]:
+            row = self._tables[month]
+            size += row.size
+            activated += row.activated
+            days_to_first += row.days_to_first_invoice
+
+            # Only offsets that have already happened
+            span = min(months, today - month + 1)
+            activation_curve = []
+            running = 0
+            for offset in range(span):
+                running += row.activation[offset] if offset < len(row.activation) else 0
+                activation_curve.append(round(running / row.size * 100, 2))
+            retention_curve = [
+                round(row.retention[offset] / row.activated * 100, 2)
+                if row.activated and offset < len(row.retention) else 0
+                for offset in range(span)
+            ]
+
+            cohorts.append({
+                "cohort": month_label(month),
+                "clients": row.size,
+                "activated": row.activated,
+                "activation_rate": round(row.activated / row.size * 100, 2),
+                "activation_curve": activation_curve,
+                "retention_curve": retention_curve,
+            })
+
+        return {
+            "summary": {
+                "new_clients": self.new_clients(start, end) if (start or end) else len(self.created),
+                "cohort_clients": size,
+                "activated": activated,
+                "activation_rate": round(activated / size * 100, 2) if size else 0,
+                "avg_days_to_first_invoice": round(days_to_first / activated, 1) if activated else 0,
+            },
+            "cohorts": cohorts,
+        }
@@ -0,0 +1,185 @@
+"""
+Client Totals Service - Keeps Clients.total_invoices / total_revenue current.
+Applies per-client deltas from invoice writes instead of re-aggregating
+the Invoices sheet, with a full rebuild to correct drift.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from decimal import Decimal, InvalidOperation
+import logging
+
+from app.services.sheets_service import SheetsService, RowChange, add_row_listener
+
+logger = logging.getLogger(__name__)
+
+# Invoice statuses that count towards a client's revenue
+REVENUE_STATUSES = {"paid"}
+
+CENT = Decimal("0.01")
+
+
+def _parse_int(value) -> int:
+    try:
+        return int(value) if value else 0
+    except (ValueError, TypeError):
+        return 0
+
+
+def _parse_decimal(value) -> Decimal:
+    try:
+        return Decimal(str(value)) if value else Decimal(0)
+    except (InvalidOperation, ValueError, TypeError):
+        return Decimal(0)
+
+
+class ClientTotalsService:
+    """Incrementally maintained per-client invoice aggregates."""
+
+    def __init__(self, sheets_service: SheetsService):
+        """
+        Initialize totals service and subscribe to invoice writes.
+
+        Args:
+            sheets_service: Google Sheets service instance
+        """
+        self.sheets = sheets_service
+        add_row_listener(self._on_row_change)
+
+    def _contribution(self, invoice: Optional[Dict]) -> Optional[Tuple[str, int, Decimal]]:
+        """What one invoice row adds to its client's totals."""
+        if not invoice or not invoice.get("invoice_id") or not invoice.get("client_id"):
+            return None
+
+        revenue = Decimal(0)
+        if invoice.get("status", "").lower() in REVENUE_STATUSES:
+            revenue = _parse_decimal(invoice.get("grand_total"))
+
+        return invoice["client_id"], 1, revenue
+
+    def _on_row_change(self, sheet_name: str, changes: List[RowChange]) -> None:
+        """Turn invoice row changes into per-client deltas and apply them."""
+        if sheet_name != "Invoices":
+            return
+
+        deltas: Dict[str, List] = defaultdict(lambda: [0, Decimal(0)])
+        for before, after in changes:
+            removed = self._contribution(before)
+            if removed:
+                client_id, count, revenue = removed
+                deltas[client_id][0] -= count
+                deltas[client_id][1] -= revenue
+
+            added = self._contribution(after)
+            if added:
+                client_id, count, revenue = added
+                deltas[client_id][0] += count
+                deltas[client_id][1] += revenue
+
+        deltas = {
+            client_id: (count, revenue)
+            for client_id, (count, revenue) in deltas.items()
+            if count or revenue
+        }
+        if deltas:
+            self.apply_deltas(deltas)
+
+    def apply_deltas(self, deltas: Dict[str, Tuple[int, Decimal]]) -> None:
+        """
+        Add count / revenue deltas to client rows in one batched write.
+
+        Args:
+            deltas: Map of client_id to (invoice count delta, revenue delta)
+        """
+        def add_delta(count: int, revenue: Decimal):
+            def patch(row: Dict) -> Dict:
+                total_invoices = max(_parse_int(row.get("total_invoices")) + count, 0)
+                total_revenue = _parse_decimal(row.get("total_revenue")) + revenue
+                return {
+                    "total_invoices": str(total_invoices),
+                    "total_revenue": str(total_revenue.quantize(CENT))
+                }
+            return patch
+
+        rows = self.sheets.batch_update_rows(
+            "Clients",
+            "client_id",
+            {
+                client_id: add_delta(count, revenue)
+                for client_id, (count, revenue) in deltas.items()
+            }
+        )
+
+        missing = [client_id for client_id, row in rows.items() if row is None]
+        if missing:
+            logger.warning(f"Client totals not updated for unknown clients: {missing}")
+        logger.info(f"Applied invoice totals to {len(rows) - len(missing)} clients")
+
+    def rebuild(self) -> Dict:
+        """
+        Recompute every client's totals from the Invoices sheet.
+
+        Only rows whose stored totals differ are rewritten.
+
+        Returns:
+            Summary with clients checked / corrected and the corrections
+        """
+        totals: Dict[str, List] = defaultdict(lambda: [0, Decimal(0)])
+        for invoice in self.sheets.get_all_rows("Invoices"):
+            contribution = self._contribution(invoice)
+            if contribution:
+                client_id, count, revenue = contribution
+                totals[client_id][0] += count
+                totals[client_id][1] += revenue
+
+        client_ids = [
+            row["client_id"]
+            for row in self.sheets.get_all_rows("Clients")
+            if row.get("client_id")
+        ]
+
+        corrections = []
+
+        def set_totals(client_id: str):
+            count, revenue = totals.get(client_id, (0, Decimal(0)))
+            # Compare against what would be written, not the raw sum
+            revenue = revenue.quantize(CENT)
+            expected = {
+                "total_invoices": str(count),
+                "total_revenue": str(revenue)
+            }
+
+            def patch(row: Dict) -> Optional[Dict]:
+                if (
+                    _parse_int(row.get("total_invoices")) == count
+                    and _parse_decimal(row.get("total_revenue")) == revenue
+                ):
+                    return None
+                corrections.append({
+                    "client_id": client_id,
+                    "stored": {
+                        "total_invoices": row.get("total_invoices", ""),
+                        "total_revenue": row.get("total_revenue", "")
+                    },
+                    "rebuilt": expected
+                })
+                return expected
+            return patch
+
+        self.sheets.batch_update_rows(
+            "Clients",
+            "client_id",
+            {client_id: set_totals(client_id) for client_id in client_ids}
+        )
+
+        unknown = sorted(set(totals) - set(client_ids))
+        logger.info(
+            f"Rebuilt totals for {len(client_ids)} clients, corrected {len(corrections)}"
+        )
+
+        return {
+            "clients_checked": len(client_ids),
+            "clients_corrected": len(corrections),
+            "corrections": corrections,
+            "unknown_client_ids": unknown
+        }
@@ -0,0 +1,308 @@
+"""
+Columnar Dashboard Engine - NumPy aggregation over revenue rollups.
+Holds rollup cells as columns (datetime64 days, categorical codes,
+fixed-point int64 amounts) so range filters and group-bys run as
+vector operations. Results are exact: amounts never go through floats.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from datetime import date
+from decimal import Decimal
+import logging
+
+import numpy as np
+
+from app.services.revenue_rollup import CellKey, RevenueRollupStore, RollupCell
+from app.services.dashboard_service import DashboardAggregates
+
+logger = logging.getLogger(__name__)
+
+# Decimal places held by the fixed-point columns (grows up to MAX_SCALE)
+DEFAULT_SCALE = 2
+MAX_SCALE = 6
+# Keep every int64 sum exact
+MAX_ABS_TOTAL = 2 ** 62
+
+AMOUNT_FIELDS = ("grand_total", "total_tax", "total_discount")
+
+# Sort rank of cells without a date (after every real day)
+UNDATED_RANK = 2 ** 30
+NO_RANK = np.iinfo(np.int64).max
+
+
+class _NeedsRescale(Exception):
+    """An amount has more decimal places than the current scale."""
+
+
+class _Categories:
+    """Append-only string -> code mapping."""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.labels: List[str] = []
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.labels)
+            self.labels.append(value)
+        return code
+
+
+class ColumnarEngine:
+    """Vectorized equivalent of DashboardService's Decimal aggregation."""
+
+    def __init__(self, rollups: RevenueRollupStore):
+        """
+        Initialize engine over a rollup store.
+
+        Columns are built from the rollups on first use, patched in place
+        on every incremental rollup change and rebuilt after a full
+        rollup rebuild.
+
+        Args:
+            rollups: Rollup store to mirror as columns
+        """
+        self.rollups = rollups
+        self.scale = DEFAULT_SCALE
+        self.exact = False
+        self._generation: Optional[int] = None
+        rollups.add_cell_listener(self._on_cell_change)
+
+    def _allocate(self, capacity: int) -> None:
+        """Create empty columns."""
+        self.size = 0
+        self.days = np.empty(capacity, dtype="datetime64[D]")
+        # Order of cells as the Decimal path visits them: (day, insertion)
+        self.ranks = np.empty(capacity, dtype=np.int64)
+        self.counts = np.zeros(capacity, dtype=np.int64)
+        self.amounts = {field: np.zeros(capacity, dtype=np.int64) for field in AMOUNT_FIELDS}
+        self.status_codes = np.empty(capacity, dtype=np.int32)
+        self.client_codes = np.empty(capacity, dtype=np.int32)
+        self.salesperson_codes = np.empty(capacity, dtype=np.int32)
+
+        self.statuses = _Categories()
+        self.clients = _Categories()
+        self.salespeople = _Categories()
+        self._rows: Dict[Tuple[Optional[date], CellKey], int] = {}
+        self._abs_total = 0
+
+    def _grow(self) -> None:
+        """Double column capacity."""
+        capacity = max(len(self.days) * 2, 1024)
+        for name in ("days", "ranks", "counts", "status_codes", "client_codes", "salesperson_codes"):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+        for field, column in self.amounts.items():
+            grown = np.zeros(capacity, dtype=np.int64)
+            grown[:self.size] = column[:self.size]
+            self.amounts[field] = grown
+
+    def _encode(self, value: Decimal) -> int:
+        """Decimal amount to a fixed-point int at the current scale."""
+        scaled = value.scaleb(self.scale)
+        integer = int(scaled)
+        if integer != scaled:
+            raise _NeedsRescale
+        return integer
+
+    def _write(self, row: int, cell: RollupCell) -> None:
+        """Store one cell's count and amounts in a row."""
+        self.counts[row] = cell.count
+        for field in AMOUNT_FIELDS:
+            column = self.amounts[field]
+            value = self._encode(getattr(cell, field))
+            self._abs_total += abs(value) - abs(int(column[row]))
+            column[row] = value
+
+    def _append(self, day: Optional[date], key: CellKey, cell: RollupCell) -> None:
+        """Add a new cell as the last row."""
+        if self.size == len(self.days):
+            self._grow()
+        row = self.size
+        self.size += 1
+
+        status, client_id, sales_person = key
+        self.days[row] = np.datetime64(day) if day else np.datetime64("NaT")
+        day_rank = day.toordinal() if day else UNDATED_RANK
+        self.ranks[row] = (day_rank << 32) + row
+        self.status_codes[row] = self.statuses.code(status.lower())
+        self.client_codes[row] = self.clients.code(client_id)
+        self.salesperson_codes[row] = self.salespeople.code(sales_person)
+        self._rows[(day, key)] = row
+        self._write(row, cell)
+
+    def _kill(self, row: int) -> None:
+        """Zero a row whose cell was removed (filtered out by count)."""
+        for field in AMOUNT_FIELDS:
+            self._abs_total -= abs(int(self.amounts[field][row]))
+            self.amounts[field][row] = 0
+        self.counts[row] = 0
+
+    def _build(self) -> None:
+        """Build columns from every rollup cell."""
+        self.exact = False
+        self.scale = DEFAULT_SCALE
+        while self.scale <= MAX_SCALE:
+            try:
+                self._allocate(1024)
+                for day, key, cell in self.rollups.iter_cells():
+                    self._append(day, key, cell)
+                self.exact = self._abs_total < MAX_ABS_TOTAL
+                break
+            except _NeedsRescale:
+                self.scale += 1
+            except (OverflowError, ValueError):
+                # NaN / infinite amounts
+                break
+
+        if not self.exact:
+            logger.warning("Columnar engine cannot hold amounts exactly; using Decimal path")
+        self._generation = self.rollups.generation
+
+    def _on_cell_change(
+        self,
+        day: Optional[date],
+        key: CellKey,
+        cell: Optional[RollupCell],
+        delta: RollupCell
+    ) -> None:
+        """Mirror one incremental rollup change."""
+        if self._generation != self.rollups.generation or not self.exact:
+            return
+
+        try:
+            row = self._rows.get((day, key))
+            if cell is None:
+                if row is not None:
+                    self._kill(row)
+                    del self._rows[(day, key)]
+            elif row is None:
+                self._append(day, key, cell)
+            else:
+                self._write(row, cell)
+            if self._abs_total >= MAX_ABS_TOTAL:
+                raise OverflowError
+        except (_NeedsRescale, OverflowError, ValueError):
+            # Rebuild with a wider scale on next use
+            self._generation = None
+
+    def _to_decimal(self, value) -> Decimal:
+        """Fixed-point int back to an exact Decimal."""
+        return Decimal(int(value)).scaleb(-self.scale)
+
+    def _range_mask(self, start: Optional[date], end: Optional[date], dated_only: bool) -> np.ndarray:
+        """Boolean mask of live cells whose day falls in [start, end]."""
+        days = self.days[:self.size]
+        mask = self.counts[:self.size] > 0
+        if not dated_only:
+            return mask
+        mask &= ~np.isnat(days)
+        if start:
+            mask &= days >= np.datetime64(start)
+        if end:
+            mask &= days <= np.datetime64(end)
+        return mask
+
+    def _ordered_totals(
+        self,
+        codes: np.ndarray,
+        labels: List[str],
+        values: np.ndarray,
+        ranks: np.ndarray
+    ) -> Dict[str, Decimal]:
+        """Per-label sums, keyed in order of first appearance (as the Decimal path)."""
+        totals = np.zeros(len(labels), dtype=np.int64)
+        np.add.at(totals, codes, values)
+        first = np.full(len(labels), NO_RANK, dtype=np.int64)
+        np.minimum.at(first, codes, ranks)
+
+        present = np.flatnonzero(first != NO_RANK)
+        return {
+            labels[code]: self._to_decimal(totals[code])
+            for code in present[np.argsort(first[present], kind="stable")]
+        }
+
+    def aggregate(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        dated_only: bool
+    ) -> Optional[DashboardAggregates]:
+        """
+        Compute dashboard aggregates with vector operations.
+
+        Args:
+            start: First day (inclusive) or None
+            end: Last day (inclusive) or None
+            dated_only: Exclude invoices without a valid date
+
+        Returns:
+            Aggregates identical to the Decimal path, or None when the
+            amounts cannot be represented exactly in fixed point
+        """
+        self.rollups.ensure_loaded()
+        if self._generation != self.rollups.generation:
+            self._build()
+        if not self.exact:
+            return None
+
+        n = self.size
+
+        agg = DashboardAggregates()
+
+        mask = self._range_mask(start, end, dated_only)
+        if not mask.any():
+            return agg
+
+        grand_total = self.amounts["grand_total"][:n][mask]
+        counts = self.counts[:n][mask]
+        ranks = self.ranks[:n][mask]
+        days = self.days[:n][mask]
+
+        agg.total_revenue = self._to_decimal(grand_total.sum())
+        agg.total_tax = self._to_decimal(self.amounts["total_tax"][:n][mask].sum())
+        agg.total_discount = self._to_decimal(self.amounts["total_discount"][:n][mask].sum())
+        agg.invoice_count = int(counts.sum())
+
+        # Clients (blank client IDs are not attributed)
+        client_revenue = self._ordered_totals(
+            self.client_codes[:n][mask], self.clients.labels, grand_total, ranks
+        )
+        client_revenue.pop("", None)
+        agg.client_revenue.update(client_revenue)
+        agg.active_client_ids = set(client_revenue)
+
+        # Salespeople
+        salesperson_codes = self.salesperson_codes[:n][mask]
+        agg.salesperson_revenue.update(
+            self._ordered_totals(salesperson_codes, self.salespeople.labels, grand_total, ranks)
+        )
+        count_totals = np.zeros(len(self.salespeople.labels), dtype=np.int64)
+        np.add.at(count_totals, salesperson_codes, counts)
+        for person in agg.salesperson_revenue:
+            agg.salesperson_count[person] = int(count_totals[self.salespeople.codes[person]])
+
+        # Status breakdown
+        status_totals = np.zeros(len(self.statuses.labels), dtype=np.int64)
+        np.add.at(status_totals, self.status_codes[:n][mask], grand_total)
+        for status in agg.status_revenue:
+            code = self.statuses.codes.get(status)
+            if code is not None:
+                agg.status_revenue[status] = self._to_decimal(status_totals[code])
+
+        # Monthly and daily trends (dated cells only)
+        dated = ~np.isnat(days)
+        for period, target, unit in (
+            (days[dated].astype("datetime64[M]"), agg.monthly_revenue, "M"),
+            (days[dated], agg.daily_revenue, "D"),
+        ):
+            keys, inverse = np.unique(period, return_inverse=True)
+            totals = np.zeros(len(keys), dtype=np.int64)
+            np.add.at(totals, inverse.ravel(), grand_total[dated])
+            for key, total in zip(np.datetime_as_string(keys, unit=unit), totals):
+                target[str(key)] = self._to_decimal(total)
+
+        return agg
@@ -1,291 +1,394 @@
 """
 Dashboard service for aggregating metrics from Google Sheets.
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple
 from datetime import datetime, date, timedelta
 from decimal import Decimal
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from app.services.sheets_service import SheetsService
 from app.services.invoice_service import InvoiceService
 from app.services.client_service import ClientService
+from app.services.revenue_rollup import RevenueRollupStore, parse_date
+from app.services.revenue_index import RevenueTimeIndex
+from app.services.leaderboards import LeaderboardStore
+from app.services.client_cohorts import ClientCohortStore
+import heapq
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Payment statuses reported by the financial dashboard
+PAYMENT_STATUSES = ("paid", "pending", "overdue", "draft")
+
+# Sections served by the combined dashboard endpoint, mapped to their views
+DASHBOARD_SECTIONS = {
+    "executive": "_executive_view",
+    "sales": "_sales_view",
+    "financial": "_financial_view",
+}
+
+
+class DashboardAggregates:
+    """Everything the dashboards need for one date range, from one pass."""
+    
+    def __init__(self):
+        self.total_revenue = Decimal(0)
+        self.total_tax = Decimal(0)
+        self.total_discount = Decimal(0)
+        self.invoice_count = 0
+        self.active_client_ids = set()
+        self.monthly_revenue = defaultdict(Decimal)
+        self.daily_revenue = defaultdict(Decimal)
+        self.client_revenue = defaultdict(Decimal)
+        self.salesperson_revenue = defaultdict(Decimal)
+        self.salesperson_count = defaultdict(int)
+        self.status_revenue = {status: Decimal(0) for status in PAYMENT_STATUSES}
+        # Unbounded range: rankings come from the all-time leaderboards
+        self.all_time = False
+        # Previous period of the same length (only for bounded ranges)
+        self.has_previous = False
+        self.prev_revenue = Decimal(0)
+        self.prev_count = 0
+        # Clients created in the range and in the previous period
+        self.new_clients = 0
+        self.prev_new_clients = 0
 
 
 class DashboardService:
     """Service for dashboard metrics and aggregations."""
     
-    def __init__(self, sheets: SheetsService):
+    # Aggregates kept per (start_date, end_date) for the current rollup version
+    AGGREGATE_CACHE_SIZE = 32
+    
+    def __init__(
+        self,
+        sheets: SheetsService,
+        rollup_ttl_seconds: int = 0,
+        engine: str = "decimal"
+    ):
+        """
+        Initialize dashboard service.
+        
+        Args:
+            sheets: Google Sheets service instance
+            rollup_ttl_seconds: Rollup rebuild interval for direct sheet edits
+            engine: "decimal" (pure Python) or "numpy" (columnar, same results)
+        """
         self.sheets = sheets
         self.invoice_service = InvoiceService(sheets)
         self.client_service = ClientService(sheets)
+        self.rollups = RevenueRollupStore(sheets, ttl_seconds=rollup_ttl_seconds)
+        self.time_index = RevenueTimeIndex(self.rollups)
+        self.leaderboards = LeaderboardStore(self.rollups)
+        self.cohorts = ClientCohortStore(sheets, self.rollups)
+        self._aggregate_cache: "OrderedDict[Tuple, DashboardAggregates]" = OrderedDict()
+        
+        self.columnar = None
+        if engine == "numpy":
+            try:
+                from app.services.columnar_engine import ColumnarEngine
+                self.columnar = ColumnarEngine(self.rollups)
+            except ImportError:
+                logger.warning("NumPy is not installed; using the Decimal dashboard engine")
+    
+    def state_version(self) -> Tuple:
+        """
+        Value that changes whenever any dashboard response may change.
+        
+        Covers rollup rebuilds and invoice writes, client writes (cohorts)
+        and the current date (rolling windows, default comparison end).
+        """
+        # Builds the cohort index too, so its first build is not a version change
+        self.rollups.ensure_loaded()
+        with self.rollups.lock:
+            self.cohorts.ensure_built()
+            return (
+                self.rollups.generation,
+                self.rollups.version,
+                self.cohorts.version,
+                date.today().isoformat()
+            )
     
     def _parse_date(self, date_str: str) -> Optional[date]:
         """Safely parse date string."""
-        if not date_str:
-            return None
-        try:
-            return datetime.fromisoformat(date_str).date()
-        except (ValueError, TypeError):
-            return None
+        return parse_date(date_str)
     
-    def _filter_by_date_range(
-        self, 
-        items: List[Dict], 
-        date_field: str,
+    def _resolve_range(
+        self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None
-    ) -> List[Dict]:
-        """Filter items by date range."""
+    ) -> Tuple[Optional[date], Optional[date], bool]:
+        """
+        Parse a requested date range.
+        
+        Returns:
+            (start, end, dated_only); invoices without a valid date are
+            only included when no range was requested
+        """
         if not start_date and not end_date:
-            return items
+            return None, None, False
         
         start = self._parse_date(start_date) if start_date else None
         end = self._parse_date(end_date) if end_date else None
-        
-        filtered = []
-        for item in items:
-            item_date = self._parse_date(item.get(date_field, ''))
-            if not item_date:
-                continue
-            
-            if start and item_date < start:
-                continue
-            if end and item_date > end:
-                continue
-            
-            filtered.append(item)
-        
-        return filtered
+        return start, end, True
     
-    def _safe_decimal(self, value, default=0.0) -> Decimal:
-        """Safely convert value to Decimal."""
-        try:
-            if value is None or value == '':
-                return Decimal(str(default))
-            return Decimal(str(value))
-        except (ValueError, TypeError):
-            return Decimal(str(default))
+    def _previous_period(
+        self,
+        start: Optional[date],
+        end: Optional[date]
+    ) -> Optional[Tuple[date, date]]:
+        """Previous period used for growth, or None when the range is open."""
+        if not (start and end):
+            return None
+        period_days = (end - start).days
+        return start - timedelta(days=period_days), start - timedelta(days=1)
     
-    def get_executive_metrics(
+    def _aggregate(
         self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None
-    ) -> Dict:
+    ) -> DashboardAggregates:
         """
-        Get executive dashboard metrics.
-        
-        Returns:
-            - total_revenue
-            - total_invoices
-            - active_clients
-            - revenue_growth
-            - invoice_growth
-            - client_growth
-            - monthly_revenue
-            - top_clients
+        Compute all dashboard metrics for a date range in one pass.
+        
+        Walks the rollup cells of the requested period once; the previous
+        period's totals come from the prefix-sum time index. The executive,
+        sales and financial views are formatted from the result. Results
+        are cached until the rollups change, so the three dashboards of one
+        page view share a single pass. Runs under the rollup lock, which
+        also guards the cache.
         """
-        # Get all invoices
-        invoices = self.sheets.get_all_rows("Invoices")
-        clients = self.sheets.get_all_rows("Clients")
-        
-        # Filter by date range
-        filtered_invoices = self._filter_by_date_range(
-            invoices, 
-            "invoice_date",
-            start_date,
-            end_date
-        )
-        
-        # Calculate total revenue
-        total_revenue = sum(
-            self._safe_decimal(inv.get('grand_total', 0))
-            for inv in filtered_invoices
-        )
-        
-        # Total invoices
-        total_invoices = len(filtered_invoices)
-        
-        # Active clients (clients with invoices in period)
-        active_client_ids = set(
-            inv.get('client_id') 
-            for inv in filtered_invoices 
-            if inv.get('client_id')
-        )
-        active_clients = len(active_client_ids)
-        
-        # Calculate growth (compare to previous period)
-        if start_date and end_date:
-            start = self._parse_date(start_date)
-            end = self._parse_date(end_date)
-            if start and end:
-                period_days = (end - start).days
-                prev_start = start - timedelta(days=period_days)
-                prev_end = start - timedelta(days=1)
-                
-                prev_invoices = self._filter_by_date_range(
-                    invoices,
-                    "invoice_date",
-                    prev_start.isoformat(),
-                    prev_end.isoformat()
-                )
-                
-                prev_revenue = sum(
-                    self._safe_decimal(inv.get('grand_total', 0))
-                    for inv in prev_invoices
-                )
-                
-                revenue_growth = (
-                    ((total_revenue - prev_revenue) / prev_revenue * 100)
-                    if prev_revenue > 0 else 0
-                )
-                
-                invoice_growth = (
-                    ((total_invoices - len(prev_invoices)) / len(prev_invoices) * 100)
-                    if len(prev_invoices) > 0 else 0
-                )
-            else:
-                revenue_growth = 0
-                invoice_growth = 0
-        else:
-            revenue_growth = 0
-            invoice_growth = 0
-        
-        # Monthly revenue trend
-        monthly_data = defaultdict(Decimal)
-        for inv in filtered_invoices:
-            inv_date = self._parse_date(inv.get('invoice_date'))
-            if inv_date:
-                month_key = inv_date.strftime('%Y-%m')
-                monthly_data[month_key] += self._safe_decimal(inv.get('grand_total', 0))
+        self.rollups.ensure_loaded()
+        with self.rollups.lock:
+            cache_key = (start_date, end_date, self.rollups.version, self.cohorts.version)
+            cached = self._aggregate_cache.get(cache_key)
+            if cached is not None:
+                self._aggregate_cache.move_to_end(cache_key)
+                return cached
+            
+            start, end, dated_only = self._resolve_range(start_date, end_date)
+            previous = self._previous_period(start, end) if start_date and end_date else None
+            
+            agg = None
+            if self.columnar is not None:
+                agg = self.columnar.aggregate(start, end, dated_only)
+            if agg is None:
+                agg = self._aggregate_cells(start, end, dated_only)
+            agg.all_time = not dated_only
+            
+            if previous:
+                agg.has_previous = True
+                agg.prev_revenue, agg.prev_count = self.time_index.range_totals(*previous)
+                agg.new_clients = self.cohorts.new_clients(start, end)
+                agg.prev_new_clients = self.cohorts.new_clients(*previous)
+            
+            self._aggregate_cache[cache_key] = agg
+            while len(self._aggregate_cache) > self.AGGREGATE_CACHE_SIZE:
+                self._aggregate_cache.popitem(last=False)
+            
+            return agg
+    
+    def _aggregate_cells(
+        self,
+        start: Optional[date],
+        end: Optional[date],
+        dated_only: bool
+    ) -> DashboardAggregates:
+        """Decimal aggregation: one pass over the rollup cells in range."""
+        agg = DashboardAggregates()
+        
+        for day, (status, client_id, sales_person), cell in self.rollups.iter_cells(
+            start, end, dated_only
+        ):
+            agg.total_revenue += cell.grand_total
+            agg.total_tax += cell.total_tax
+            agg.total_discount += cell.total_discount
+            agg.invoice_count += cell.count
+            
+            if client_id:
+                agg.active_client_ids.add(client_id)
+                agg.client_revenue[client_id] += cell.grand_total
+            
+            agg.salesperson_revenue[sales_person] += cell.grand_total
+            agg.salesperson_count[sales_person] += cell.count
+            
+            status = status.lower()
+            if status in agg.status_revenue:
+                agg.status_revenue[status] += cell.grand_total
+            
+            if day:
+                agg.monthly_revenue[day.strftime('%Y-%m')] += cell.grand_total
+                agg.daily_revenue[day.isoformat()] += cell.grand_total
         
-        monthly_revenue = [
+        return agg
+    
+    def _monthly_series(self, monthly: Dict[str, Decimal]) -> List[Dict]:
+        """Format month -> revenue as a sorted chart series."""
+        return [
             {
                 "month": datetime.strptime(month, '%Y-%m').strftime('%b %Y'),
                 "revenue": float(revenue)
             }
-            for month, revenue in sorted(monthly_data.items())
+            for month, revenue in sorted(monthly.items())
         ]
+    
+    def _top(
+        self,
+        agg: DashboardAggregates,
+        dimension: str,
+        limit: int
+    ) -> List[Tuple[str, Decimal, int]]:
+        """
+        Top entities by revenue as (id, revenue, invoice count).
         
-        # Top clients by revenue
-        client_revenue = defaultdict(Decimal)
-        client_names = {}
+        All-time rankings are read from the maintained leaderboards;
+        bounded ranges select the top N from the aggregates with a heap.
+        """
+        if agg.all_time:
+            return self.leaderboards.get(dimension).page(limit)
         
-        for inv in filtered_invoices:
-            client_id = inv.get('client_id')
-            if client_id:
-                client_revenue[client_id] += self._safe_decimal(inv.get('grand_total', 0))
-                # Store client name
-                if client_id not in client_names:
-                    client_names[client_id] = inv.get('client_name', client_id)
+        if dimension == "clients":
+            revenue, counts = agg.client_revenue, None
+        else:
+            revenue, counts = agg.salesperson_revenue, agg.salesperson_count
+        return [
+            (entity, total, counts[entity] if counts else 0)
+            for entity, total in heapq.nlargest(limit, revenue.items(), key=lambda x: x[1])
+        ]
+    
+    def _executive_view(self, agg: DashboardAggregates) -> Dict:
+        """Format executive metrics from aggregates."""
+        revenue_growth = 0
+        invoice_growth = 0
+        client_growth = 0
+        if agg.has_previous:
+            revenue_growth = (
+                ((agg.total_revenue - agg.prev_revenue) / agg.prev_revenue * 100)
+                if agg.prev_revenue > 0 else 0
+            )
+            invoice_growth = (
+                ((agg.invoice_count - agg.prev_count) / agg.prev_count * 100)
+                if agg.prev_count > 0 else 0
+            )
+            client_growth = (
+                ((agg.new_clients - agg.prev_new_clients) / agg.prev_new_clients * 100)
+                if agg.prev_new_clients > 0 else 0
+            )
         
         top_clients = [
             {
-                "name": client_names.get(client_id, client_id),
+                "name": self.rollups.client_names.get(client_id, client_id),
                 "revenue": float(revenue)
             }
-            for client_id, revenue in sorted(
-                client_revenue.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:5]  # Top 5 clients
+            for client_id, revenue, _ in self._top(agg, "clients", 5)
         ]
         
         return {
-            "total_revenue": float(total_revenue),
-            "total_invoices": total_invoices,
-            "active_clients": active_clients,
+            "total_revenue": float(agg.total_revenue),
+            "total_invoices": agg.invoice_count,
+            "active_clients": len(agg.active_client_ids),
             "revenue_growth": float(revenue_growth),
             "invoice_growth": float(invoice_growth),
-            "client_growth": 0,  # Will calculate when we have date tracking
-            "monthly_revenue": monthly_revenue,
+            "client_growth": float(client_growth),
+            "new_clients": agg.new_clients,
+            "monthly_revenue": self._monthly_series(agg.monthly_revenue),
             "top_clients": top_clients
         }
     
-    def get_sales_metrics(
-        self,
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None
-    ) -> Dict:
-        """
-        Get sales dashboard metrics.
-        
-        Returns:
-            - total_sales
-            - invoices_count
-            - avg_invoice_value
-            - sales_trend
-            - top_salespeople
-            - conversion_rate (placeholder)
-        """
-        # Get all invoices
-        invoices = self.sheets.get_all_rows("Invoices")
-        
-        # Filter by date range
-        filtered_invoices = self._filter_by_date_range(
-            invoices,
-            "invoice_date",
-            start_date,
-            end_date
-        )
-        
-        # Total sales
-        total_sales = sum(
-            self._safe_decimal(inv.get('grand_total', 0))
-            for inv in filtered_invoices
-        )
-        
-        invoices_count = len(filtered_invoices)
-        
-        # Average invoice value
+    def _sales_view(self, agg: DashboardAggregates) -> Dict:
+        """Format sales metrics from aggregates."""
         avg_invoice_value = (
-            float(total_sales / invoices_count)
-            if invoices_count > 0 else 0
+            float(agg.total_revenue / agg.invoice_count)
+            if agg.invoice_count > 0 else 0
         )
         
-        # Sales trend by day
-        daily_sales = defaultdict(Decimal)
-        for inv in filtered_invoices:
-            inv_date = self._parse_date(inv.get('invoice_date'))
-            if inv_date:
-                daily_sales[inv_date.isoformat()] += self._safe_decimal(inv.get('grand_total', 0))
-        
         sales_trend = [
             {
                 "date": date_str,
                 "sales": float(sales)
             }
-            for date_str, sales in sorted(daily_sales.items())
+            for date_str, sales in sorted(agg.daily_revenue.items())
         ]
         
-        # Top salespeople
-        salesperson_data = defaultdict(lambda: {"sales": Decimal(0), "count": 0})
-        
-        for inv in filtered_invoices:
-            salesperson = inv.get('sales_person', 'Unknown')
-            salesperson_data[salesperson]["sales"] += self._safe_decimal(inv.get('grand_total', 0))
-            salesperson_data[salesperson]["count"] += 1
-        
         top_salespeople = [
             {
                 "name": person,
-                "sales": float(data["sales"]),
-                "invoices": data["count"]
+                "sales": float(sales),
+                "invoices": invoices
             }
-            for person, data in sorted(
-                salesperson_data.items(),
-                key=lambda x: x[1]["sales"],
-                reverse=True
-            )[:10]  # Top 10 salespeople
+            for person, sales, invoices in self._top(agg, "salespeople", 10)
         ]
         
         return {
-            "total_sales": float(total_sales),
-            "invoices_count": invoices_count,
+            "total_sales": float(agg.total_revenue),
+            "invoices_count": agg.invoice_count,
             "avg_invoice_value": avg_invoice_value,
             "sales_trend": sales_trend,
             "top_salespeople": top_salespeople,
             "conversion_rate": 65.5  # Placeholder - need leads data
         }
     
+    def _financial_view(self, agg: DashboardAggregates) -> Dict:
+        """Format financial metrics from aggregates."""
+        # Net revenue (after tax and discount)
+        net_revenue = agg.total_revenue - agg.total_tax - agg.total_discount
+        
+        return {
+            "total_revenue": float(agg.total_revenue),
+            "total_tax": float(agg.total_tax),
+            "total_discount": float(agg.total_discount),
+            "net_revenue": float(net_revenue),
+            "revenue_by_month": self._monthly_series(agg.monthly_revenue),
+            "payment_status": {
+                status: float(amount)
+                for status, amount in agg.status_revenue.items()
+            }
+        }
+    
+    def get_executive_metrics(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Dict:
+        """
+        Get executive dashboard metrics.
+        
+        Returns:
+            - total_revenue
+            - total_invoices
+            - active_clients
+            - revenue_growth
+            - invoice_growth
+            - client_growth (new clients vs the previous period)
+            - new_clients
+            - monthly_revenue
+            - top_clients
+        """
+        self.rollups.ensure_loaded()
+        with self.rollups.lock:
+            return self._executive_view(self._aggregate(start_date, end_date))
+    
+    def get_sales_metrics(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Dict:
+        """
+        Get sales dashboard metrics.
+        
+        Returns:
+            - total_sales
+            - invoices_count
+            - avg_invoice_value
+            - sales_trend
+            - top_salespeople
+            - conversion_rate (placeholder)
+        """
+        self.rollups.ensure_loaded()
+        with self.rollups.lock:
+            return self._sales_view(self._aggregate(start_date, end_date))
+    
     def get_financial_metrics(
         self,
         start_date: Optional[str] = None,
@@ -302,68 +405,146 @@ class DashboardService:
             - revenue_by_month
             - payment_status breakdown
         """
-        # Get all invoices
-        invoices = self.sheets.get_all_rows("Invoices")
-        
-        # Filter by date range
-        filtered_invoices = self._filter_by_date_range(
-            invoices,
-            "invoice_date",
-            start_date,
-            end_date
-        )
-        
-        # Totals
-        total_revenue = Decimal(0)
-        total_tax = Decimal(0)
-        total_discount = Decimal(0)
+        self.rollups.ensure_loaded()
+        with self.rollups.lock:
+            return self._financial_view(self._aggregate(start_date, end_date))
+    
+    def compare_periods(
+        self,
+        periods: int = 12,
+        granularity: str = "month",
+        end_date: Optional[str] = None,
+        status: Optional[str] = None,
+        sales_person: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Compare revenue across the last N periods (e.g. 12 months month-by-month).
         
-        # Payment status breakdown
-        payment_status = {
-            "paid": Decimal(0),
-            "pending": Decimal(0),
-            "overdue": Decimal(0),
-            "draft": Decimal(0)
-        }
+        Each period costs two prefix-sum lookups on the time index.
         
-        for inv in filtered_invoices:
-            grand_total = self._safe_decimal(inv.get('grand_total', 0))
-            total_revenue += grand_total
-            total_tax += self._safe_decimal(inv.get('total_tax', 0))
-            total_discount += self._safe_decimal(inv.get('total_discount', 0))
+        Args:
+            periods: Number of periods
+            granularity: day, week, month, quarter or year
+            end_date: Date inside the last period (YYYY-MM-DD, default today)
+            status: Only invoices with this status
+            sales_person: Only invoices of this salesperson
             
-            # Status breakdown
-            status = inv.get('status', 'draft').lower()
-            if status in payment_status:
-                payment_status[status] += grand_total
-        
-        # Net revenue (after tax and discount)
-        net_revenue = total_revenue - total_tax - total_discount
+        Returns:
+            Oldest-first periods with revenue, invoices and change vs the
+            previous period
+        """
+        end = self._parse_date(end_date) if end_date else None
+        if end_date and end is None:
+            raise ValueError(f"Invalid end_date: {end_date}")
+        self.rollups.ensure_loaded()
+        with self.rollups.lock:
+            return self.time_index.compare_periods(periods, granularity, end, status, sales_person)
+    
+    def get_client_cohorts(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        months: int = 12
+    ) -> Dict:
+        """
+        Get client activation and retention by creation-month cohort.
         
-        # Revenue by month
-        monthly_revenue = defaultdict(Decimal)
-        for inv in filtered_invoices:
-            inv_date = self._parse_date(inv.get('invoice_date'))
-            if inv_date:
-                month_key = inv_date.strftime('%Y-%m')
-                monthly_revenue[month_key] += self._safe_decimal(inv.get('grand_total', 0))
+        Args:
+            start_date: First client creation date (YYYY-MM-DD)
+            end_date: Last client creation date (YYYY-MM-DD)
+            months: Curve length in months
+            
+        Returns:
+            {"summary": {...}, "cohorts": [...]}
+        """
+        start, end, _ = self._resolve_range(start_date, end_date)
+        self.rollups.ensure_loaded()
+        with self.rollups.lock:
+            return self.cohorts.get_cohorts(start, end, months)
+    
+    def get_leaderboard(
+        self,
+        board: str = "clients",
+        window: str = "all",
+        limit: int = 20,
+        offset: int = 0
+    ) -> Dict:
+        """
+        Get one page of a client or salesperson leaderboard.
         
-        revenue_by_month = [
-            {
-                "month": datetime.strptime(month, '%Y-%m').strftime('%b %Y'),
-                "revenue": float(revenue)
+        Args:
+            board: "clients" or "salespeople"
+            window: "all", "7d", "30d" or "90d"
+            limit: Entries per page
+            offset: Entries to skip
+            
+        Returns:
+            {"entries": [{rank, id, name, revenue, invoices}], "total"}
+        """
+        self.rollups.ensure_loaded()
+        with self.rollups.lock:
+            leaderboard = self.leaderboards.get(board, window)
+            entries = []
+            for rank, (entity, revenue, invoices) in enumerate(
+                leaderboard.page(limit, offset), start=offset + 1
+            ):
+                name = self.rollups.client_names.get(entity, entity) if board == "clients" else entity
+                entries.append({
+                    "rank": rank,
+                    "id": entity,
+                    "name": name,
+                    "revenue": float(revenue),
+                    "invoices": invoices
+                })
+            
+            return {
+                "entries": entries,
+                "total": len(leaderboard)
             }
-            for month, revenue in sorted(monthly_revenue.items())
-        ]
+    
+    def get_dashboard(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        sections: Optional[Sequence[str]] = None
+    ) -> Dict:
+        """
+        Get several dashboards from one shared fetch and aggregation pass.
+        
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            sections: Sections to include (default: all)
+            
+        Returns:
+            {"sections": {name: metrics}, "timings_ms": {step: ms}}
+        """
+        sections = list(sections or DASHBOARD_SECTIONS)
+        unknown = [name for name in sections if name not in DASHBOARD_SECTIONS]
+        if unknown:
+            raise ValueError(
+                f"Unknown sections: {', '.join(unknown)}. "
+                f"Available: {', '.join(DASHBOARD_SECTIONS)}"
+            )
+        
+        timings = {}
+        
+        started = time.perf_counter()
+        self.rollups.ensure_loaded()
+        timings["fetch"] = (time.perf_counter() - started) * 1000
+        
+        with self.rollups.lock:
+            started = time.perf_counter()
+            agg = self._aggregate(start_date, end_date)
+            timings["aggregate"] = (time.perf_counter() - started) * 1000
+            
+            results = {}
+            for name in sections:
+                started = time.perf_counter()
+                results[name] = getattr(self, DASHBOARD_SECTIONS[name])(agg)
+                timings[name] = (time.perf_counter() - started) * 1000
         
         return {
-            "total_revenue": float(total_revenue),
-            "total_tax": float(total_tax),
-            "total_discount": float(total_discount),
-            "net_revenue": float(net_revenue),
-            "revenue_by_month": revenue_by_month,
-            "payment_status": {
-                status: float(amount)
-                for status, amount in payment_status.items()
-            }
+            "sections": results,
+            "timings_ms": {step: round(ms, 3) for step, ms in timings.items()}
         }
@@ -0,0 +1,247 @@
+"""
+Dashboard Stream - Server-Sent Events with changed dashboard metrics.
+One snapshot of the all-time dashboards (plus ticket and task status
+counts) is recomputed per change and diffed against the last one; every
+connected viewer receives only the changed values, so Sheets reads do
+not grow with the number of open dashboards.
+"""
+
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+import asyncio
+import logging
+import threading
+
+from app.core.serialization import dumps
+from app.services.sheets_service import SheetsService, RowChange, add_row_listener
+from app.services.dashboard_service import DashboardService
+
+logger = logging.getLogger(__name__)
+
+# Sheets whose writes can change a streamed metric
+INVOICE_SHEETS = {"Invoices", "Clients"}
+# Sheet -> (section, status counts metric)
+STATUS_SHEETS = {
+    "Support_Tickets": ("support", "tickets_by_status"),
+    "Tasks": ("operations", "tasks_by_status"),
+}
+
+# Coalesce bursts of writes into one publish
+DEBOUNCE_SECONDS = 0.25
+KEEPALIVE_SECONDS = 15
+# Events buffered per viewer before a slow viewer is dropped (it reconnects)
+QUEUE_SIZE = 100
+
+_MISSING = object()
+
+
+def _flatten(prefix: str, value: Any, into: Dict[str, Any]) -> None:
+    """Flatten nested dicts to dotted keys (lists stay whole values)."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _flatten(f"{prefix}.{key}", item, into)
+    else:
+        into[prefix] = value
+
+
+def _event(name: str, payload: Any, event_id: Optional[int] = None) -> bytes:
+    """Encode one SSE message."""
+    lines = [f"event: {name}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    return ("\n".join(lines) + "\n").encode() + b"data: " + dumps(payload) + b"\n\n"
+
+
+class DashboardStream:
+    """Publishes dashboard metric deltas to SSE subscribers."""
+
+    def __init__(
+        self,
+        sheets_service: SheetsService,
+        dashboard_service: DashboardService
+    ):
+        """
+        Initialize stream and subscribe to sheet writes.
+
+        Args:
+            sheets_service: Google Sheets service instance
+            dashboard_service: Dashboard service whose metrics are streamed
+        """
+        self.sheets = sheets_service
+        self.dashboard = dashboard_service
+
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._snapshot: Dict[str, Any] = {}
+        self.version = 0
+
+        # sheet -> status -> count, loaded on first use; loaded and read in
+        # worker threads while writes update it on the event loop
+        self._status_counts: Dict[str, Dict[str, int]] = {}
+        self._counts_lock = threading.Lock()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._changed: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        add_row_listener(self._on_row_change)
+
+    def _load_status_counts(self, sheet_name: str) -> None:
+        # Held across the read so no write lands between read and swap
+        with self._counts_lock:
+            counts: Dict[str, int] = {}
+            for row in self.sheets.get_all_rows(sheet_name):
+                status = row.get("status", "")
+                if status:
+                    counts[status] = counts.get(status, 0) + 1
+            self._status_counts[sheet_name] = counts
+
+    def _on_row_change(self, sheet_name: str, changes: List[RowChange]) -> None:
+        """Track status counts and schedule a publish after relevant writes."""
+        with self._counts_lock:
+            counts = self._status_counts.get(sheet_name)
+            if counts is not None:
+                for before, after in changes:
+                    for row, sign in ((before, -1), (after, 1)):
+                        status = row.get("status", "") if row else ""
+                        if status:
+                            counts[status] = counts.get(status, 0) + sign
+                            if counts[status] <= 0:
+                                del counts[status]
+
+        if sheet_name in INVOICE_SHEETS or sheet_name in STATUS_SHEETS:
+            self._mark_changed()
+
+    def _mark_changed(self) -> None:
+        # Writes may come from worker threads; wake the publisher on its loop
+        if self._loop is not None and self._changed is not None:
+            self._loop.call_soon_threadsafe(self._changed.set)
+
+    def _compute_snapshot(self) -> Dict[str, Any]:
+        """All streamed metrics as a flat {dotted.name: value} dict."""
+        snapshot: Dict[str, Any] = {}
+        for section, metrics in self.dashboard.get_dashboard()["sections"].items():
+            _flatten(section, metrics, snapshot)
+
+        for sheet_name, (section, metric) in STATUS_SHEETS.items():
+            if sheet_name not in self._status_counts:
+                self._load_status_counts(sheet_name)
+            with self._counts_lock:
+                counts = dict(self._status_counts[sheet_name])
+            _flatten(f"{section}.{metric}", counts, snapshot)
+        return snapshot
+
+    def _broadcast(self, message: bytes) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                logger.warning("Dropping slow dashboard stream subscriber")
+                self._subscribers.discard(queue)
+
+    async def publish(self) -> Dict[str, Any]:
+        """
+        Recompute metrics and push the changed values to every subscriber.
+
+        The snapshot (rollup and sheet reads) is computed in a worker
+        thread; diffing and queueing stay on the event loop.
+
+        Returns:
+            Changed metrics (removed metrics map to None)
+        """
+        snapshot = await asyncio.to_thread(self._compute_snapshot)
+        changes = {
+            key: value for key, value in snapshot.items()
+            if self._snapshot.get(key, _MISSING) != value
+        }
+        for key in self._snapshot.keys() - snapshot.keys():
+            changes[key] = None
+        self._snapshot = snapshot
+
+        if changes:
+            self.version += 1
+            self._broadcast(_event("delta", {"version": self.version, "changes": changes}, self.version))
+        return changes
+
+    def refresh(self) -> None:
+        """
+        Re-read the sheets to pick up edits made directly in Google Sheets.
+
+        The rollups are only rebuilt when the Invoices sheet changed, so an
+        idle refresh keeps derived views and dashboard ETags valid.
+        """
+        self.dashboard.rollups.refresh()
+        for sheet_name in list(self._status_counts):
+            self._load_status_counts(sheet_name)
+
+    async def _run(self, refresh_seconds: int) -> None:
+        """Publish after writes, and refresh from the sheets periodically."""
+        while True:
+            refresh = False
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=refresh_seconds or None)
+            except asyncio.TimeoutError:
+                refresh = True
+
+            if not self._subscribers:
+                # Nobody watching: nothing to read or push
+                self._changed.clear()
+                continue
+
+            await asyncio.sleep(DEBOUNCE_SECONDS)
+            self._changed.clear()
+            try:
+                if refresh:
+                    await asyncio.to_thread(self.refresh)
+                await self.publish()
+            except Exception as e:
+                logger.error(f"Dashboard stream publish failed: {e}")
+
+    def start(self, refresh_seconds: int = 0) -> None:
+        """
+        Start the publisher loop.
+
+        Args:
+            refresh_seconds: Re-read the sheets this often while anyone is
+                subscribed, to catch direct sheet edits (0 = writes only)
+        """
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        self._task = asyncio.create_task(self._run(refresh_seconds))
+        logger.info(f"Dashboard stream started (sheet refresh every {refresh_seconds}s)")
+
+    def stop(self) -> None:
+        """Stop the publisher loop and disconnect subscribers."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._subscribers.clear()
+
+    async def events(self) -> AsyncIterator[bytes]:
+        """
+        SSE messages for one viewer: a full snapshot, then deltas.
+
+        Yields:
+            Encoded `snapshot` and `delta` events and keepalive comments
+        """
+        if self._task is None:
+            self.start()
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        if not self._subscribers:
+            # Snapshot and status counts are not refreshed from the sheets
+            # while nobody is subscribed; re-read them for the first viewer
+            with self._counts_lock:
+                self._status_counts = {}
+            self._snapshot = await asyncio.to_thread(self._compute_snapshot)
+        self._subscribers.add(queue)
+
+        try:
+            yield _event("snapshot", {"version": self.version, "metrics": self._snapshot}, self.version)
+            while queue in self._subscribers:
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+        finally:
+            self._subscribers.discard(queue)
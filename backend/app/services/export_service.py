@@ -0,0 +1,228 @@
+"""
+Invoice Export Service - Streaming exports for finance.
+Rows flow through a generator pipeline from chunked sheet reads to
+CSV / NDJSON / XLSX output without materializing the full result.
+"""
+
+from typing import Dict, Iterator, List, Optional
+from datetime import date
+import csv
+import io
+import itertools
+import logging
+import os
+import tempfile
+
+import orjson
+import xlsxwriter
+
+from app.services.sheets_service import SheetsService
+
+logger = logging.getLogger(__name__)
+
+INVOICE_EXPORT_COLUMNS = [
+    "invoice_id", "client_id", "client_name", "invoice_date", "due_date",
+    "subtotal", "total_tax", "total_discount", "grand_total",
+    "status", "sales_person", "created_at"
+]
+ITEM_EXPORT_COLUMNS = [
+    "item_id", "service", "description", "quantity", "unit_price",
+    "tax_percent", "discount_percent", "line_total"
+]
+NUMERIC_COLUMNS = {
+    "subtotal", "total_tax", "total_discount", "grand_total",
+    "quantity", "unit_price", "tax_percent", "discount_percent", "line_total"
+}
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+class InvoiceExportService:
+    """Service for streaming invoice exports."""
+
+    def __init__(
+        self,
+        sheets_service: SheetsService,
+        chunk_size: int = 1000,
+        join_block_size: int = 5000
+    ):
+        """
+        Initialize export service.
+
+        Args:
+            sheets_service: Google Sheets service instance
+            chunk_size: Rows fetched per sheet read
+            join_block_size: Invoices held at once when joining line items
+                (the Invoice_Items sheet is streamed once per block)
+        """
+        self.sheets = sheets_service
+        self.chunk_size = chunk_size
+        self.join_block_size = join_block_size
+
+    def columns(self, expand_items: bool = False) -> List[str]:
+        """Output columns for an export."""
+        if expand_items:
+            return INVOICE_EXPORT_COLUMNS + ITEM_EXPORT_COLUMNS
+        return list(INVOICE_EXPORT_COLUMNS)
+
+    def iter_invoices(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        status: Optional[str] = None,
+        client_id: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Stream invoices matching the filters from chunked sheet reads.
+
+        Args:
+            start_date: Earliest invoice_date (inclusive)
+            end_date: Latest invoice_date (inclusive)
+            status: Filter by status
+            client_id: Filter by client
+
+        Yields:
+            Matching invoice rows, export columns only
+        """
+        start = start_date.isoformat() if start_date else None
+        end = end_date.isoformat() if end_date else None
+
+        for invoice in self.sheets.iter_rows("Invoices", self.chunk_size):
+            if not invoice.get("invoice_id"):
+                continue
+            if status and invoice.get("status") != status:
+                continue
+            if client_id and invoice.get("client_id") != client_id:
+                continue
+            # ISO dates compare correctly as strings
+            invoice_date = invoice.get("invoice_date", "")
+            if start and invoice_date < start:
+                continue
+            if end and invoice_date > end:
+                continue
+            yield {col: invoice.get(col, "") for col in INVOICE_EXPORT_COLUMNS}
+
+    def iter_records(self, expand_items: bool = False, **filters) -> Iterator[Dict]:
+        """
+        Stream export records, optionally one per line item.
+
+        Without item expansion memory is constant. With expansion the
+        matching invoices are joined in blocks of ``join_block_size``:
+        each block is held while the Invoice_Items sheet is streamed
+        against it, so memory stays bounded and exports up to one block
+        read the items sheet once. Records come out block by block, in
+        item sheet order within a block.
+
+        Yields:
+            Flat export records
+        """
+        if not expand_items:
+            yield from self.iter_invoices(**filters)
+            return
+
+        invoices = self.iter_invoices(**filters)
+        while True:
+            block = {
+                invoice["invoice_id"]: invoice
+                for invoice in itertools.islice(invoices, self.join_block_size)
+            }
+            if not block:
+                return
+
+            for item in self.sheets.iter_rows("Invoice_Items", self.chunk_size):
+                invoice = block.get(item.get("invoice_id"))
+                if invoice is None:
+                    continue
+                record = dict(invoice)
+                record.update({col: item.get(col, "") for col in ITEM_EXPORT_COLUMNS})
+                yield record
+
+    def stream_csv(self, expand_items: bool = False, **filters) -> Iterator[bytes]:
+        """
+        Stream records as CSV, flushing once per read chunk.
+
+        The stream methods are plain generators because every step reads
+        the sheet; StreamingResponse iterates them in its threadpool,
+        off the event loop.
+        """
+        columns = self.columns(expand_items)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        writer.writerow(columns)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+        pending = 0
+        for record in self.iter_records(expand_items, **filters):
+            writer.writerow([record.get(col, "") for col in columns])
+            pending += 1
+            if pending >= self.chunk_size:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+
+        if pending:
+            yield buffer.getvalue().encode("utf-8")
+
+    def stream_ndjson(self, expand_items: bool = False, **filters) -> Iterator[bytes]:
+        """Stream records as newline-delimited JSON, flushing once per read chunk."""
+        lines = []
+        for record in self.iter_records(expand_items, **filters):
+            lines.append(orjson.dumps(record))
+            if len(lines) >= self.chunk_size:
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+
+        if lines:
+            yield b"\n".join(lines) + b"\n"
+
+    def stream_xlsx(self, expand_items: bool = False, **filters) -> Iterator[bytes]:
+        """
+        Stream records as an XLSX workbook.
+
+        The workbook is written in constant-memory mode to a temporary
+        file (XLSX is a ZIP and can only be sent once complete), then
+        streamed back in blocks.
+        """
+        columns = self.columns(expand_items)
+        fd, path = tempfile.mkstemp(suffix=".xlsx")
+        os.close(fd)
+
+        try:
+            workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+            worksheet = workbook.add_worksheet("Invoices")
+            worksheet.write_row(0, 0, columns)
+
+            row_index = 1
+            for record in self.iter_records(expand_items, **filters):
+                for col_index, col in enumerate(columns):
+                    value = record.get(col, "")
+                    if col in NUMERIC_COLUMNS and value != "":
+                        try:
+                            worksheet.write_number(row_index, col_index, float(value))
+                            continue
+                        except ValueError:
+                            pass
+                    worksheet.write_string(row_index, col_index, value)
+                row_index += 1
+
+            workbook.close()
+
+            with open(path, "rb") as f:
+                while True:
+                    block = f.read(64 * 1024)
+                    if not block:
+                        break
+                    yield block
+        finally:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"Could not remove export file {path}: {e}")
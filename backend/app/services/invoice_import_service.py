@@ -0,0 +1,349 @@
+"""
+Invoice Import Service - Bulk import of historical invoices.
+Parses CSV / NDJSON streams, validates in chunks and writes
+Invoices and Invoice_Items with batched appends.
+"""
+
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set
+from datetime import datetime
+import csv
+import logging
+import time
+
+import orjson
+from pydantic import ValidationError
+
+from app.services.sheets_service import SheetsService
+from app.services.invoice_service import InvoiceService
+from app.schemas.invoice import (
+    InvoiceImportRecord,
+    InvoiceImportError,
+    InvoiceImportResult
+)
+
+logger = logging.getLogger(__name__)
+
+# Invoice-level and item-level columns accepted in CSV imports
+INVOICE_COLUMNS = (
+    "invoice_id", "client_id", "client_name", "invoice_date",
+    "due_date", "sales_person", "status"
+)
+ITEM_COLUMNS = (
+    "service", "description", "quantity", "unit_price",
+    "tax_percent", "discount_percent"
+)
+
+
+class ImportRecord(NamedTuple):
+    """One raw invoice record read from an import stream."""
+    line: int
+    data: Optional[Dict]
+    error: Optional[str] = None
+
+
+def iter_ndjson_records(lines: Iterable[str]) -> Iterator[ImportRecord]:
+    """
+    Read one invoice (with nested items) per NDJSON line.
+
+    Args:
+        lines: Text lines of the upload
+
+    Yields:
+        ImportRecord per non-empty line
+    """
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            data = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            yield ImportRecord(line_no, None, f"Invalid JSON: {e}")
+            continue
+        if not isinstance(data, dict):
+            yield ImportRecord(line_no, None, "Expected a JSON object per line")
+            continue
+        yield ImportRecord(line_no, data)
+
+
+def iter_csv_records(lines: Iterable[str]) -> Iterator[ImportRecord]:
+    """
+    Read invoices from a flat CSV with one line item per row.
+
+    Consecutive rows sharing an ``invoice_ref`` (or ``invoice_id``)
+    are grouped into one invoice; rows without either are
+    single-item invoices.
+
+    Args:
+        lines: Text lines of the upload
+
+    Yields:
+        ImportRecord per invoice, tagged with its first CSV line
+    """
+    reader = csv.DictReader(lines)
+    current = None
+    current_key = ""
+    start_line = 0
+
+    for row in reader:
+        key = (row.get("invoice_ref") or row.get("invoice_id") or "").strip()
+        item = {
+            col: (row.get(col) or "").strip()
+            for col in ITEM_COLUMNS
+            if (row.get(col) or "").strip() or col == "description"
+        }
+
+        if current is not None and key and key == current_key:
+            current["items"].append(item)
+            continue
+
+        if current is not None:
+            yield ImportRecord(start_line, current)
+
+        current = {
+            col: row[col].strip()
+            for col in INVOICE_COLUMNS
+            if (row.get(col) or "").strip()
+        }
+        current["items"] = [item]
+        current_key = key
+        start_line = reader.line_num
+
+    if current is not None:
+        yield ImportRecord(start_line, current)
+
+
+class _ImportState:
+    """Running state of one import: ID block, lookups and results."""
+
+    def __init__(self, existing_ids: Set[str], client_names: Dict[str, str], prefix: str, next_num: int):
+        self.existing_ids = existing_ids
+        self.client_names = client_names
+        self.prefix = prefix
+        self.next_num = next_num
+        self.invoice_headers: List[str] = []
+        self.item_headers: List[str] = []
+        self.records = 0
+        self.items_imported = 0
+        self.imported_ids: List[str] = []
+        self.errors: List[InvoiceImportError] = []
+
+    def allocate_id(self) -> str:
+        """Take the next free ID from the block."""
+        invoice_id = f"{self.prefix}{self.next_num:03d}"
+        while invoice_id in self.existing_ids:
+            self.next_num += 1
+            invoice_id = f"{self.prefix}{self.next_num:03d}"
+        self.next_num += 1
+        return invoice_id
+
+
+class InvoiceImportService:
+    """Service for bulk invoice imports."""
+
+    def __init__(self, sheets_service: SheetsService, invoice_service: InvoiceService):
+        """
+        Initialize import service.
+
+        Args:
+            sheets_service: Google Sheets service instance
+            invoice_service: Invoice service (shared total calculations)
+        """
+        self.sheets = sheets_service
+        self.invoice_service = invoice_service
+
+    def import_invoices(
+        self,
+        records: Iterable[ImportRecord],
+        chunk_size: int = 500
+    ) -> InvoiceImportResult:
+        """
+        Import invoices from a record stream.
+
+        Records are validated and written chunk by chunk, so memory
+        stays bounded by ``chunk_size``. Invalid records are reported
+        and skipped without aborting the batch.
+
+        Args:
+            records: Parsed import records
+            chunk_size: Invoices validated and written per batch
+
+        Returns:
+            Import summary with per-record errors
+        """
+        started = time.perf_counter()
+
+        # One read each for ID allocation and client names
+        existing_ids = set()
+        prefix = f"INV-{datetime.now().year}-"
+        next_num = 1
+        for invoice in self.sheets.get_all_rows("Invoices"):
+            inv_id = invoice.get("invoice_id", "")
+            existing_ids.add(inv_id)
+            if inv_id.startswith(prefix):
+                try:
+                    next_num = max(next_num, int(inv_id.split("-")[-1]) + 1)
+                except ValueError:
+                    continue
+
+        client_names = {
+            client.get("client_id", ""): client.get("name", "")
+            for client in self.sheets.get_all_rows("Clients")
+        }
+
+        state = _ImportState(existing_ids, client_names, prefix, next_num)
+        state.invoice_headers = self.sheets.get_headers("Invoices")
+        state.item_headers = self.sheets.get_headers("Invoice_Items")
+
+        chunk: List[ImportRecord] = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                self._import_chunk(chunk, state)
+                chunk = []
+
+        if chunk:
+            self._import_chunk(chunk, state)
+
+        elapsed = time.perf_counter() - started
+        imported = len(state.imported_ids)
+        logger.info(
+            f"Imported {imported} of {state.records} invoices in {elapsed:.2f}s"
+        )
+
+        return InvoiceImportResult(
+            imported=imported,
+            failed=state.records - imported,
+            items_imported=state.items_imported,
+            invoice_ids=state.imported_ids,
+            errors=state.errors,
+            elapsed_seconds=round(elapsed, 3),
+            invoices_per_minute=round(imported / elapsed * 60, 1) if elapsed > 0 else 0.0
+        )
+
+    @staticmethod
+    def _fail_chunk(chunk_ids: List, state: _ImportState, error: str) -> None:
+        """Report every invoice of an unwritten chunk as failed and free its IDs."""
+        for line, invoice_id in chunk_ids:
+            state.existing_ids.discard(invoice_id)
+            state.errors.append(InvoiceImportError(
+                line=line,
+                invoice_id=invoice_id,
+                error=error
+            ))
+
+    def _import_chunk(self, chunk: List[ImportRecord], state: _ImportState) -> None:
+        """Validate one chunk and write it with one append per sheet."""
+        invoice_rows = []
+        item_rows = []
+        chunk_ids = []
+        created_at = datetime.now().isoformat()
+
+        state.records += len(chunk)
+
+        for record in chunk:
+            if record.error:
+                state.errors.append(InvoiceImportError(line=record.line, error=record.error))
+                continue
+
+            raw_id = record.data.get("invoice_id")
+            try:
+                invoice_data = InvoiceImportRecord(**record.data)
+            except ValidationError as e:
+                state.errors.append(InvoiceImportError(
+                    line=record.line,
+                    invoice_id=raw_id,
+                    error="; ".join(
+                        f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}"
+                        for err in e.errors()
+                    )
+                ))
+                continue
+
+            # Allocate ID: custom IDs must be unique, others come from the block
+            if invoice_data.invoice_id:
+                if invoice_data.invoice_id in state.existing_ids:
+                    state.errors.append(InvoiceImportError(
+                        line=record.line,
+                        invoice_id=invoice_data.invoice_id,
+                        error=f"Invoice ID {invoice_data.invoice_id} already exists"
+                    ))
+                    continue
+                invoice_id = invoice_data.invoice_id
+            else:
+                invoice_id = state.allocate_id()
+            state.existing_ids.add(invoice_id)
+
+            subtotal, total_tax, total_discount, grand_total = (
+                self.invoice_service._calculate_totals(invoice_data.items)
+            )
+
+            client_name = (
+                invoice_data.client_name
+                or state.client_names.get(invoice_data.client_id)
+                or f"Client {invoice_data.client_id}"
+            )
+
+            invoice_rows.append({
+                "invoice_id": invoice_id,
+                "client_id": invoice_data.client_id,
+                "client_name": client_name,
+                "invoice_date": invoice_data.invoice_date.isoformat(),
+                "due_date": invoice_data.due_date.isoformat(),
+                "subtotal": str(subtotal),
+                "total_tax": str(total_tax),
+                "total_discount": str(total_discount),
+                "grand_total": str(grand_total),
+                "status": invoice_data.status,
+                "sales_person": invoice_data.sales_person,
+                "created_by": "Import",
+                "created_at": created_at,
+                "updated_at": created_at
+            })
+
+            for item_data in invoice_data.items:
+                item_row, _ = self.invoice_service._build_item_row(invoice_id, item_data)
+                item_rows.append(item_row)
+
+            chunk_ids.append((record.line, invoice_id))
+
+        if not invoice_rows:
+            return
+
+        try:
+            written = self.sheets.append_rows("Invoices", invoice_rows, state.invoice_headers)
+        except Exception as e:
+            logger.error(f"Error writing import chunk: {e}")
+            self._fail_chunk(chunk_ids, state, f"Failed to write invoice: {e}")
+            return
+
+        # append_rows writes nothing (and returns 0) when the sheet has no headers
+        if written != len(invoice_rows):
+            logger.error(f"Wrote {written} of {len(invoice_rows)} invoices in import chunk")
+            self._fail_chunk(chunk_ids, state, "Failed to write invoice: Invoices sheet has no headers")
+            return
+
+        try:
+            items_written = self.sheets.append_rows(
+                "Invoice_Items", item_rows, state.item_headers
+            )
+        except Exception as e:
+            items_written = 0
+            item_error = str(e)
+        else:
+            item_error = "Invoice_Items sheet has no headers"
+        state.items_imported += items_written
+
+        if items_written != len(item_rows):
+            # Invoices without their items count as failed; their rows are
+            # in the sheet, so the IDs stay taken and are reported per invoice
+            logger.error(f"Error writing import chunk items: {item_error}")
+            for line, invoice_id in chunk_ids:
+                state.errors.append(InvoiceImportError(
+                    line=line,
+                    invoice_id=invoice_id,
+                    error=f"Invoice written but items failed: {item_error}"
+                ))
+            return
+
+        state.imported_ids.extend(invoice_id for _, invoice_id in chunk_ids)
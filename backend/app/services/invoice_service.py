@@ -3,18 +3,21 @@ Invoice Service - Business logic for invoice management.
 Handles invoice creation, retrieval, calculations, and Google Sheets integration.
 """
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime, date
 import logging
 import uuid
 
 from app.services.sheets_service import SheetsService
+from app.services.invoice_table import InvoiceTable
+from app.services.revenue_rollup import parse_date
 from app.schemas.invoice import (
     InvoiceCreate,
     InvoiceResponse,
     InvoiceItemResponse,
-    InvoiceStatusUpdate
+    InvoiceStatusUpdate,
+    InvoiceBulkStatusItem
 )
 
 logger = logging.getLogger(__name__)
@@ -23,14 +26,51 @@ logger = logging.getLogger(__name__)
 class InvoiceService:
     """Service for invoice business logic."""
     
-    def __init__(self, sheets_service: SheetsService):
+    def __init__(
+        self,
+        sheets_service: SheetsService,
+        invoice_table: Optional[InvoiceTable] = None
+    ):
         """
         Initialize invoice service.
         
         Args:
             sheets_service: Google Sheets service instance
+            invoice_table: Cached Invoices table for listing and date-range
+                filters (reads the sheet directly when None)
         """
         self.sheets = sheets_service
+        self.invoice_table = invoice_table
+    
+    def _invoice_rows(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[Dict]:
+        """
+        Invoice rows in sheet order, optionally within an invoice_date range.
+        
+        With a cached table the range is a bisect over its date-sorted
+        permutation; otherwise every row is read and its date parsed.
+        """
+        if self.invoice_table is not None:
+            return self.invoice_table.rows_in_range(start_date, end_date)
+        
+        rows = self.sheets.get_all_rows("Invoices")
+        if not (start_date or end_date):
+            return rows
+        
+        filtered = []
+        for row in rows:
+            invoice_date = parse_date(row.get("invoice_date", ""))
+            if invoice_date is None:
+                continue
+            if start_date and invoice_date < start_date:
+                continue
+            if end_date and invoice_date > end_date:
+                continue
+            filtered.append(row)
+        return filtered
     
     def create_invoice(self, invoice_data: InvoiceCreate) -> InvoiceResponse:
         """
@@ -103,25 +143,8 @@ class InvoiceService:
         # Save invoice items
         item_responses = []
         for item_data in invoice_data.items:
-            item_id = str(uuid.uuid4())[:8]
-            
-            # Calculate line total
-            line_subtotal = Decimal(item_data.quantity) * item_data.unit_price
-            line_tax = line_subtotal * (item_data.tax_percent / 100)
-            line_discount = line_subtotal * (item_data.discount_percent / 100)
-            line_total = line_subtotal + line_tax - line_discount
-            
-            item_row = {
-                "item_id": item_id,
-                "invoice_id": invoice_id,
-                "service": item_data.service,
-                "description": item_data.description,
-                "quantity": str(item_data.quantity),
-                "unit_price": str(item_data.unit_price),
-                "tax_percent": str(item_data.tax_percent),
-                "discount_percent": str(item_data.discount_percent),
-                "line_total": str(line_total)
-            }
+            item_row, line_total = self._build_item_row(invoice_id, item_data)
+            item_id = item_row["item_id"]
             
             self.sheets.append_row("Invoice_Items", item_row)
             
@@ -178,6 +201,71 @@ class InvoiceService:
             if item.get("invoice_id") == invoice_id
         ]
         
+        return self._build_invoice_response(invoice, invoice_items)
+    
+    def get_invoices(
+        self,
+        invoice_ids: Optional[List[str]] = None,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[InvoiceResponse]:
+        """
+        Get many invoices with items using one read per sheet.
+        
+        Args:
+            invoice_ids: Invoice IDs to fetch (unknown IDs are skipped)
+            status: Filter by status
+            start_date: Earliest invoice_date (inclusive)
+            end_date: Latest invoice_date (inclusive)
+            
+        Returns:
+            Invoice responses, in the order of invoice_ids when given,
+            otherwise in sheet order
+        """
+        wanted = set(invoice_ids) if invoice_ids is not None else None
+        
+        invoices = {}
+        for invoice in self._invoice_rows(start_date, end_date):
+            invoice_id = invoice.get("invoice_id")
+            if not invoice_id or (wanted is not None and invoice_id not in wanted):
+                continue
+            if status and invoice.get("status") != status:
+                continue
+            invoices[invoice_id] = invoice
+        
+        items_by_invoice = {}
+        for item in self.sheets.get_all_rows("Invoice_Items"):
+            if item.get("invoice_id") in invoices:
+                items_by_invoice.setdefault(item.get("invoice_id"), []).append(item)
+        
+        responses = []
+        for invoice_id in (invoice_ids if invoice_ids is not None else invoices):
+            invoice = invoices.get(invoice_id)
+            if not invoice:
+                continue
+            try:
+                responses.append(self._build_invoice_response(
+                    invoice,
+                    items_by_invoice.get(invoice_id, [])
+                ))
+            except Exception as e:
+                logger.error(f"Error parsing invoice {invoice_id}: {e}")
+                continue
+        
+        return responses
+    
+    def _build_invoice_response(self, invoice: Dict, invoice_items: List[Dict]) -> InvoiceResponse:
+        """
+        Build a full invoice response from sheet rows.
+        
+        Args:
+            invoice: Invoices sheet row
+            invoice_items: Invoice_Items rows belonging to the invoice
+            
+        Returns:
+            Invoice response with items
+        """
         # Build item responses
         item_responses = []
         for item in invoice_items:
@@ -213,27 +301,34 @@ class InvoiceService:
             created_at=created_at
         )
     
-    def list_invoices(
+    def list_invoice_rows(
         self,
         status: Optional[str] = None,
         client_id: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
-    ) -> Tuple[List[InvoiceResponse], int]:
+        offset: int = 0,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Tuple[List[Dict], int]:
         """
-        List invoices with optional filtering.
+        List raw invoice rows with optional filtering.
+        
+        Used by the fast serialization path, which converts rows
+        directly to JSON without building response models.
         
         Args:
             status: Filter by status
             client_id: Filter by client
             limit: Max results to return
             offset: Number of results to skip
+            start_date: Earliest invoice_date (inclusive)
+            end_date: Latest invoice_date (inclusive)
             
         Returns:
-            Tuple of (list of invoices, total count)
+            Tuple of (list of invoice rows, total count)
         """
-        # Get all invoices
-        all_invoices = self.sheets.get_all_rows("Invoices")
+        # Get invoices (only the date range when given)
+        all_invoices = self._invoice_rows(start_date, end_date)
         
         # Apply filters
         filtered_invoices = all_invoices
@@ -253,7 +348,33 @@ class InvoiceService:
         total = len(filtered_invoices)
         
         # Apply pagination
-        paginated_invoices = filtered_invoices[offset:offset + limit]
+        return filtered_invoices[offset:offset + limit], total
+    
+    def list_invoices(
+        self,
+        status: Optional[str] = None,
+        client_id: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> Tuple[List[InvoiceResponse], int]:
+        """
+        List invoices with optional filtering.
+        
+        Args:
+            status: Filter by status
+            client_id: Filter by client
+            limit: Max results to return
+            offset: Number of results to skip
+            
+        Returns:
+            Tuple of (list of invoices, total count)
+        """
+        paginated_invoices, total = self.list_invoice_rows(
+            status=status,
+            client_id=client_id,
+            limit=limit,
+            offset=offset
+        )
         
         # Build responses (without items for list view)
         responses = []
@@ -284,33 +405,77 @@ class InvoiceService:
         
         return responses, total
     
-    def update_status(self, invoice_id: str, status_update: InvoiceStatusUpdate) -> bool:
+    def update_status(self, invoice_id: str, status_update: InvoiceStatusUpdate) -> Optional[Dict]:
         """
         Update invoice status.
         
+        With a cached table its row number lets the write skip the
+        full-sheet lookup; the table itself is patched by the row listener.
+        
         Args:
             invoice_id: Invoice ID
             status_update: Status update data
             
         Returns:
-            True if successful
+            The invoice row as written, or None if not found
         """
         updated_at = datetime.now().isoformat()
         
-        success = self.sheets.update_row(
+        invoice_row = self.sheets.update_row(
             "Invoices",
             "invoice_id",
             invoice_id,
             {
                 "status": status_update.status,
                 "updated_at": updated_at
-            }
+            },
+            row_number=self.invoice_table.row_number(invoice_id) if self.invoice_table is not None else None
         )
         
-        if success:
+        if invoice_row is not None:
             logger.info(f"Updated invoice {invoice_id} status to {status_update.status}")
         
-        return success
+        return invoice_row
+    
+    def bulk_update_status(self, updates: List[InvoiceBulkStatusItem]) -> List[Dict]:
+        """
+        Update the status of many invoices with one read and one write.
+        
+        Args:
+            updates: Per-invoice status changes (last one wins for duplicate IDs)
+            
+        Returns:
+            Per-invoice results with success flag and error message
+        """
+        updated_at = datetime.now().isoformat()
+        
+        patches = {
+            item.invoice_id: {
+                "status": item.status,
+                "updated_at": updated_at
+            }
+            for item in updates
+        }
+        
+        rows = self.sheets.batch_update_rows("Invoices", "invoice_id", patches)
+        
+        results = []
+        for invoice_id, patch in patches.items():
+            if rows.get(invoice_id) is None:
+                results.append({
+                    "invoice_id": invoice_id,
+                    "success": False,
+                    "error": f"Invoice {invoice_id} not found"
+                })
+            else:
+                results.append({
+                    "invoice_id": invoice_id,
+                    "success": True,
+                    "status": patch["status"]
+                })
+        
+        logger.info(f"Bulk updated status of {len(patches)} invoices")
+        return results
     
     def _calculate_totals(
         self,
@@ -343,6 +508,39 @@ class InvoiceService:
         
         return subtotal, total_tax, total_discount, grand_total
     
+    def _build_item_row(self, invoice_id: str, item_data) -> Tuple[Dict, Decimal]:
+        """
+        Build an Invoice_Items row for one line item.
+        
+        Args:
+            invoice_id: Parent invoice ID
+            item_data: Invoice item creation data
+            
+        Returns:
+            Tuple of (item row, line total)
+        """
+        item_id = str(uuid.uuid4())[:8]
+        
+        # Calculate line total
+        line_subtotal = Decimal(item_data.quantity) * item_data.unit_price
+        line_tax = line_subtotal * (item_data.tax_percent / 100)
+        line_discount = line_subtotal * (item_data.discount_percent / 100)
+        line_total = line_subtotal + line_tax - line_discount
+        
+        item_row = {
+            "item_id": item_id,
+            "invoice_id": invoice_id,
+            "service": item_data.service,
+            "description": item_data.description,
+            "quantity": str(item_data.quantity),
+            "unit_price": str(item_data.unit_price),
+            "tax_percent": str(item_data.tax_percent),
+            "discount_percent": str(item_data.discount_percent),
+            "line_total": str(line_total)
+        }
+        
+        return item_row, line_total
+    
     def _generate_invoice_id(self) -> str:
         """
         Generate unique invoice ID in format INV-YYYY-XXX.
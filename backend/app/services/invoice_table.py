@@ -0,0 +1,174 @@
+"""
+Invoice Table - Cached Invoices sheet with a date-sorted permutation.
+Rows stay in sheet order; a parallel sorted list of (invoice_date, row)
+lets date-range filters bisect straight to the matching slice instead
+of parsing every invoice date.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from datetime import date
+import bisect
+import logging
+import time
+
+from app.services.sheets_service import SheetsService, RowChange, add_row_listener
+from app.services.revenue_rollup import parse_date
+
+logger = logging.getLogger(__name__)
+
+# Sort key of a dated row: (ISO invoice date, row position)
+DateKey = Tuple[str, int]
+
+
+class InvoiceTable:
+    """In-memory Invoices sheet kept current from invoice writes."""
+
+    def __init__(self, sheets_service: SheetsService, ttl_seconds: int = 0):
+        """
+        Initialize table and subscribe to invoice writes.
+
+        Args:
+            sheets_service: Google Sheets service instance
+            ttl_seconds: Reload from the sheet when older than this, to pick
+                up edits made directly in Google Sheets (0 = never)
+        """
+        self.sheets = sheets_service
+        self.ttl_seconds = ttl_seconds
+
+        # Invoice rows in sheet order (blank invoice IDs skipped)
+        self.rows: List[Dict] = []
+        self._positions: Dict[str, int] = {}
+        # Sheet row numbers as of the last load (write hints; appends unknown)
+        self._row_numbers: Dict[str, int] = {}
+        # Rows with a valid invoice_date, sorted by date then sheet order
+        self._date_keys: List[DateKey] = []
+
+        self._loaded_at: Optional[float] = None
+        # Bumped when a load finds different rows, and on every change
+        # (for ETags); TTL reloads of an unchanged sheet keep it
+        self.version = 0
+        add_row_listener(self._on_row_change)
+
+    @staticmethod
+    def _date_key(row: Dict) -> Optional[str]:
+        """Normalized ISO invoice date of a row, None when missing or invalid."""
+        day = parse_date(row.get("invoice_date", ""))
+        return day.isoformat() if day else None
+
+    def load(self) -> None:
+        """Load all invoices with one read and sort them by date once."""
+        previous_rows = self.rows
+        self.rows = []
+        self._positions = {}
+        self._row_numbers = {}
+        date_keys = []
+
+        # Row 1 is headers
+        for row_number, row in enumerate(self.sheets.get_all_rows("Invoices"), start=2):
+            invoice_id = row.get("invoice_id")
+            if not invoice_id:
+                continue
+            position = len(self.rows)
+            self.rows.append(row)
+            self._positions[invoice_id] = position
+            self._row_numbers.setdefault(invoice_id, row_number)
+            day = self._date_key(row)
+            if day:
+                date_keys.append((day, position))
+
+        date_keys.sort()
+        self._date_keys = date_keys
+        if self._loaded_at is None or self.rows != previous_rows:
+            self.version += 1
+        self._loaded_at = time.monotonic()
+        logger.info(f"Loaded invoice table with {len(self.rows)} invoices")
+
+    def ensure_loaded(self) -> None:
+        """Load on first use and when the TTL has expired."""
+        if self._loaded_at is None or (
+            self.ttl_seconds > 0
+            and time.monotonic() - self._loaded_at > self.ttl_seconds
+        ):
+            self.load()
+
+    def _remove_date_key(self, row: Dict, position: int) -> None:
+        day = self._date_key(row)
+        if day:
+            index = bisect.bisect_left(self._date_keys, (day, position))
+            if index < len(self._date_keys) and self._date_keys[index] == (day, position):
+                self._date_keys.pop(index)
+
+    def _add_date_key(self, row: Dict, position: int) -> None:
+        day = self._date_key(row)
+        if day:
+            bisect.insort(self._date_keys, (day, position))
+
+    def _on_row_change(self, sheet_name: str, changes: List[RowChange]) -> None:
+        """Apply invoice writes made by the app to the table."""
+        if sheet_name != "Invoices" or self._loaded_at is None:
+            return
+
+        for before, after in changes:
+            invoice_id = (after or before or {}).get("invoice_id")
+            position = self._positions.get(invoice_id) if invoice_id else None
+
+            if after is None or (before and before.get("invoice_id") != after.get("invoice_id")):
+                # Deletes (and ID changes) shift row positions; reload on next use
+                self._loaded_at = None
+                self.version += 1
+                return
+
+            if position is None:
+                position = len(self.rows)
+                self.rows.append(after)
+                self._positions[invoice_id] = position
+            else:
+                self._remove_date_key(self.rows[position], position)
+                self.rows[position] = after
+            self._add_date_key(after, position)
+        self.version += 1
+
+    def all_rows(self) -> List[Dict]:
+        """All invoice rows in sheet order."""
+        self.ensure_loaded()
+        return self.rows
+
+    def get(self, invoice_id: str) -> Optional[Dict]:
+        """Invoice row by ID."""
+        self.ensure_loaded()
+        position = self._positions.get(invoice_id)
+        return self.rows[position] if position is not None else None
+
+    def row_number(self, invoice_id: str) -> Optional[int]:
+        """Sheet row of an invoice as of the last load, None when unknown."""
+        return self._row_numbers.get(invoice_id) if self._loaded_at is not None else None
+
+    def rows_in_range(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> List[Dict]:
+        """
+        Invoices dated within [start, end], in sheet order.
+
+        Costs two binary searches plus the matching rows; invoices
+        without a valid invoice_date never match a range.
+
+        Args:
+            start: First invoice date (inclusive), None for unbounded
+            end: Last invoice date (inclusive), None for unbounded
+
+        Returns:
+            Matching invoice rows
+        """
+        self.ensure_loaded()
+        if start is None and end is None:
+            return list(self.rows)
+
+        lo = bisect.bisect_left(self._date_keys, (start.isoformat(), -1)) if start else 0
+        hi = (
+            bisect.bisect_right(self._date_keys, (end.isoformat(), len(self.rows)))
+            if end else len(self._date_keys)
+        )
+        positions = sorted(position for _, position in self._date_keys[lo:hi])
+        return [self.rows[position] for position in positions]
@@ -0,0 +1,194 @@
+"""
+Leaderboards - Incrementally maintained client and salesperson rankings.
+Each board keeps entities sorted by revenue (all time and rolling 7/30/90
+day windows), updated from revenue rollup changes, so the top N or any
+page of the ranking is a slice instead of a full sort per request.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from datetime import date, timedelta
+from decimal import Decimal
+import bisect
+import logging
+
+from app.services.revenue_rollup import CellKey, RevenueRollupStore, RollupCell
+
+logger = logging.getLogger(__name__)
+
+LEADERBOARD_DIMENSIONS = ("clients", "salespeople")
+# Window name -> days ending today (None = all time)
+LEADERBOARD_WINDOWS: Dict[str, Optional[int]] = {
+    "all": None,
+    "7d": 7,
+    "30d": 30,
+    "90d": 90,
+}
+
+
+class Leaderboard:
+    """Entities ranked by revenue, highest first (ties in first-appearance order)."""
+
+    def __init__(self):
+        self.revenue: Dict[str, Decimal] = {}
+        self.count: Dict[str, int] = {}
+        # Order each entity first appeared in (breaks revenue ties, as a
+        # stable top-N over the same totals would)
+        self._seq: Dict[str, int] = {}
+        self._next_seq = 0
+        # Sorted (-revenue, first-appearance order, entity)
+        self._ranked: List[Tuple[Decimal, int, str]] = []
+
+    @classmethod
+    def from_totals(cls, revenue: Dict[str, Decimal], count: Dict[str, int]) -> "Leaderboard":
+        """Build with one sort; ties keep the totals' insertion order."""
+        board = cls()
+        board.revenue = {entity: revenue[entity] for entity in revenue if count[entity] > 0}
+        board.count = {entity: count[entity] for entity in board.revenue}
+        board._seq = {entity: seq for seq, entity in enumerate(board.revenue)}
+        board._next_seq = len(board._seq)
+        board._ranked = sorted(
+            (-total, board._seq[entity], entity) for entity, total in board.revenue.items()
+        )
+        return board
+
+    def add(self, entity: str, revenue: Decimal, count: int) -> None:
+        """Add (or, with negative values, remove) invoices for an entity."""
+        old = self.revenue.get(entity)
+        if old is not None:
+            index = bisect.bisect_left(self._ranked, (-old, self._seq[entity], entity))
+            del self._ranked[index]
+
+        new_count = self.count.get(entity, 0) + count
+        if new_count <= 0:
+            self.revenue.pop(entity, None)
+            self.count.pop(entity, None)
+            self._seq.pop(entity, None)
+            return
+
+        if old is None:
+            self._seq[entity] = self._next_seq
+            self._next_seq += 1
+        new = (old or Decimal(0)) + revenue
+        self.revenue[entity] = new
+        self.count[entity] = new_count
+        bisect.insort(self._ranked, (-new, self._seq[entity], entity))
+
+    def __len__(self) -> int:
+        return len(self._ranked)
+
+    def page(self, limit: int, offset: int = 0) -> List[Tuple[str, Decimal, int]]:
+        """(entity, revenue, invoice count) for ranks offset+1 .. offset+limit."""
+        return [
+            (entity, self.revenue[entity], self.count[entity])
+            for _, _, entity in self._ranked[offset:offset + limit]
+        ]
+
+
+class LeaderboardStore:
+    """Client and salesperson leaderboards over the revenue rollups."""
+
+    def __init__(self, rollups: RevenueRollupStore):
+        """
+        Initialize leaderboards over a rollup store.
+
+        Built on first use and after a full rollup rebuild, updated per
+        incremental rollup change; rolling windows are rebuilt from the
+        rollups (cost proportional to the days in the window) when the
+        date changes.
+
+        Args:
+            rollups: Rollup store to rank
+        """
+        self.rollups = rollups
+        self._generation: Optional[int] = None
+        self._today: Optional[date] = None
+        # (dimension, window) -> board
+        self.boards: Dict[Tuple[str, str], Leaderboard] = {}
+        rollups.add_cell_listener(self._on_cell_change)
+
+    @staticmethod
+    def _entities(key: CellKey) -> Dict[str, str]:
+        """Entity of each dimension for a rollup key (blank clients are not ranked)."""
+        status, client_id, sales_person = key
+        entities = {"salespeople": sales_person}
+        if client_id:
+            entities["clients"] = client_id
+        return entities
+
+    def _window_start(self, window: str) -> Optional[date]:
+        days = LEADERBOARD_WINDOWS[window]
+        return self._today - timedelta(days=days - 1) if days else None
+
+    def _build_window(self, window: str) -> None:
+        """Build both dimensions of one window from the rollups."""
+        start = self._window_start(window)
+        end = self._today if start else None
+
+        totals = {
+            dimension: ({}, {}) for dimension in LEADERBOARD_DIMENSIONS
+        }
+        for day, key, cell in self.rollups.iter_cells(start, end):
+            for dimension, entity in self._entities(key).items():
+                revenue, count = totals[dimension]
+                revenue[entity] = revenue.get(entity, Decimal(0)) + cell.grand_total
+                count[entity] = count.get(entity, 0) + cell.count
+
+        for dimension, (revenue, count) in totals.items():
+            self.boards[(dimension, window)] = Leaderboard.from_totals(revenue, count)
+
+    def _ensure_built(self) -> None:
+        self.rollups.ensure_loaded()
+        today = date.today()
+
+        if self._generation != self.rollups.generation:
+            self._today = today
+            for window in LEADERBOARD_WINDOWS:
+                self._build_window(window)
+            self._generation = self.rollups.generation
+            logger.info("Built client and salesperson leaderboards")
+        elif self._today != today:
+            # Days rolled out of (and into) the rolling windows
+            self._today = today
+            for window, days in LEADERBOARD_WINDOWS.items():
+                if days:
+                    self._build_window(window)
+
+    def _on_cell_change(
+        self,
+        day: Optional[date],
+        key: CellKey,
+        cell: Optional[RollupCell],
+        delta: RollupCell
+    ) -> None:
+        """Apply one incremental rollup change to every board it falls in."""
+        if self._generation != self.rollups.generation:
+            return
+
+        for window in LEADERBOARD_WINDOWS:
+            start = self._window_start(window)
+            if start and (day is None or not start <= day <= self._today):
+                continue
+            for dimension, entity in self._entities(key).items():
+                self.boards[(dimension, window)].add(entity, delta.grand_total, delta.count)
+
+    def get(self, dimension: str, window: str = "all") -> Leaderboard:
+        """
+        Current leaderboard.
+
+        Args:
+            dimension: "clients" or "salespeople"
+            window: "all", "7d", "30d" or "90d"
+
+        Returns:
+            Leaderboard (read-only)
+
+        Raises:
+            ValueError: Unknown dimension or window
+        """
+        if dimension not in LEADERBOARD_DIMENSIONS:
+            raise ValueError(f"board must be one of: {', '.join(LEADERBOARD_DIMENSIONS)}")
+        if window not in LEADERBOARD_WINDOWS:
+            raise ValueError(f"window must be one of: {', '.join(LEADERBOARD_WINDOWS)}")
+
+        self._ensure_built()
+        return self.boards[(dimension, window)]
@@ -0,0 +1,202 @@
+"""
+Overdue Sweeper - Flips unpaid invoices past their due date to overdue.
+Keeps a due-date min-heap so each run only touches invoices whose
+due date crossed since the last run.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime
+import asyncio
+import heapq
+import logging
+import threading
+
+from app.services.sheets_service import SheetsService, RowChange, add_row_listener
+from app.services.activity_service import ActivityService
+
+logger = logging.getLogger(__name__)
+
+# Statuses that become overdue once the due date has passed
+SWEEPABLE_STATUSES = {"pending"}
+
+
+class OverdueSweeper:
+    """Incremental overdue-invoice sweeper."""
+
+    def __init__(
+        self,
+        sheets_service: SheetsService,
+        activity_service: Optional[ActivityService] = None
+    ):
+        """
+        Initialize sweeper.
+
+        Args:
+            sheets_service: Google Sheets service instance
+            activity_service: Optional activity log for swept batches
+        """
+        self.sheets = sheets_service
+        self.activity_service = activity_service
+
+        # Heap of (due_date, invoice_id); stale entries are skipped lazily
+        self._heap: List[Tuple[date, str]] = []
+        # Current due date of every sweepable invoice
+        self._due: Dict[str, date] = {}
+        self._loaded = False
+        # Sweeps run in a worker thread while app writes update the heap
+        self._lock = threading.Lock()
+        # Invoice writes seen while the initial read is in flight
+        self._pending: Optional[List[RowChange]] = None
+        self._task: Optional[asyncio.Task] = None
+
+        add_row_listener(self._on_row_change)
+
+    def _parse_date(self, date_str: str) -> Optional[date]:
+        """Safely parse date string."""
+        if not date_str:
+            return None
+        try:
+            return datetime.fromisoformat(date_str).date()
+        except (ValueError, TypeError):
+            return None
+
+    def _track(self, row: Dict) -> None:
+        """Add, move or drop one invoice in the heap based on its row."""
+        invoice_id = row.get("invoice_id", "")
+        if not invoice_id:
+            return
+
+        due = self._parse_date(row.get("due_date", ""))
+        if row.get("status", "").lower() in SWEEPABLE_STATUSES and due:
+            if self._due.get(invoice_id) != due:
+                self._due[invoice_id] = due
+                heapq.heappush(self._heap, (due, invoice_id))
+        else:
+            self._due.pop(invoice_id, None)
+
+    def _load(self) -> None:
+        """Build the heap with one read of the Invoices sheet."""
+        with self._lock:
+            self._pending = []
+        try:
+            rows = self.sheets.get_all_rows("Invoices")
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            self._heap = []
+            self._due = {}
+            for row in rows:
+                self._track(row)
+            # Writes made during the read may not be in it
+            self._apply(self._pending)
+            self._pending = None
+            self._loaded = True
+        logger.info(f"Overdue sweeper tracking {len(self._due)} unpaid invoices")
+
+    def _apply(self, changes: List[RowChange]) -> None:
+        for before, after in changes:
+            if after is None:
+                self._due.pop(before.get("invoice_id", ""), None)
+            else:
+                self._track(after)
+
+    def _on_row_change(self, sheet_name: str, changes: List[RowChange]) -> None:
+        """Keep the heap current with invoice writes made by the app."""
+        if sheet_name != "Invoices":
+            return
+        with self._lock:
+            if self._pending is not None:
+                self._pending.extend(changes)
+            elif self._loaded:
+                self._apply(changes)
+
+    def sweep(self, today: Optional[date] = None) -> List[str]:
+        """
+        Mark invoices whose due date has passed as overdue.
+
+        Args:
+            today: Reference date (defaults to today)
+
+        Returns:
+            IDs of invoices flipped to overdue
+        """
+        today = today or date.today()
+
+        if not self._loaded:
+            self._load()
+
+        # Pop only the entries that crossed their due date
+        due_ids = []
+        with self._lock:
+            while self._heap and self._heap[0][0] < today:
+                due, invoice_id = heapq.heappop(self._heap)
+                if self._due.get(invoice_id) == due:
+                    due_ids.append(invoice_id)
+
+        if not due_ids:
+            return []
+
+        updated_at = datetime.now().isoformat()
+
+        def mark_overdue(row: Dict) -> Optional[Dict]:
+            # Re-check the live row; it may have been paid or edited by hand
+            due = self._parse_date(row.get("due_date", ""))
+            if row.get("status", "").lower() not in SWEEPABLE_STATUSES or not due or due >= today:
+                return None
+            return {"status": "overdue", "updated_at": updated_at}
+
+        rows = self.sheets.batch_update_rows(
+            "Invoices",
+            "invoice_id",
+            {invoice_id: mark_overdue for invoice_id in due_ids}
+        )
+
+        flipped = []
+        with self._lock:
+            for invoice_id in due_ids:
+                row = rows.get(invoice_id)
+                self._due.pop(invoice_id, None)
+                if row is None:
+                    continue
+                if row.get("status") == "overdue":
+                    flipped.append(invoice_id)
+                else:
+                    # Row changed outside the app; re-track with its live values
+                    self._track(row)
+
+        logger.info(f"Marked {len(flipped)} invoices overdue")
+
+        if flipped and self.activity_service:
+            self.activity_service.log_bulk_activity(
+                type="invoices_overdue",
+                title="Invoices Overdue",
+                entity_type="invoice",
+                entity_ids=flipped
+            )
+
+        return flipped
+
+    async def _run(self, interval_seconds: int) -> None:
+        """Sweep periodically until cancelled (in a worker thread, off the event loop)."""
+        while True:
+            try:
+                await asyncio.to_thread(self.sweep)
+            except Exception as e:
+                logger.error(f"Overdue sweep failed: {e}")
+            await asyncio.sleep(interval_seconds)
+
+    def start(self, interval_seconds: int) -> None:
+        """Start the background sweep loop (no-op if interval is 0)."""
+        if interval_seconds <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(interval_seconds))
+        logger.info(f"Overdue sweeper started (every {interval_seconds}s)")
+
+    def stop(self) -> None:
+        """Stop the background sweep loop."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,371 @@
+"""
+Invoice PDF Service - Server-side invoice PDF rendering.
+Renders in a process pool and caches output by a hash of the invoice
+content, so unchanged invoices are served without re-rendering. The
+cache is size-capped, evicting the least recently used PDFs.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import io
+import logging
+import os
+import zipfile
+from xml.sax.saxutils import escape
+
+import orjson
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import mm
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from app.schemas.invoice import InvoiceResponse
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout changes so cached PDFs are re-rendered
+PDF_LAYOUT_VERSION = "1"
+
+# Eviction trims the cache to this fraction of its cap, so it runs rarely
+CACHE_PRUNE_TARGET = 0.9
+
+# Company details (kept in line with src/utils/pdfGenerator.js)
+COMPANY_NAME = "N Company"
+COMPANY_ADDRESS = "123 Business Avenue, Tech Park, New Delhi, India - 110001"
+COMPANY_CONTACT = "Phone: +91-11-1234-5678 | Email: info@ncompany.com"
+COMPANY_GST = "GST: 07AAAAA0000A1Z5"
+
+PRIMARY_COLOR = colors.Color(99 / 255, 102 / 255, 241 / 255)
+
+
+def _money(value) -> str:
+    """Format an amount with two decimals and thousands separators."""
+    return f"Rs. {float(value):,.2f}"
+
+
+def render_invoice_pdf(invoice: Dict) -> bytes:
+    """
+    Render one invoice to PDF bytes.
+
+    Runs inside pool worker processes, so it only takes plain data.
+
+    Args:
+        invoice: JSON-mode dump of an InvoiceResponse
+
+    Returns:
+        PDF document bytes
+    """
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        leftMargin=15 * mm,
+        rightMargin=15 * mm,
+        topMargin=15 * mm,
+        bottomMargin=15 * mm,
+        title=f"Invoice {invoice['invoice_id']}"
+    )
+    styles = getSampleStyleSheet()
+    white = styles["Normal"].clone("White", textColor=colors.white, fontSize=9)
+    heading = styles["Title"].clone("HeaderTitle", textColor=colors.white, alignment=0)
+
+    header = Table(
+        [
+            [Paragraph(COMPANY_NAME, heading), Paragraph("INVOICE", heading)],
+            [Paragraph(f"{COMPANY_ADDRESS}<br/>{COMPANY_CONTACT}<br/>{COMPANY_GST}", white), ""]
+        ],
+        colWidths=[120 * mm, 60 * mm]
+    )
+    header.setStyle(TableStyle([
+        ("BACKGROUND", (0, 0), (-1, -1), PRIMARY_COLOR),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ]))
+
+    details = Table(
+        [
+            ["BILL TO:", "", "Invoice ID:", invoice["invoice_id"]],
+            [invoice["client_name"], "", "Invoice Date:", invoice["invoice_date"]],
+            [invoice["client_id"], "", "Due Date:", invoice["due_date"]],
+            ["", "", "Sales Person:", invoice["sales_person"]],
+            ["", "", "Status:", invoice["status"].upper()],
+        ],
+        colWidths=[75 * mm, 20 * mm, 30 * mm, 55 * mm]
+    )
+    details.setStyle(TableStyle([
+        ("FONTNAME", (0, 0), (0, 0), "Helvetica-Bold"),
+        ("FONTNAME", (2, 0), (2, -1), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 10),
+    ]))
+
+    rows = [["#", "Service", "Description", "Qty", "Unit Price", "Tax %", "Disc %", "Total"]]
+    for index, item in enumerate(invoice["items"], start=1):
+        rows.append([
+            str(index),
+            Paragraph(escape(item["service"]), styles["BodyText"]),
+            Paragraph(escape(item["description"]), styles["BodyText"]),
+            str(item["quantity"]),
+            _money(item["unit_price"]),
+            f"{float(item['tax_percent']):g}%",
+            f"{float(item['discount_percent']):g}%",
+            _money(item["line_total"]),
+        ])
+    items_table = Table(
+        rows,
+        colWidths=[8 * mm, 32 * mm, 48 * mm, 12 * mm, 26 * mm, 14 * mm, 14 * mm, 26 * mm],
+        repeatRows=1
+    )
+    items_table.setStyle(TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), PRIMARY_COLOR),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 8),
+        ("ALIGN", (3, 1), (-1, -1), "RIGHT"),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.lightgrey),
+    ]))
+
+    totals = Table(
+        [
+            ["Subtotal:", _money(invoice["subtotal"])],
+            ["Total Tax:", _money(invoice["total_tax"])],
+            ["Total Discount:", f"-{_money(invoice['total_discount'])}"],
+            ["GRAND TOTAL:", _money(invoice["grand_total"])],
+        ],
+        colWidths=[40 * mm, 40 * mm],
+        hAlign="RIGHT"
+    )
+    totals.setStyle(TableStyle([
+        ("ALIGN", (1, 0), (1, -1), "RIGHT"),
+        ("FONTNAME", (0, -1), (-1, -1), "Helvetica-Bold"),
+        ("LINEABOVE", (0, -1), (-1, -1), 1, PRIMARY_COLOR),
+    ]))
+
+    footer = styles["Normal"].clone("Footer", alignment=1, fontSize=8, textColor=colors.grey)
+
+    doc.build([
+        header,
+        Spacer(1, 8 * mm),
+        details,
+        Spacer(1, 8 * mm),
+        items_table,
+        Spacer(1, 6 * mm),
+        totals,
+        Spacer(1, 12 * mm),
+        Paragraph("Thank you for your business!", footer),
+        Paragraph("This is a computer-generated invoice and does not require a signature.", footer),
+    ])
+    return buffer.getvalue()
+
+
+def _pdf_filename(invoice_id: str) -> str:
+    """Safe file name for an invoice PDF."""
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in invoice_id) + ".pdf"
+
+
+class _ZipStream(io.RawIOBase):
+    """Write-only sink that hands written ZIP bytes back to the caller."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class InvoicePdfService:
+    """Service for rendering and caching invoice PDFs."""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_workers: Optional[int] = None,
+        max_cache_bytes: int = 0
+    ):
+        """
+        Initialize PDF service.
+
+        Args:
+            cache_dir: Directory for content-addressed PDF cache
+            max_workers: Render processes (defaults to CPU count)
+            max_cache_bytes: Cache size cap (0 = unbounded)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_workers = max_workers or None
+        self.max_cache_bytes = max_cache_bytes
+        # Cache size estimate; measured on the first write, then kept up to date
+        self._cache_bytes: Optional[int] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Create the render pool on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Stop render worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def content_key(self, invoice_data: Dict) -> str:
+        """Hash invoice content (and layout version) into a cache key."""
+        payload = orjson.dumps(
+            {"layout": PDF_LAYOUT_VERSION, "invoice": invoice_data},
+            option=orjson.OPT_SORT_KEYS
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def _cache_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pdf"
+
+    def _read_cache(self, key: str) -> Optional[bytes]:
+        path = self._cache_path(key)
+        try:
+            pdf = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        if self.max_cache_bytes:
+            # mtime doubles as last use for eviction
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return pdf
+
+    def _cached_files(self) -> List[Tuple[os.stat_result, str]]:
+        """(stat, path) of every cached PDF."""
+        files = []
+        if not self.cache_dir.is_dir():
+            return files
+        for subdir in os.scandir(self.cache_dir):
+            if not subdir.is_dir():
+                continue
+            for entry in os.scandir(subdir.path):
+                if entry.name.endswith(".pdf"):
+                    try:
+                        files.append((entry.stat(), entry.path))
+                    except FileNotFoundError:
+                        continue
+        return files
+
+    def _prune_cache(self) -> None:
+        """Delete least recently used PDFs until the cache is under its cap."""
+        files = self._cached_files()
+        total = sum(stat.st_size for stat, _ in files)
+        target = self.max_cache_bytes * CACHE_PRUNE_TARGET
+        removed = 0
+        if total > self.max_cache_bytes:
+            for stat, path in sorted(files, key=lambda item: item[0].st_mtime):
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= stat.st_size
+                removed += 1
+        self._cache_bytes = total
+        if removed:
+            logger.info(f"Evicted {removed} cached PDFs ({total // 1024} KiB left)")
+
+    def _write_cache(self, key: str, pdf: bytes) -> None:
+        path = self._cache_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so readers never see a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(pdf)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not cache PDF {key}: {e}")
+            return
+
+        if self.max_cache_bytes:
+            if self._cache_bytes is None:
+                self._prune_cache()
+            else:
+                self._cache_bytes += len(pdf)
+                if self._cache_bytes > self.max_cache_bytes:
+                    self._prune_cache()
+
+    async def render(self, invoice: InvoiceResponse) -> bytes:
+        """
+        Get the PDF for an invoice, rendering only on cache miss.
+
+        Args:
+            invoice: Invoice with items
+
+        Returns:
+            PDF document bytes
+        """
+        invoice_data = invoice.model_dump(mode="json")
+        key = self.content_key(invoice_data)
+
+        cached = self._read_cache(key)
+        if cached is not None:
+            logger.info(f"PDF cache hit for {invoice.invoice_id}")
+            return cached
+
+        loop = asyncio.get_running_loop()
+        pdf = await loop.run_in_executor(self._get_pool(), render_invoice_pdf, invoice_data)
+        self._write_cache(key, pdf)
+        logger.info(f"Rendered PDF for {invoice.invoice_id}")
+        return pdf
+
+    async def iter_zip(
+        self,
+        invoices: List[InvoiceResponse],
+        window: int = 16
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a ZIP archive of invoice PDFs.
+
+        Up to ``window`` invoices render concurrently; each PDF is added
+        to the archive in order and its bytes are yielded immediately.
+        Renders still queued when the stream fails or the client goes
+        away are cancelled.
+
+        Args:
+            invoices: Invoices with items
+            window: Max renders in flight
+
+        Yields:
+            Chunks of the ZIP archive
+        """
+        sink = _ZipStream()
+        pending = []
+
+        try:
+            with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as archive:
+                for invoice in invoices:
+                    pending.append((invoice.invoice_id, asyncio.ensure_future(self.render(invoice))))
+                    if len(pending) >= window:
+                        invoice_id, task = pending.pop(0)
+                        archive.writestr(_pdf_filename(invoice_id), await task)
+                        yield sink.drain()
+
+                while pending:
+                    invoice_id, task = pending.pop(0)
+                    archive.writestr(_pdf_filename(invoice_id), await task)
+                    yield sink.drain()
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+        # Central directory is written on close
+        yield sink.drain()
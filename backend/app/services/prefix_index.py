@@ -0,0 +1,128 @@
+"""
+Prefix Index - Sorted-array completions for typeahead.
+Field values are kept lowercased in sorted lists, once from their start
+and once from each later word, so the completions of a prefix are two
+binary searches plus the matching slice, whatever the number of rows.
+"""
+
+from typing import Dict, List, Tuple
+import bisect
+
+# (key, row ID)
+Entry = Tuple[str, str]
+# (0 for a match at the value's start, 1 at a later word; key, row ID)
+Completion = Tuple[int, str, str]
+
+
+def completion_keys(value) -> List[str]:
+    """Lowercased value from its first word, then from each later word."""
+    words = str(value or "").lower().split()
+    return [" ".join(words[start:]) for start in range(len(words))]
+
+
+def normalize_prefix(prefix: str) -> str:
+    """Lowercased prefix with single spaces, keeping one trailing space."""
+    normalized = " ".join(prefix.lower().split())
+    if normalized and prefix[-1:].isspace():
+        normalized += " "
+    return normalized
+
+
+def _insort_entries(keys: List[Entry], entries: List[Entry], sorted_insert: bool) -> None:
+    if sorted_insert:
+        for entry in entries:
+            bisect.insort(keys, entry)
+    else:
+        keys.extend(entries)
+
+
+def _remove_entries(keys: List[Entry], entries: List[Entry]) -> None:
+    for entry in entries:
+        index = bisect.bisect_left(keys, entry)
+        if index < len(keys) and keys[index] == entry:
+            keys.pop(index)
+
+
+class PrefixIndex:
+    """Sorted completion keys of some fields of rows keyed by ID."""
+
+    def __init__(self, fields: Tuple[str, ...]):
+        """
+        Initialize an empty index.
+
+        Args:
+            fields: Fields whose values are completed
+        """
+        self.fields = fields
+        self.clear()
+
+    def clear(self) -> None:
+        # Sorted keys of whole values, and of values from their second word on
+        self._starts: List[Entry] = []
+        self._words: List[Entry] = []
+        # row ID -> (its start entries, its later-word entries)
+        self._row_entries: Dict[str, Tuple[List[Entry], List[Entry]]] = {}
+
+    def add(self, row_id: str, row: Dict, sorted_insert: bool = True) -> None:
+        """
+        Add a row's completion keys.
+
+        Args:
+            row_id: Row ID
+            row: Row data
+            sorted_insert: Keep the lists sorted now; when False, call
+                sort() once after adding every row
+        """
+        starts: List[Entry] = []
+        words: List[Entry] = []
+        for field in self.fields:
+            keys = completion_keys(row.get(field))
+            if keys:
+                starts.append((keys[0], row_id))
+                words.extend((key, row_id) for key in keys[1:])
+        if not starts:
+            return
+        self._row_entries[row_id] = (starts, words)
+        _insort_entries(self._starts, starts, sorted_insert)
+        _insort_entries(self._words, words, sorted_insert)
+
+    def sort(self) -> None:
+        self._starts.sort()
+        self._words.sort()
+
+    def remove(self, row_id: str) -> None:
+        starts, words = self._row_entries.pop(row_id, ((), ()))
+        _remove_entries(self._starts, starts)
+        _remove_entries(self._words, words)
+
+    def complete(self, prefix: str, limit: int) -> List[Completion]:
+        """
+        Rows with a field value (or a later word of it) starting with prefix.
+
+        Matches at the start of a value come first, each group in
+        alphabetical order, so an exact value is always the first hit.
+
+        Args:
+            prefix: Typed text
+            limit: Maximum rows to return
+
+        Returns:
+            (match kind, matched key, row ID) of at most limit distinct rows
+        """
+        prefix = normalize_prefix(prefix)
+        if not prefix or limit <= 0:
+            return []
+
+        completions: List[Completion] = []
+        found = set()
+        for kind, keys in enumerate((self._starts, self._words)):
+            index = bisect.bisect_left(keys, (prefix, ""))
+            while index < len(keys) and len(completions) < limit:
+                key, row_id = keys[index]
+                if not key.startswith(prefix):
+                    break
+                if row_id not in found:
+                    found.add(row_id)
+                    completions.append((kind, key, row_id))
+                index += 1
+        return completions
@@ -0,0 +1,280 @@
+"""
+Revenue Time Index - Per-day cumulative revenue and invoice counts.
+Fenwick trees (updatable prefix sums) over one slot per calendar day,
+kept in total, per status and per salesperson. Any date range costs
+two O(log n) prefix lookups and a subtraction.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from datetime import date, timedelta
+from decimal import Decimal
+import logging
+
+from app.services.revenue_rollup import CellKey, RevenueRollupStore, RollupCell
+
+logger = logging.getLogger(__name__)
+
+GRANULARITIES = ("day", "week", "month", "quarter", "year")
+
+
+class PrefixSeries:
+    """Fenwick tree of (revenue, count) per day slot."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.revenue = [Decimal(0)] * (size + 1)
+        self.count = [0] * (size + 1)
+
+    @classmethod
+    def from_slots(cls, revenue: List[Decimal], count: List[int]) -> "PrefixSeries":
+        """Build in O(n) from per-slot totals."""
+        series = cls(len(revenue))
+        series.revenue[1:] = revenue
+        series.count[1:] = count
+        for i in range(1, series.size + 1):
+            parent = i + (i & -i)
+            if parent <= series.size:
+                series.revenue[parent] += series.revenue[i]
+                series.count[parent] += series.count[i]
+        return series
+
+    def add(self, slot: int, revenue: Decimal, count: int) -> None:
+        """Add to one day slot."""
+        i = slot + 1
+        while i <= self.size:
+            self.revenue[i] += revenue
+            self.count[i] += count
+            i += i & -i
+
+    def prefix(self, slot: int) -> Tuple[Decimal, int]:
+        """Totals of slots [0, slot)."""
+        revenue = Decimal(0)
+        count = 0
+        i = min(slot, self.size)
+        while i > 0:
+            revenue += self.revenue[i]
+            count += self.count[i]
+            i -= i & -i
+        return revenue, count
+
+
+def _period_start(day: date, granularity: str) -> date:
+    """First day of the period containing day."""
+    if granularity == "day":
+        return day
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    if granularity == "quarter":
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    return day.replace(month=1, day=1)
+
+
+def _shift_period(start: date, granularity: str, periods: int) -> date:
+    """Start of the period `periods` steps after (or before) start."""
+    if granularity == "day":
+        return start + timedelta(days=periods)
+    if granularity == "week":
+        return start + timedelta(weeks=periods)
+    months = {"month": 1, "quarter": 3, "year": 12}[granularity] * periods
+    index = start.year * 12 + start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _period_label(start: date, granularity: str) -> str:
+    """Display label for a period."""
+    if granularity == "month":
+        return start.strftime('%b %Y')
+    if granularity == "quarter":
+        return f"Q{(start.month - 1) // 3 + 1} {start.year}"
+    if granularity == "year":
+        return str(start.year)
+    return start.isoformat()
+
+
+class RevenueTimeIndex:
+    """Prefix-sum index over the dated revenue rollups."""
+
+    def __init__(self, rollups: RevenueRollupStore):
+        """
+        Initialize index over a rollup store.
+
+        Built on first use, updated in O(log n) per incremental rollup
+        change and rebuilt after a full rollup rebuild or when a write
+        lands outside the indexed day span.
+
+        Args:
+            rollups: Rollup store to index
+        """
+        self.rollups = rollups
+        self._generation: Optional[int] = None
+        self.first_day: Optional[date] = None
+        self.size = 0
+        self.total = PrefixSeries(0)
+        self.by_status: Dict[str, PrefixSeries] = {}
+        self.by_salesperson: Dict[str, PrefixSeries] = {}
+        rollups.add_cell_listener(self._on_cell_change)
+
+    def _build(self) -> None:
+        """Build all series from the rollup cells."""
+        days = self.rollups._sorted_days
+        self.first_day = days[0] if days else None
+        # Room for invoices dated up to a year past the newest day
+        self.size = (days[-1] - days[0]).days + 367 if days else 0
+
+        def empty() -> Tuple[List[Decimal], List[int]]:
+            return [Decimal(0)] * self.size, [0] * self.size
+
+        total = empty()
+        statuses: Dict[str, Tuple[List[Decimal], List[int]]] = {}
+        salespeople: Dict[str, Tuple[List[Decimal], List[int]]] = {}
+
+        for day, (status, client_id, sales_person), cell in self.rollups.iter_cells(dated_only=True):
+            slot = (day - self.first_day).days
+            if status.lower() not in statuses:
+                statuses[status.lower()] = empty()
+            if sales_person not in salespeople:
+                salespeople[sales_person] = empty()
+            for revenue, count in (total, statuses[status.lower()], salespeople[sales_person]):
+                revenue[slot] += cell.grand_total
+                count[slot] += cell.count
+
+        self.total = PrefixSeries.from_slots(*total)
+        self.by_status = {key: PrefixSeries.from_slots(*slots) for key, slots in statuses.items()}
+        self.by_salesperson = {key: PrefixSeries.from_slots(*slots) for key, slots in salespeople.items()}
+        self._generation = self.rollups.generation
+
+        logger.info(
+            f"Built revenue time index over {self.size} days, "
+            f"{len(self.by_status)} statuses, {len(self.by_salesperson)} salespeople"
+        )
+
+    def _on_cell_change(
+        self,
+        day: Optional[date],
+        key: CellKey,
+        cell: Optional[RollupCell],
+        delta: RollupCell
+    ) -> None:
+        """Apply one incremental rollup change in O(log n)."""
+        if self._generation != self.rollups.generation or day is None:
+            return
+
+        slot = (day - self.first_day).days if self.first_day else -1
+        if not 0 <= slot < self.size:
+            # Outside the indexed span; rebuild on next use
+            self._generation = None
+            return
+
+        status, client_id, sales_person = key
+        series = [self.total]
+        for index, name in ((self.by_status, status.lower()), (self.by_salesperson, sales_person)):
+            if name not in index:
+                index[name] = PrefixSeries(self.size)
+            series.append(index[name])
+
+        for tree in series:
+            tree.add(slot, delta.grand_total, delta.count)
+
+    def _ensure_built(self) -> None:
+        self.rollups.ensure_loaded()
+        if self._generation != self.rollups.generation:
+            self._build()
+
+    def _series(self, status: Optional[str], sales_person: Optional[str]) -> Optional[PrefixSeries]:
+        """Series for an optional status or salesperson filter."""
+        if status and sales_person:
+            raise ValueError("Filter by status or by salesperson, not both")
+        if status:
+            return self.by_status.get(status.lower())
+        if sales_person is not None:
+            return self.by_salesperson.get(sales_person)
+        return self.total
+
+    def _slot(self, day: date) -> int:
+        """Slot index of a day, clamped to [0, size]."""
+        return min(max((day - self.first_day).days, 0), self.size)
+
+    def range_totals(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        status: Optional[str] = None,
+        sales_person: Optional[str] = None
+    ) -> Tuple[Decimal, int]:
+        """
+        Revenue and invoice count for dated invoices in [start, end].
+
+        Args:
+            start: First day (inclusive), None for unbounded
+            end: Last day (inclusive), None for unbounded
+            status: Only invoices with this status
+            sales_person: Only invoices of this salesperson
+
+        Returns:
+            (revenue, count)
+        """
+        self._ensure_built()
+        series = self._series(status, sales_person)
+        if series is None or self.first_day is None:
+            return Decimal(0), 0
+        if start and end and start > end:
+            return Decimal(0), 0
+
+        lo = self._slot(start) if start else 0
+        hi = self._slot(end + timedelta(days=1)) if end else self.size
+        high_revenue, high_count = series.prefix(hi)
+        low_revenue, low_count = series.prefix(lo)
+        return high_revenue - low_revenue, high_count - low_count
+
+    def compare_periods(
+        self,
+        periods: int = 12,
+        granularity: str = "month",
+        end: Optional[date] = None,
+        status: Optional[str] = None,
+        sales_person: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Revenue for the last N calendar periods with period-over-period change.
+
+        Args:
+            periods: Number of periods to return
+            granularity: day, week, month, quarter or year
+            end: Day inside the last period (defaults to today)
+            status: Only invoices with this status
+            sales_person: Only invoices of this salesperson
+
+        Returns:
+            Oldest-first list of {period, start_date, end_date, revenue,
+            invoices, revenue_change, invoice_change}
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"granularity must be one of: {', '.join(GRANULARITIES)}")
+
+        last_start = _period_start(end or date.today(), granularity)
+        # One extra period so the oldest one has a comparison base
+        starts = [_shift_period(last_start, granularity, -i) for i in range(periods, -1, -1)]
+
+        totals = []
+        for period_start in starts:
+            period_end = _shift_period(period_start, granularity, 1) - timedelta(days=1)
+            revenue, count = self.range_totals(period_start, period_end, status, sales_person)
+            totals.append((period_start, period_end, revenue, count))
+
+        def change(current, previous) -> float:
+            return float((current - previous) / previous * 100) if previous > 0 else 0
+
+        results = []
+        for (_, _, prev_revenue, prev_count), (period_start, period_end, revenue, count) in zip(totals, totals[1:]):
+            results.append({
+                "period": _period_label(period_start, granularity),
+                "start_date": period_start.isoformat(),
+                "end_date": period_end.isoformat(),
+                "revenue": float(revenue),
+                "invoices": count,
+                "revenue_change": change(revenue, prev_revenue),
+                "invoice_change": change(count, prev_count),
+            })
+        return results
@@ -0,0 +1,315 @@
+"""
+Revenue Rollup Store - Materialized invoice aggregates for dashboards.
+Keeps count and amount sums per day x status x client x salesperson,
+built once from the Invoices sheet and updated from invoice writes.
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+import bisect
+import logging
+import threading
+import time
+
+from app.services.sheets_service import (
+    SheetsService, RowChange, add_row_listener, sheet_version
+)
+
+logger = logging.getLogger(__name__)
+
+# (status, client_id, sales_person)
+CellKey = Tuple[str, str, str]
+
+
+def parse_date(date_str: str) -> Optional[date]:
+    """Safely parse an ISO date string."""
+    if not date_str:
+        return None
+    try:
+        return datetime.fromisoformat(date_str).date()
+    except (ValueError, TypeError):
+        return None
+
+
+def safe_decimal(value) -> Decimal:
+    """Safely convert a cell value to Decimal (0 when blank or invalid)."""
+    try:
+        if value is None or value == '':
+            return Decimal(0)
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError, TypeError):
+        return Decimal(0)
+
+
+class RollupCell:
+    """Invoice count and amount sums for one rollup key."""
+
+    __slots__ = ("count", "grand_total", "total_tax", "total_discount")
+
+    def __init__(self):
+        self.count = 0
+        self.grand_total = Decimal(0)
+        self.total_tax = Decimal(0)
+        self.total_discount = Decimal(0)
+
+    def add(self, invoice: Dict, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) one invoice row."""
+        self.count += sign
+        self.grand_total += sign * safe_decimal(invoice.get('grand_total', 0))
+        self.total_tax += sign * safe_decimal(invoice.get('total_tax', 0))
+        self.total_discount += sign * safe_decimal(invoice.get('total_discount', 0))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RollupCell):
+            return NotImplemented
+        return (
+            self.count == other.count
+            and self.grand_total == other.grand_total
+            and self.total_tax == other.total_tax
+            and self.total_discount == other.total_discount
+        )
+
+    def merge(self, other: "RollupCell") -> None:
+        """Add another cell's counts and sums."""
+        self.count += other.count
+        self.grand_total += other.grand_total
+        self.total_tax += other.total_tax
+        self.total_discount += other.total_discount
+
+
+class RevenueRollupStore:
+    """
+    Per-day invoice rollups with incremental maintenance.
+
+    Rebuilds may run in worker threads while writes are applied on the event
+    loop. Everything that reads the rollups, or state derived from them
+    through cell listeners, holds `lock` for the whole read.
+    """
+
+    def __init__(self, sheets_service: SheetsService, ttl_seconds: int = 0):
+        """
+        Initialize rollup store and subscribe to invoice writes.
+
+        Args:
+            sheets_service: Google Sheets service instance
+            ttl_seconds: Rebuild from the sheet when older than this, to pick
+                up edits made directly in Google Sheets (0 = never)
+        """
+        self.sheets = sheets_service
+        self.ttl_seconds = ttl_seconds
+
+        # day -> key -> cell; invoices without a valid date live under None
+        self._days: Dict[Optional[date], Dict[CellKey, RollupCell]] = {}
+        # Sorted dated days, for range lookups
+        self._sorted_days: List[date] = []
+        self.client_names: Dict[str, str] = {}
+
+        self._loaded_at: Optional[float] = None
+        # Invoices sheet version as of the last read (see sheet_version)
+        self._sheet_version: Optional[int] = None
+        # Count of applied writes, so a rebuild can tell its read is stale
+        self._writes = 0
+        self.lock = threading.RLock()
+        # Bumped on every change, so derived views can tell they are stale
+        self.version = 0
+        # Bumped on every full rebuild
+        self.generation = 0
+        # Called with (day, key, cell, delta) after incremental changes;
+        # cell is None when the cell was removed
+        self._cell_listeners: List[Callable] = []
+
+        add_row_listener(self._on_row_change)
+
+    def add_cell_listener(self, listener: Callable) -> None:
+        """Register a callback for incremental cell changes (not rebuilds)."""
+        self._cell_listeners.append(listener)
+
+    def _apply(
+        self,
+        invoice: Dict,
+        sign: int,
+        notify: bool = True,
+        days: Optional[Dict] = None,
+        sorted_days: Optional[List[date]] = None,
+        client_names: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Add or remove one invoice row from its cell (in the live state by default)."""
+        if days is None:
+            days, sorted_days, client_names = self._days, self._sorted_days, self.client_names
+
+        day = parse_date(invoice.get('invoice_date', ''))
+        key = (
+            invoice.get('status', 'draft'),
+            invoice.get('client_id', ''),
+            invoice.get('sales_person', 'Unknown'),
+        )
+
+        cells = days.get(day)
+        if cells is None:
+            cells = days[day] = {}
+            if day is not None:
+                bisect.insort(sorted_days, day)
+
+        delta = RollupCell()
+        delta.add(invoice, sign)
+
+        cell = cells.get(key)
+        if cell is None:
+            cell = cells[key] = RollupCell()
+        cell.merge(delta)
+
+        if cell.count <= 0:
+            del cells[key]
+            if not cells:
+                del days[day]
+                if day is not None:
+                    sorted_days.pop(bisect.bisect_left(sorted_days, day))
+            cell = None
+
+        if notify:
+            for listener in self._cell_listeners:
+                listener(day, key, cell, delta)
+
+        # First invoice in sheet order names the client, as the dashboards
+        # did before rollups
+        if sign > 0 and key[1] and key[1] not in client_names:
+            client_names[key[1]] = invoice.get('client_name', key[1])
+
+    def _is_stale(self) -> bool:
+        return self._loaded_at is None or (
+            self.ttl_seconds > 0
+            and time.monotonic() - self._loaded_at > self.ttl_seconds
+        )
+
+    def _build(self, only_if_changed: bool) -> None:
+        """
+        Read the Invoices sheet into new rollups and swap them in.
+
+        The read and build run without the lock. If writes were applied
+        meanwhile, the read may or may not include them, so it is repeated
+        while holding the lock.
+        """
+        for retry in (False, True):
+            if retry:
+                self.lock.acquire()
+            try:
+                with self.lock:
+                    writes = self._writes
+                rows = self.sheets.get_all_rows("Invoices")
+                version = sheet_version("Invoices")
+
+                with self.lock:
+                    if (
+                        only_if_changed
+                        and self._writes == writes
+                        and self._loaded_at is not None
+                        and version is not None
+                        and version == self._sheet_version
+                    ):
+                        # Same content as the last read (no writes since)
+                        self._loaded_at = time.monotonic()
+                        return
+
+                days: Dict[Optional[date], Dict[CellKey, RollupCell]] = {}
+                sorted_days: List[date] = []
+                client_names: Dict[str, str] = {}
+                count = 0
+                for invoice in rows:
+                    if not invoice.get('invoice_id'):
+                        continue
+                    self._apply(invoice, 1, False, days, sorted_days, client_names)
+                    count += 1
+
+                with self.lock:
+                    if self._writes != writes:
+                        continue
+                    unchanged = (
+                        only_if_changed
+                        and self._loaded_at is not None
+                        and days == self._days
+                        and client_names == self.client_names
+                    )
+                    self._sheet_version = version
+                    self._loaded_at = time.monotonic()
+                    if unchanged:
+                        # Differences since the last read were app writes, already applied
+                        return
+                    self._days = days
+                    self._sorted_days = sorted_days
+                    self.client_names = client_names
+                    self.version += 1
+                    self.generation += 1
+            finally:
+                if retry:
+                    self.lock.release()
+
+            logger.info(f"Built revenue rollups from {count} invoices over {len(sorted_days)} days")
+            return
+
+    def rebuild(self) -> None:
+        """Rebuild all rollups with one read of the Invoices sheet."""
+        self._build(only_if_changed=False)
+
+    def refresh(self) -> None:
+        """
+        Re-read the Invoices sheet and rebuild only if the rollups changed.
+
+        Reads that match the current rollups (including app writes already
+        applied) keep the generation, so derived views and ETags stay valid.
+        """
+        self._build(only_if_changed=True)
+
+    def ensure_loaded(self) -> None:
+        """Build on first use, and refresh when the TTL has expired."""
+        if self._is_stale():
+            self.refresh()
+
+    def _on_row_change(self, sheet_name: str, changes: List[RowChange]) -> None:
+        """Apply invoice writes made by the app to the rollups."""
+        if sheet_name != "Invoices":
+            return
+        with self.lock:
+            self._writes += 1
+            if self._loaded_at is None:
+                return
+            for before, after in changes:
+                if before and before.get('invoice_id'):
+                    self._apply(before, -1)
+                if after and after.get('invoice_id'):
+                    self._apply(after, 1)
+            self.version += 1
+
+    def iter_cells(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        dated_only: bool = False
+    ) -> Iterator[Tuple[Optional[date], CellKey, RollupCell]]:
+        """
+        Iterate rollup cells for days in [start, end].
+
+        Cost is proportional to the days in range, not the invoices.
+        Callers hold `lock` while iterating.
+
+        Args:
+            start: First day (inclusive), None for unbounded
+            end: Last day (inclusive), None for unbounded
+            dated_only: Skip invoices without a valid invoice_date (always
+                skipped when a bound is given)
+
+        Yields:
+            (day, (status, client_id, sales_person), cell)
+        """
+        self.ensure_loaded()
+
+        lo = bisect.bisect_left(self._sorted_days, start) if start else 0
+        hi = bisect.bisect_right(self._sorted_days, end) if end else len(self._sorted_days)
+
+        for day in self._sorted_days[lo:hi]:
+            for key, cell in self._days[day].items():
+                yield day, key, cell
+
+        if not dated_only and start is None and end is None:
+            for key, cell in self._days.get(None, {}).items():
+                yield None, key, cell
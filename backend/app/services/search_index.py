@@ -0,0 +1,782 @@
+"""
+Search Index - Ranked in-memory inverted index over the CRM sheets.
+Rows are tokenized once when a sheet is loaded and re-indexed from app
+writes. Postings are kept per field weight in sheet order, so a query
+walks candidates from the highest possible score down with a top-K heap
+and stops as soon as nothing left can beat the current top K. Names,
+emails and ticket titles also have a trigram index for typo-tolerant
+matches, and client names and IDs, invoice IDs and ticket IDs a prefix
+index for typeahead suggestions.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import bisect
+import heapq
+import itertools
+import logging
+import re
+import threading
+import time
+
+from app.services.sheets_service import SheetsService, RowChange, add_row_listener
+from app.services.trigram_index import TrigramIndex
+from app.services.prefix_index import PrefixIndex
+
+logger = logging.getLogger(__name__)
+
+# Field kinds: "text" words, "email" adds the whole address, "phone" adds
+# every digit suffix so digit queries match anywhere in the number.
+# Weights rank IDs above names and titles, and those above descriptions.
+FieldSpec = Dict[str, Tuple[str, float]]
+
+# sheet -> (entity type, ID field, {field: (kind, weight)}), in tie-break order
+SEARCH_SOURCES: Dict[str, Tuple[str, str, FieldSpec]] = {
+    "Clients": ("client", "client_id", {
+        "client_id": ("text", 10),
+        "name": ("text", 6),
+        "email": ("email", 5),
+        "phone": ("phone", 5),
+        "company": ("text", 3),
+    }),
+    "Invoices": ("invoice", "invoice_id", {
+        "invoice_id": ("text", 10),
+        "client_id": ("text", 4),
+        "client_name": ("text", 4),
+        "sales_person": ("text", 2),
+    }),
+    "Support_Tickets": ("ticket", "ticket_id", {
+        "ticket_id": ("text", 10),
+        "title": ("text", 6),
+        "client_id": ("text", 4),
+        "client_name": ("text", 4),
+        "category": ("text", 2),
+        "assigned_to": ("text", 2),
+        "description": ("text", 1),
+    }),
+    "Tasks": ("task", "task_id", {
+        "task_id": ("text", 10),
+        "title": ("text", 6),
+        "client_id": ("text", 4),
+        "invoice_id": ("text", 4),
+        "assigned_to": ("text", 2),
+        "description": ("text", 1),
+    }),
+    "Activity_Logs": ("activity", "log_id", {
+        "log_id": ("text", 10),
+        "title": ("text", 3),
+        "entity_id": ("text", 3),
+        "user": ("text", 1),
+        "description": ("text", 1),
+    }),
+}
+
+# Fields also searched by trigram similarity when exact matches run short
+FUZZY_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "Clients": ("name", "email"),
+    "Support_Tickets": ("title",),
+}
+
+# Fields completed by typeahead suggestions
+SUGGEST_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "Clients": ("name", "client_id"),
+    "Invoices": ("invoice_id",),
+    "Support_Tickets": ("ticket_id",),
+}
+
+# A query word that only starts an indexed word scores this share of the weight
+PREFIX_FACTOR = 0.5
+# Fuzzy hits score this share of weight x similarity, below exact matches
+FUZZY_FACTOR = 0.5
+# Score of a row whose ID equals the whole query
+EXACT_ID_SCORE = 100.0
+# Postings counted per query word when choosing which word drives the search
+COUNT_CAP = 2000
+# Readings of one query searched at most (each phone-like word has two)
+MAX_QUERY_READINGS = 8
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_PART_RE = re.compile(r"[a-z]+|[0-9]+")
+_PHONE_RE = re.compile(r"\+?[0-9][0-9\-().]*")
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+
+# (score, row) pairs, best first
+ScoredRows = List[Tuple[float, Dict]]
+
+
+def text_terms(value: str) -> Set[str]:
+    """
+    Lowercase alphanumeric words, plus the letter and digit runs of mixed
+    words so "CLT001" is found by "clt001", "clt" and "001".
+    """
+    terms = set()
+    for word in _WORD_RE.findall(value.lower()):
+        terms.add(word)
+        parts = _PART_RE.findall(word)
+        if len(parts) > 1:
+            terms.update(parts)
+    return terms
+
+
+def field_terms(kind: str, value) -> Set[str]:
+    """Index terms of one field value."""
+    value = str(value or "").strip().lower()
+    if not value:
+        return set()
+    terms = text_terms(value)
+    if kind == "email":
+        terms.add(value)
+    elif kind == "phone":
+        digits = _NON_DIGIT_RE.sub("", value)
+        terms.update(digits[start:] for start in range(len(digits)))
+    return terms
+
+
+def query_terms(query: str) -> List[List[str]]:
+    """
+    Readings of a search query as term lists; a hit matches every term
+    of at least one reading, each term prefix-matching one of its terms.
+
+    Email-like words are kept whole. Phone-like words (digits with
+    dashes, dots or brackets) are read both as their alphanumeric words,
+    like any other text ("2024-001" in "INV-2024-001"), and as their bare
+    digits, matching how phone fields are indexed.
+    """
+    word_readings: List[List[List[str]]] = []
+    for word in query.lower().split():
+        if "@" in word and not word.startswith("@"):
+            word_readings.append([[word]])
+            continue
+        readings = [_WORD_RE.findall(word)]
+        if _PHONE_RE.fullmatch(word):
+            digits = [_NON_DIGIT_RE.sub("", word)]
+            if digits != readings[0]:
+                readings.append(digits)
+        word_readings.append(readings)
+
+    variants: List[List[str]] = []
+    for combination in itertools.islice(itertools.product(*word_readings), MAX_QUERY_READINGS):
+        terms: List[str] = []
+        for candidates in combination:
+            for term in candidates:
+                if term and term not in terms:
+                    terms.append(term)
+        if terms and terms not in variants:
+            variants.append(terms)
+    return variants
+
+
+class _Tier:
+    """Postings of the terms found in fields of one weight."""
+
+    __slots__ = ("postings", "vocabulary")
+
+    def __init__(self):
+        # term -> sorted sheet positions of the rows containing it
+        self.postings: Dict[str, List[int]] = {}
+        # Sorted terms, for prefix lookups
+        self.vocabulary: List[str] = []
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        lo = bisect.bisect_left(self.vocabulary, prefix)
+        hi = bisect.bisect_left(self.vocabulary, prefix + "\uffff", lo)
+        return lo, hi
+
+
+# (score, tier, matching terms) for one query word
+TermGroup = Tuple[float, _Tier, List[str]]
+
+
+class SheetIndex:
+    """Weighted inverted index of one sheet, keyed by row ID."""
+
+    def __init__(
+        self,
+        sheet_name: str,
+        entity_type: str,
+        id_field: str,
+        fields: FieldSpec,
+        fuzzy_fields: Tuple[str, ...] = (),
+        suggest_fields: Tuple[str, ...] = ()
+    ):
+        self.sheet_name = sheet_name
+        self.entity_type = entity_type
+        self.id_field = id_field
+        self.fields = fields
+        self.weights = sorted({weight for _, weight in fields.values()}, reverse=True)
+        self.fuzzy: Optional[TrigramIndex] = (
+            TrigramIndex({field: fields[field][1] for field in fuzzy_fields})
+            if fuzzy_fields else None
+        )
+        self.prefixes: Optional[PrefixIndex] = PrefixIndex(suggest_fields) if suggest_fields else None
+        self._reset()
+
+    def _reset(self) -> None:
+        # Rows by ID, in sheet order (appends go last, updates keep their place)
+        self.rows: Dict[str, Dict] = {}
+        self._order: Dict[str, int] = {}
+        self._ids_by_order: Dict[int, str] = {}
+        self._next_order = 0
+        self._ids_lower: Dict[str, str] = {}
+        # row ID -> {term: best field weight}
+        self._terms: Dict[str, Dict[str, float]] = {}
+        # "\0term\0term..." per row: a prefix test is one substring search
+        self._blobs: Dict[str, str] = {}
+        self._tiers: Dict[float, _Tier] = {weight: _Tier() for weight in self.weights}
+        if self.fuzzy is not None:
+            self.fuzzy.clear()
+        if self.prefixes is not None:
+            self.prefixes.clear()
+
+    def row_terms(self, row: Dict) -> Dict[str, float]:
+        terms: Dict[str, float] = {}
+        for field, (kind, weight) in self.fields.items():
+            for term in field_terms(kind, row.get(field, "")):
+                if weight > terms.get(term, 0):
+                    terms[term] = weight
+        return terms
+
+    def _add_row(self, row_id: str, row: Dict, order: int, sorted_insert: bool) -> None:
+        terms = self.row_terms(row)
+        self.rows[row_id] = row
+        self._order[row_id] = order
+        self._ids_by_order[order] = row_id
+        self._ids_lower[row_id.lower()] = row_id
+        self._terms[row_id] = terms
+        self._blobs[row_id] = "\0" + "\0".join(terms)
+        for term, weight in terms.items():
+            tier = self._tiers[weight]
+            positions = tier.postings.get(term)
+            if positions is None:
+                positions = tier.postings[term] = []
+                if sorted_insert:
+                    bisect.insort(tier.vocabulary, term)
+            bisect.insort(positions, order)
+        if self.fuzzy is not None:
+            self.fuzzy.add(row_id, row)
+        if self.prefixes is not None:
+            self.prefixes.add(row_id, row, sorted_insert)
+
+    def load(self, rows: Iterable[Dict]) -> None:
+        """Index all rows of the sheet at once."""
+        self._reset()
+        for row in rows:
+            row_id = row.get(self.id_field)
+            if not row_id or row_id in self.rows:
+                continue
+            self._add_row(row_id, row, self._next_order, sorted_insert=False)
+            self._next_order += 1
+        for tier in self._tiers.values():
+            tier.vocabulary = sorted(tier.postings)
+        if self.prefixes is not None:
+            self.prefixes.sort()
+
+    def _unindex(self, row_id: str) -> None:
+        order = self._order[row_id]
+        for term, weight in self._terms.pop(row_id).items():
+            tier = self._tiers[weight]
+            positions = tier.postings[term]
+            index = bisect.bisect_left(positions, order)
+            if index < len(positions) and positions[index] == order:
+                positions.pop(index)
+            if not positions:
+                del tier.postings[term]
+                index = bisect.bisect_left(tier.vocabulary, term)
+                if index < len(tier.vocabulary) and tier.vocabulary[index] == term:
+                    tier.vocabulary.pop(index)
+        self._ids_lower.pop(row_id.lower(), None)
+        if self.fuzzy is not None:
+            self.fuzzy.remove(row_id)
+        if self.prefixes is not None:
+            self.prefixes.remove(row_id)
+
+    def remove(self, row_id: str) -> None:
+        if row_id not in self.rows:
+            return
+        self._unindex(row_id)
+        del self.rows[row_id]
+        del self._ids_by_order[self._order.pop(row_id)]
+        del self._blobs[row_id]
+
+    def put(self, row: Dict) -> None:
+        """Index a new or changed row."""
+        row_id = row.get(self.id_field)
+        if not row_id:
+            return
+        if row_id in self.rows:
+            order = self._order[row_id]
+            self._unindex(row_id)
+        else:
+            order = self._next_order
+            self._next_order += 1
+        self._add_row(row_id, row, order, sorted_insert=True)
+
+    @staticmethod
+    def _term_score(terms: Dict[str, float], query_term: str) -> float:
+        """Best score of one query word against a row's terms."""
+        best = 0.0
+        for term, weight in terms.items():
+            if term.startswith(query_term):
+                score = weight if term == query_term else weight * PREFIX_FACTOR
+                if score > best:
+                    best = score
+        return best
+
+    def _term_groups(self, query_term: str) -> List[TermGroup]:
+        """Vocabulary matches of a query word grouped by the score they give, best first."""
+        groups = []
+        for weight, tier in self._tiers.items():
+            lo, hi = tier.prefix_range(query_term)
+            if lo == hi:
+                continue
+            if tier.vocabulary[lo] == query_term:
+                groups.append((weight, tier, [query_term]))
+                lo += 1
+            if lo < hi:
+                groups.append((weight * PREFIX_FACTOR, tier, tier.vocabulary[lo:hi]))
+        groups.sort(key=lambda group: -group[0])
+        return groups
+
+    @staticmethod
+    def _count(groups: List[TermGroup]) -> int:
+        """Postings under a word's groups, counted up to COUNT_CAP."""
+        size = 0
+        for _, tier, terms in groups:
+            for term in terms:
+                size += len(tier.postings[term])
+                if size >= COUNT_CAP:
+                    return size
+        return size
+
+    def _ranked(self, query: str, limit: Optional[int]) -> List[Tuple[float, str]]:
+        """
+        Exact (word and prefix) matches as (score, row ID), best first.
+
+        Each reading of the query is ranked on its own; a row scores its
+        best reading. Merging the per-reading top K is exact: a row's
+        best reading ranks it at least as high as the merged list does.
+        """
+        readings = query_terms(query)
+        if len(readings) == 1:
+            return self._ranked_terms(readings[0], query, limit)
+
+        best: Dict[str, float] = {}
+        for terms in readings:
+            for score, row_id in self._ranked_terms(terms, query, limit):
+                if score > best.get(row_id, 0.0):
+                    best[row_id] = score
+        # Stable: ties keep the order of the first reading that found them
+        ranked = sorted(((score, row_id) for row_id, score in best.items()), key=lambda hit: -hit[0])
+        return ranked if limit is None else ranked[:limit]
+
+    def _ranked_terms(self, terms: List[str], query: str, limit: Optional[int]) -> List[Tuple[float, str]]:
+        """
+        Matches of one reading of the query as (score, row ID), best first.
+
+        The word with the fewest postings drives the search: its matches
+        are visited from the best-scoring group down and the other words
+        are checked per candidate, stopping once the top-K heap holds
+        limit rows that no remaining candidate can outscore.
+        """
+        words = []
+        for term in terms:
+            groups = self._term_groups(term)
+            if not groups:
+                return []
+            words.append((self._count(groups), term, groups))
+        words.sort(key=lambda word: word[0])
+        driver_groups = words[0][2]
+        others = [term for _, term, _ in words[1:]]
+        needles = ["\0" + term for term in others]
+        # Most the other words can add to any row
+        others_best = sum(groups[0][0] for _, _, groups in words[1:])
+
+        # Min-heap of (score, -sequence, row ID): ties go to the earlier candidate
+        heap: List[Tuple[float, int, str]] = []
+        seen: Set[str] = set()
+        sequence = 0
+
+        def offer(score: float, row_id: str) -> None:
+            nonlocal sequence
+            sequence += 1
+            entry = (score, -sequence, row_id)
+            if limit is None or len(heap) < limit:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        def settled(bound: float) -> bool:
+            return limit is not None and len(heap) >= limit and heap[0][0] >= bound
+
+        exact_id = self._ids_lower.get(query.strip().lower())
+        if exact_id is not None:
+            seen.add(exact_id)
+            offer(EXACT_ID_SCORE, exact_id)
+
+        # Groups come best first and a row's first group is its best, so
+        # a row is scored once, when first seen
+        for group_score, tier, group_terms in driver_groups:
+            bound = group_score + others_best
+            if settled(bound):
+                break
+            for term in group_terms:
+                if settled(bound):
+                    break
+                for order in tier.postings[term]:
+                    row_id = self._ids_by_order[order]
+                    if row_id in seen:
+                        continue
+                    seen.add(row_id)
+                    score = group_score
+                    if needles:
+                        blob = self._blobs[row_id]
+                        if not all(needle in blob for needle in needles):
+                            continue
+                        row_terms = self._terms[row_id]
+                        score += sum(self._term_score(row_terms, other) for other in others)
+                    offer(score, row_id)
+                    if settled(bound):
+                        break
+
+        return [(score, row_id) for score, _, row_id in sorted(heap, reverse=True)]
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        fuzzy_threshold: float = 0
+    ) -> ScoredRows:
+        """
+        Rows matching every query word, best first.
+
+        Per query word a row scores the weight of its best field with a
+        word equal to it, or PREFIX_FACTOR of it for a word that only
+        starts with it; an ID equal to the whole query scores
+        EXACT_ID_SCORE. Equal scores go to the better match of the
+        driving word, then to the alphabetically first word it matched,
+        then to sheet order.
+
+        When fewer than limit rows match and the sheet has fuzzy fields,
+        rows whose fuzzy fields share at least fuzzy_threshold of the
+        query's trigrams fill the rest, scoring FUZZY_FACTOR x weight x
+        similarity.
+
+        Args:
+            query: Search query
+            limit: Maximum rows to return (None = all)
+            fuzzy_threshold: Minimum trigram similarity of fuzzy hits
+                (0 = exact matches only)
+
+        Returns:
+            (score, row) pairs
+        """
+        ranked = self._ranked(query, limit) if self.rows else []
+
+        if fuzzy_threshold > 0 and self.fuzzy is not None and (limit is None or len(ranked) < limit):
+            found = {row_id for _, row_id in ranked}
+            remaining = len(self.rows) if limit is None else limit - len(ranked)
+            fuzzy = self.fuzzy.search(query, fuzzy_threshold, remaining, found)
+            if fuzzy:
+                ranked += [(score * FUZZY_FACTOR, row_id) for score, _, row_id in fuzzy]
+                # Stable: exact matches stay ahead of fuzzy ones on equal scores
+                ranked.sort(key=lambda hit: -hit[0])
+
+        return [(score, self.rows[row_id]) for score, row_id in ranked]
+
+
+class SearchIndex:
+    """Ranked indexes of the searchable sheets, kept current from writes."""
+
+    def __init__(
+        self,
+        sheets_service: SheetsService,
+        ttl_seconds: int = 0,
+        fuzzy_threshold: float = 0,
+        source_timeout_seconds: float = 0
+    ):
+        """
+        Initialize search index and subscribe to sheet writes.
+
+        Args:
+            sheets_service: Google Sheets service instance
+            ttl_seconds: Re-read a sheet when its index is older than this,
+                to pick up edits made directly in Google Sheets (0 = never)
+            fuzzy_threshold: Default minimum trigram similarity of fuzzy
+                hits (0 = exact matches only)
+            source_timeout_seconds: How long search_all waits for a sheet
+                whose index is still being built before leaving it out
+                (0 = wait for every sheet)
+        """
+        self.sheets = sheets_service
+        self.ttl_seconds = ttl_seconds
+        self.fuzzy_threshold = fuzzy_threshold
+        self.source_timeout_seconds = source_timeout_seconds
+        self.indexes: Dict[str, SheetIndex] = {
+            sheet_name: self._new_index(sheet_name) for sheet_name in SEARCH_SOURCES
+        }
+        self._loaded_at: Dict[str, float] = {}
+        # In-flight sheet reads, at most one per sheet
+        self._loads: Dict[str, Future] = {}
+        # Writes made while a sheet is being re-read, replayed onto the new index
+        self._replay: Dict[str, List[RowChange]] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Writes arrive from worker threads while searches read the index
+        self._lock = threading.Lock()
+        add_row_listener(self._on_row_change)
+
+    @staticmethod
+    def _new_index(sheet_name: str) -> SheetIndex:
+        entity_type, id_field, fields = SEARCH_SOURCES[sheet_name]
+        return SheetIndex(
+            sheet_name, entity_type, id_field, fields,
+            FUZZY_FIELDS.get(sheet_name, ()), SUGGEST_FIELDS.get(sheet_name, ())
+        )
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Create the sheet read pool on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=len(SEARCH_SOURCES), thread_name_prefix="search-index"
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Stop sheet read threads."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def warm(self) -> None:
+        """Start building every sheet's index in the background."""
+        for sheet_name in self.indexes:
+            self._refresh(sheet_name)
+
+    def load(self, sheet_name: str) -> None:
+        """
+        (Re)build the index of one sheet with a single read.
+
+        The new index is built aside and swapped in, so searches keep
+        using the previous one meanwhile.
+        """
+        with self._lock:
+            self._replay[sheet_name] = []
+        try:
+            rows = self.sheets.get_all_rows(sheet_name)
+            index = self._new_index(sheet_name)
+            index.load(rows)
+            with self._lock:
+                self._apply(index, self._replay[sheet_name])
+                self.indexes[sheet_name] = index
+                self._loaded_at[sheet_name] = time.monotonic()
+        finally:
+            with self._lock:
+                self._replay.pop(sheet_name, None)
+        logger.info(f"Indexed {len(index.rows)} {sheet_name} rows for search")
+
+    def _load_done(self, sheet_name: str, future: Future) -> None:
+        with self._lock:
+            if self._loads.get(sheet_name) is future:
+                del self._loads[sheet_name]
+
+    def _start_load(self, sheet_name: str) -> Future:
+        """Read a sheet in the background, joining a read already running."""
+        with self._lock:
+            future = self._loads.get(sheet_name)
+            if future is not None:
+                return future
+            future = self._loads[sheet_name] = self._get_pool().submit(self.load, sheet_name)
+        future.add_done_callback(lambda done: self._load_done(sheet_name, done))
+        return future
+
+    def _refresh(self, sheet_name: str) -> Optional[Future]:
+        """
+        Start loading a sheet that was never loaded or whose TTL expired.
+
+        Returns:
+            The load to wait for when the sheet has no index yet; None
+            when the current index can be searched (an expired one is
+            searched while it reloads)
+        """
+        loaded_at = self._loaded_at.get(sheet_name)
+        if loaded_at is None:
+            return self._start_load(sheet_name)
+        if self.ttl_seconds > 0 and time.monotonic() - loaded_at > self.ttl_seconds:
+            self._start_load(sheet_name)
+        return None
+
+    def ensure_loaded(self, sheet_name: str) -> None:
+        """Load on first use; reload in the background when the TTL has expired."""
+        pending = self._refresh(sheet_name)
+        if pending is not None:
+            pending.result()
+
+    @staticmethod
+    def _apply(index: SheetIndex, changes: List[RowChange]) -> None:
+        for before, after in changes:
+            before_id = before.get(index.id_field) if before else None
+            if before_id and (after is None or after.get(index.id_field) != before_id):
+                index.remove(before_id)
+            if after:
+                index.put(after)
+
+    def _on_row_change(self, sheet_name: str, changes: List[RowChange]) -> None:
+        """Re-index rows written by the app."""
+        if sheet_name not in self.indexes:
+            return
+        with self._lock:
+            replay = self._replay.get(sheet_name)
+            if replay is not None:
+                replay.extend(changes)
+            if sheet_name in self._loaded_at:
+                self._apply(self.indexes[sheet_name], changes)
+
+    def search(
+        self,
+        sheet_name: str,
+        query: str,
+        limit: Optional[int] = None,
+        fuzzy_threshold: Optional[float] = None
+    ) -> ScoredRows:
+        """
+        Ranked rows of one sheet matching a query.
+
+        Every query word must be the start of a word in an indexed field
+        (any digits of a phone number); fuzzy fields also match by trigram
+        similarity when exact matches run short.
+
+        Args:
+            sheet_name: Indexed sheet to search
+            query: Search query
+            limit: Maximum rows to return (None = all)
+            fuzzy_threshold: Minimum fuzzy similarity (None = default,
+                0 = exact matches only)
+
+        Returns:
+            (score, row) pairs, best first
+        """
+        if fuzzy_threshold is None:
+            fuzzy_threshold = self.fuzzy_threshold
+        self.ensure_loaded(sheet_name)
+        with self._lock:
+            return self.indexes[sheet_name].search(query, limit, fuzzy_threshold)
+
+    def _await_sources(self, sheet_names: List[str]) -> List[str]:
+        """
+        Load the sheets that have no index yet, concurrently.
+
+        Blocks the calling thread for up to source_timeout_seconds (or
+        until loaded, when 0); routes call it from a worker thread.
+
+        Returns:
+            Sheets still loading after source_timeout_seconds; their reads
+            carry on in the background for later requests
+        """
+        pending = {}
+        for sheet_name in sheet_names:
+            future = self._refresh(sheet_name)
+            if future is not None:
+                pending[sheet_name] = future
+        if not pending:
+            return []
+
+        wait(pending.values(), timeout=self.source_timeout_seconds or None)
+        timed_out = []
+        for sheet_name, future in pending.items():
+            if future.done():
+                future.result()
+            else:
+                timed_out.append(sheet_name)
+        if timed_out:
+            logger.warning(f"Search answered without {', '.join(timed_out)}: index still loading")
+        return timed_out
+
+    @staticmethod
+    def _hit_stream(position: int, sheet_name: str, hits: ScoredRows) -> Iterator[Tuple]:
+        """A sheet's hits with their cross-sheet sort key, best first."""
+        for rank, (score, row) in enumerate(hits):
+            yield score, -position, -rank, sheet_name, row
+
+    def search_all(
+        self,
+        query: str,
+        limit: int,
+        sheet_names: Optional[Iterable[str]] = None,
+        fuzzy_threshold: Optional[float] = None
+    ) -> Tuple[Dict[str, ScoredRows], List[Tuple[float, str, Dict]], List[str]]:
+        """
+        Best hits per sheet and across all of them.
+
+        Sheets without an index yet are read concurrently; any not ready
+        within source_timeout_seconds is left out rather than holding up
+        the others.
+
+        Args:
+            query: Search query
+            limit: Maximum hits per sheet and overall
+            sheet_names: Sheets to search (default: every indexed sheet)
+            fuzzy_threshold: Minimum fuzzy similarity (None = default,
+                0 = exact matches only)
+
+        Returns:
+            ({sheet: (score, row) pairs}, overall (score, sheet, row)
+            triples, sheets left out), best first; ties go to the sheet
+            listed first in SEARCH_SOURCES, then to the earlier row
+        """
+        if fuzzy_threshold is None:
+            fuzzy_threshold = self.fuzzy_threshold
+        selected = set(sheet_names) if sheet_names is not None else set(self.indexes)
+        ordered = [sheet_name for sheet_name in self.indexes if sheet_name in selected]
+        timed_out = self._await_sources(ordered)
+
+        per_sheet: Dict[str, ScoredRows] = {}
+        streams = []
+        for position, sheet_name in enumerate(ordered):
+            if sheet_name in timed_out:
+                continue
+            with self._lock:
+                hits = self.indexes[sheet_name].search(query, limit, fuzzy_threshold)
+            per_sheet[sheet_name] = hits
+            streams.append(self._hit_stream(position, sheet_name, hits))
+
+        # Each sheet's hits are already best first: merge lazily, stop at limit
+        merged = heapq.merge(*streams, key=lambda hit: hit[:3], reverse=True)
+        best = [(score, sheet_name, row) for score, _, _, sheet_name, row in itertools.islice(merged, limit)]
+        return per_sheet, best, timed_out
+
+    def suggest(
+        self,
+        prefix: str,
+        limit: int,
+        sheet_names: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, Dict]]:
+        """
+        Typeahead completions across the SUGGEST_FIELDS sheets.
+
+        Costs a binary search per sheet plus the returned rows, so it can
+        run on every keystroke; sheets whose index is not ready within
+        source_timeout_seconds are left out.
+
+        Args:
+            prefix: Typed text
+            limit: Maximum rows to return
+            sheet_names: Sheets to complete from (default: all of SUGGEST_FIELDS)
+
+        Returns:
+            (sheet, row) pairs: matches at the start of a value first, then
+            at a later word, each alphabetically by the matched text
+        """
+        selected = set(sheet_names) if sheet_names is not None else set(SUGGEST_FIELDS)
+        ordered = [sheet_name for sheet_name in SUGGEST_FIELDS if sheet_name in selected]
+        timed_out = self._await_sources(ordered)
+
+        candidates = []
+        for position, sheet_name in enumerate(ordered):
+            if sheet_name in timed_out:
+                continue
+            with self._lock:
+                index = self.indexes[sheet_name]
+                for kind, key, row_id in index.prefixes.complete(prefix, limit):
+                    candidates.append((kind, key, position, sheet_name, index.rows[row_id]))
+
+        best = heapq.nsmallest(limit, candidates, key=lambda hit: hit[:3])
+        return [(sheet_name, row) for _, _, _, sheet_name, row in best]
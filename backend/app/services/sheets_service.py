@@ -3,14 +3,149 @@ Google Sheets Service for N Company CRM.
 Handles all interactions with Google Sheets API.
 """
 
-from typing import List, Dict, Optional
+from typing import Callable, Iterator, List, Dict, Optional, Tuple, Union
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+import asyncio
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# A row change is (before, after); before is None for appends, after is None for deletes
+RowChange = Tuple[Optional[Dict], Optional[Dict]]
+RowChangeListener = Callable[[str, List[RowChange]], None]
+
+# Listeners shared by every SheetsService instance in the process
+_row_change_listeners: List[RowChangeListener] = []
+
+
+def add_row_listener(listener: RowChangeListener) -> None:
+    """
+    Register a callback for rows written through any SheetsService.
+    
+    The listener receives the sheet name and the list of (before, after)
+    row pairs of one write call, so batched writes arrive as one batch.
+    """
+    _row_change_listeners.append(listener)
+
+
+def remove_row_listener(listener: RowChangeListener) -> None:
+    """Unregister a row change callback."""
+    if listener in _row_change_listeners:
+        _row_change_listeners.remove(listener)
+
+
+# Per-sheet change counters (for conditional GETs): bumped on app writes and
+# when a full read returns different content than the previous one
+_sheet_versions: Dict[str, int] = {}
+_sheet_fingerprints: Dict[str, int] = {}
+_sheet_checked_at: Dict[str, float] = {}
+
+
+def _bump_sheet_version(sheet_name: str) -> None:
+    _sheet_versions[sheet_name] = _sheet_versions.get(sheet_name, 0) + 1
+
+
+def _observe_sheet(sheet_name: str, values: List[List]) -> None:
+    """Record a full read; content that differs from the last read bumps the version."""
+    fingerprint = hash(tuple(tuple(row) for row in values))
+    if _sheet_fingerprints.get(sheet_name) != fingerprint:
+        _sheet_fingerprints[sheet_name] = fingerprint
+        _bump_sheet_version(sheet_name)
+    _sheet_checked_at[sheet_name] = time.monotonic()
+
+
+def sheet_version(sheet_name: str, max_age_seconds: Optional[float] = None) -> Optional[int]:
+    """
+    Current change counter of a sheet.
+    
+    Edits made directly in Google Sheets are only noticed by the next full
+    read, so the version is only trusted for max_age_seconds after one.
+    
+    Args:
+        sheet_name: Name of the sheet
+        max_age_seconds: Maximum time since the last full read (None = any)
+        
+    Returns:
+        Version, or None when the sheet has not been read recently enough
+    """
+    checked_at = _sheet_checked_at.get(sheet_name)
+    if checked_at is None:
+        return None
+    if max_age_seconds is not None and time.monotonic() - checked_at > max_age_seconds:
+        return None
+    return _sheet_versions.get(sheet_name, 0)
+
+
+# Event loop that delivers row changes (set at app startup)
+_listener_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def set_listener_loop(loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """
+    Deliver row changes on this event loop.
+    
+    Listeners keep in-memory state that request handlers read on the loop
+    without locking. Writes made from worker threads (background jobs,
+    threadpool routes) hand their changes to the loop and wait until every
+    listener has run, so callers still see their write applied on return.
+    
+    Args:
+        loop: Running event loop, or None to deliver on the writing thread
+    """
+    global _listener_loop
+    _listener_loop = loop
+
+
+def _deliver_row_changes(sheet_name: str, changes: List[RowChange]) -> None:
+    _bump_sheet_version(sheet_name)
+    for listener in list(_row_change_listeners):
+        try:
+            listener(sheet_name, changes)
+        except Exception as e:
+            logger.error(f"Row change listener failed for {sheet_name}: {e}")
+
+
+def _notify_row_changes(sheet_name: str, changes: List[RowChange]) -> None:
+    """Deliver row changes to listeners; listener errors never fail the write."""
+    if not changes:
+        return
+    
+    loop = _listener_loop
+    try:
+        on_loop = asyncio.get_running_loop() is loop
+    except RuntimeError:
+        on_loop = False
+    if loop is None or on_loop or not loop.is_running():
+        _deliver_row_changes(sheet_name, changes)
+        return
+    
+    # Whoever claims the delivery runs it: the loop, or this thread if the
+    # loop stops before getting to it
+    claimed = threading.Lock()
+    delivered = threading.Event()
+    
+    def deliver() -> None:
+        if claimed.acquire(blocking=False):
+            try:
+                _deliver_row_changes(sheet_name, changes)
+            finally:
+                delivered.set()
+    
+    try:
+        loop.call_soon_threadsafe(deliver)
+    except RuntimeError:
+        # Loop closed
+        deliver()
+        return
+    while not delivered.wait(1.0):
+        if not loop.is_running():
+            deliver()
+            return
+
 
 class SheetsService:
     """Service for interacting with Google Sheets."""
@@ -60,6 +195,7 @@ class SheetsService:
             ).execute()
             
             values = result.get('values', [])
+            _observe_sheet(sheet_name, values)
             
             if not values:
                 return []
@@ -81,6 +217,91 @@ class SheetsService:
             logger.error(f"Error reading from {sheet_name}: {e}")
             raise
     
+    def get_columns(self, sheet_name: str, columns: List[str]) -> Dict[str, List[str]]:
+        """
+        Get selected columns of a sheet as lists (column-oriented read).
+        
+        Avoids building a dict per row when only a few columns are
+        needed over a large sheet.
+        
+        Args:
+            sheet_name: Name of the sheet
+            columns: Column names to extract
+            
+        Returns:
+            Map of column name to list of cell values ('' where missing)
+        """
+        try:
+            result = self.service.spreadsheets().values().get(
+                spreadsheetId=self.spreadsheet_id,
+                range=f"{sheet_name}!A:Z"
+            ).execute()
+        except HttpError as e:
+            logger.error(f"Error reading from {sheet_name}: {e}")
+            raise
+        
+        values = result.get('values', [])
+        if not values:
+            return {column: [] for column in columns}
+        
+        headers = values[0]
+        data = values[1:]
+        
+        extracted = {}
+        for column in columns:
+            if column not in headers:
+                extracted[column] = [''] * len(data)
+                continue
+            index = headers.index(column)
+            extracted[column] = [
+                row[index] if len(row) > index else ''
+                for row in data
+            ]
+        
+        logger.info(f"Retrieved {len(columns)} columns x {len(data)} rows from {sheet_name}")
+        return extracted
+    
+    def iter_rows(self, sheet_name: str, chunk_size: int = 1000) -> Iterator[Dict]:
+        """
+        Iterate over all rows of a sheet, reading it in chunks.
+        
+        Only one chunk is held in memory at a time, so large sheets can be
+        streamed. Reading stops at the first empty chunk.
+        
+        Args:
+            sheet_name: Name of the sheet
+            chunk_size: Rows fetched per API call
+            
+        Yields:
+            Row dictionaries in sheet order
+        """
+        headers = self.get_headers(sheet_name)
+        if not headers:
+            return
+        
+        start = 2  # Row 1 is headers
+        while True:
+            end = start + chunk_size - 1
+            try:
+                result = self.service.spreadsheets().values().get(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=f"{sheet_name}!A{start}:Z{end}"
+                ).execute()
+            except HttpError as e:
+                logger.error(f"Error reading rows {start}-{end} from {sheet_name}: {e}")
+                raise
+            
+            values = result.get('values', [])
+            if not values:
+                return
+            
+            for row_data in values:
+                yield self._row_to_dict(headers, row_data)
+            
+            if len(values) < chunk_size:
+                return
+            start = end + 1
+    
     def append_row(self, sheet_name: str, data: Dict) -> bool:
         """
         Append a row to a sheet.
@@ -124,12 +345,89 @@ class SheetsService:
             ).execute()
             
             logger.info(f"Appended row to {sheet_name}, result: {result.get('updates', {})}")
+            _notify_row_changes(sheet_name, [(None, dict(zip(headers, row_values)))])
             return True
             
         except HttpError as e:
             logger.error(f"Error appending to {sheet_name}: {e}")
             raise
     
+    def get_headers(self, sheet_name: str) -> List[str]:
+        """
+        Get the header row of a sheet.
+        
+        Args:
+            sheet_name: Name of the sheet
+            
+        Returns:
+            List of column names (empty if sheet has no headers)
+        """
+        try:
+            result = self.service.spreadsheets().values().get(
+                spreadsheetId=self.spreadsheet_id,
+                range=f"{sheet_name}!A1:Z1"
+            ).execute()
+            
+            return result.get('values', [[]])[0]
+            
+        except HttpError as e:
+            logger.error(f"Error reading headers from {sheet_name}: {e}")
+            raise
+    
+    def append_rows(
+        self,
+        sheet_name: str,
+        rows: List[Dict],
+        headers: Optional[List[str]] = None
+    ) -> int:
+        """
+        Append many rows to a sheet in a single API call.
+        
+        Args:
+            sheet_name: Name of the sheet
+            rows: List of column:value dictionaries
+            headers: Known header row (fetched if not provided)
+            
+        Returns:
+            Number of rows appended
+        """
+        if not rows:
+            return 0
+        
+        try:
+            if headers is None:
+                headers = self.get_headers(sheet_name)
+            
+            if not headers:
+                logger.error(f"Sheet {sheet_name} has no headers")
+                return 0
+            
+            row_values = [
+                [row.get(header, '') for header in headers]
+                for row in rows
+            ]
+            body = {
+                'values': row_values
+            }
+            
+            self.service.spreadsheets().values().append(
+                spreadsheetId=self.spreadsheet_id,
+                range=f"{sheet_name}!A:Z",
+                valueInputOption='RAW',
+                insertDataOption='INSERT_ROWS',
+                body=body
+            ).execute()
+            
+            logger.info(f"Appended {len(rows)} rows to {sheet_name}")
+            _notify_row_changes(sheet_name, [
+                (None, dict(zip(headers, values))) for values in row_values
+            ])
+            return len(rows)
+            
+        except HttpError as e:
+            logger.error(f"Error appending rows to {sheet_name}: {e}")
+            raise
+    
     def find_row(self, sheet_name: str, key: str, value: str) -> Optional[Dict]:
         """
         Find a row by key-value pair.
@@ -150,41 +448,242 @@ class SheetsService:
         
         return None
     
-    def update_row(self, sheet_name: str, key: str, value: str, data: Dict) -> bool:
+    def _hinted_row(
+        self,
+        sheet_name: str,
+        key: str,
+        value: str,
+        row_number: int
+    ) -> Optional[Tuple[List[str], List]]:
+        """
+        Headers and raw values of one sheet row, if it still holds key=value.
+        
+        Reads only the header row and the given row, in one call.
+        """
+        result = self.service.spreadsheets().values().batchGet(
+            spreadsheetId=self.spreadsheet_id,
+            ranges=[f"{sheet_name}!A1:Z1", f"{sheet_name}!A{row_number}:Z{row_number}"]
+        ).execute()
+        
+        ranges = [value_range.get('values', []) for value_range in result.get('valueRanges', [])]
+        if len(ranges) != 2 or not ranges[0] or not ranges[1]:
+            return None
+        headers, row_data = ranges[0][0], ranges[1][0]
+        if key not in headers:
+            return None
+        key_index = headers.index(key)
+        if len(row_data) <= key_index or row_data[key_index] != value:
+            return None
+        return headers, row_data
+    
+    def update_row(
+        self,
+        sheet_name: str,
+        key: str,
+        value: str,
+        data: Dict,
+        row_number: Optional[int] = None
+    ) -> Optional[Dict]:
         """
         Update a row matching key-value pair.
         
+        With a row_number hint (e.g. from a cached table) only the header
+        and that row are read; if the row no longer holds the key, the
+        whole sheet is searched as usual.
+        
         Args:
             sheet_name: Name of the sheet
             key: Column name to match
             value: Value to match
             data: Dictionary of updated values
+            row_number: Sheet row (1-indexed, header is row 1) expected to
+                hold the key
             
         Returns:
-            True if successful
+            The row as written (read-your-writes), or None if not found
+        """
+        try:
+            hinted = None
+            if row_number is not None and row_number > 1:
+                hinted = self._hinted_row(sheet_name, key, value, row_number)
+            
+            if hinted is not None:
+                headers, current_row = hinted
+                row_index = row_number
+            else:
+                # Get all data
+                result = self.service.spreadsheets().values().get(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=f"{sheet_name}!A:Z"
+                ).execute()
+                
+                values = result.get('values', [])
+                
+                if not values:
+                    return None
+                
+                headers = values[0]
+                key_index = headers.index(key) if key in headers else -1
+                
+                if key_index == -1:
+                    logger.error(f"Key '{key}' not found in headers")
+                    return None
+                
+                # Find row index
+                row_index = None
+                for i, row_data in enumerate(values[1:], start=2):  # Start at 2 (1-indexed + skip header)
+                    if len(row_data) > key_index and row_data[key_index] == value:
+                        row_index = i
+                        break
+                
+                if row_index is None:
+                    logger.warning(f"No row found with {key}={value}")
+                    return None
+                
+                current_row = values[row_index - 1]
+            
+            # Build updated row
+            updated_row = self._apply_patch(headers, current_row, data)
+            
+            # Update the row
+            body = {
+                'values': [updated_row]
+            }
+            
+            self.service.spreadsheets().values().update(
+                spreadsheetId=self.spreadsheet_id,
+                range=f"{sheet_name}!A{row_index}:Z{row_index}",
+                valueInputOption='RAW',
+                body=body
+            ).execute()
+            
+            logger.info(f"Updated row {row_index} in {sheet_name}")
+            updated = self._row_to_dict(headers, updated_row)
+            _notify_row_changes(sheet_name, [(self._row_to_dict(headers, current_row), updated)])
+            return updated
+            
+        except HttpError as e:
+            logger.error(f"Error updating {sheet_name}: {e}")
+            raise
+    
+    def batch_update_rows(
+        self,
+        sheet_name: str,
+        key: str,
+        updates: Dict[str, Union[Dict, Callable[[Dict], Optional[Dict]]]]
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Update many rows with one read and one batched write.
+        
+        Args:
+            sheet_name: Name of the sheet
+            key: Column name to match
+            updates: Map of key value to either a dict of updated values or a
+                callable that receives the current row and returns the updates
+                (or None to leave the row unchanged)
+            
+        Returns:
+            Map of key value to the post-update row, or None if not found
         """
+        if not updates:
+            return {}
+        
         try:
-            # Get all data
             result = self.service.spreadsheets().values().get(
                 spreadsheetId=self.spreadsheet_id,
                 range=f"{sheet_name}!A:Z"
             ).execute()
             
             values = result.get('values', [])
+            results = {value: None for value in updates}
             
             if not values:
-                return False
+                return results
             
             headers = values[0]
-            key_index = headers.index(key) if key in headers else -1
-            
-            if key_index == -1:
+            if key not in headers:
                 logger.error(f"Key '{key}' not found in headers")
+                return results
+            key_index = headers.index(key)
+            
+            # Index first occurrence of each requested key
+            row_indexes = {}
+            for i, row_data in enumerate(values[1:], start=2):
+                if len(row_data) > key_index:
+                    row_value = row_data[key_index]
+                    if row_value in updates and row_value not in row_indexes:
+                        row_indexes[row_value] = i
+            
+            data = []
+            changes = []
+            for value, patch in updates.items():
+                row_index = row_indexes.get(value)
+                if row_index is None:
+                    continue
+                
+                current_row = values[row_index - 1]
+                if callable(patch):
+                    patch = patch(self._row_to_dict(headers, current_row))
+                    if not patch:
+                        results[value] = self._row_to_dict(headers, current_row)
+                        continue
+                
+                updated_row = self._apply_patch(headers, current_row, patch)
+                data.append({
+                    'range': f"{sheet_name}!A{row_index}:Z{row_index}",
+                    'values': [updated_row]
+                })
+                results[value] = self._row_to_dict(headers, updated_row)
+                changes.append((self._row_to_dict(headers, current_row), results[value]))
+            
+            if data:
+                self.service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=self.spreadsheet_id,
+                    body={
+                        'valueInputOption': 'RAW',
+                        'data': data
+                    }
+                ).execute()
+            
+            missing = len(updates) - len(row_indexes)
+            logger.info(
+                f"Batch updated {len(data)} rows in {sheet_name} ({missing} not found)"
+            )
+            _notify_row_changes(sheet_name, changes)
+            return results
+            
+        except HttpError as e:
+            logger.error(f"Error batch updating {sheet_name}: {e}")
+            raise
+    
+    def delete_row(self, sheet_name: str, key: str, value: str) -> bool:
+        """
+        Delete the row matching key-value pair.
+        
+        Args:
+            sheet_name: Name of the sheet
+            key: Column name to match
+            value: Value to match
+            
+        Returns:
+            True if a row was deleted
+        """
+        try:
+            result = self.service.spreadsheets().values().get(
+                spreadsheetId=self.spreadsheet_id,
+                range=f"{sheet_name}!A:Z"
+            ).execute()
+            
+            values = result.get('values', [])
+            
+            if not values or key not in values[0]:
                 return False
             
-            # Find row index
+            key_index = values[0].index(key)
+            
+            # 0-indexed sheet row (header is row 0)
             row_index = None
-            for i, row_data in enumerate(values[1:], start=2):  # Start at 2 (1-indexed + skip header)
+            for i, row_data in enumerate(values[1:], start=1):
                 if len(row_data) > key_index and row_data[key_index] == value:
                     row_index = i
                     break
@@ -193,35 +692,68 @@ class SheetsService:
                 logger.warning(f"No row found with {key}={value}")
                 return False
             
-            # Build updated row
-            current_row = values[row_index - 1]
-            updated_row = current_row.copy()
-            
-            for header, new_value in data.items():
-                if header in headers:
-                    col_index = headers.index(header)
-                    if col_index < len(updated_row):
-                        updated_row[col_index] = new_value
-                    else:
-                        # Extend row if needed
-                        updated_row.extend([''] * (col_index - len(updated_row) + 1))
-                        updated_row[col_index] = new_value
+            # Row deletion needs the numeric sheet ID
+            metadata = self.service.spreadsheets().get(
+                spreadsheetId=self.spreadsheet_id,
+                fields="sheets.properties"
+            ).execute()
             
-            # Update the row
-            body = {
-                'values': [updated_row]
-            }
+            sheet_id = None
+            for sheet in metadata.get('sheets', []):
+                properties = sheet.get('properties', {})
+                if properties.get('title') == sheet_name:
+                    sheet_id = properties.get('sheetId')
+                    break
             
-            self.service.spreadsheets().values().update(
+            if sheet_id is None:
+                logger.error(f"Sheet {sheet_name} not found")
+                return False
+            
+            self.service.spreadsheets().batchUpdate(
                 spreadsheetId=self.spreadsheet_id,
-                range=f"{sheet_name}!A{row_index}:Z{row_index}",
-                valueInputOption='RAW',
-                body=body
+                body={
+                    'requests': [{
+                        'deleteDimension': {
+                            'range': {
+                                'sheetId': sheet_id,
+                                'dimension': 'ROWS',
+                                'startIndex': row_index,
+                                'endIndex': row_index + 1
+                            }
+                        }
+                    }]
+                }
             ).execute()
             
-            logger.info(f"Updated row {row_index} in {sheet_name}")
+            logger.info(f"Deleted row {row_index + 1} from {sheet_name}")
+            _notify_row_changes(sheet_name, [
+                (self._row_to_dict(values[0], values[row_index]), None)
+            ])
             return True
             
         except HttpError as e:
-            logger.error(f"Error updating {sheet_name}: {e}")
+            logger.error(f"Error deleting from {sheet_name}: {e}")
             raise
+    
+    @staticmethod
+    def _row_to_dict(headers: List[str], row_data: List) -> Dict:
+        """Convert raw row values to a dict, padding short rows."""
+        padded_row = row_data + [''] * (len(headers) - len(row_data))
+        return dict(zip(headers, padded_row))
+    
+    @staticmethod
+    def _apply_patch(headers: List[str], row_data: List, data: Dict) -> List:
+        """Return a copy of raw row values with updated columns applied."""
+        updated_row = row_data.copy()
+        
+        for header, new_value in data.items():
+            if header in headers:
+                col_index = headers.index(header)
+                if col_index < len(updated_row):
+                    updated_row[col_index] = new_value
+                else:
+                    # Extend row if needed
+                    updated_row.extend([''] * (col_index - len(updated_row) + 1))
+                    updated_row[col_index] = new_value
+        
+        return updated_row
@@ -0,0 +1,249 @@
+"""
+Service for managing Operations Dashboard tasks in Google Sheets.
+"""
+
+from typing import Dict, List, Optional
+from datetime import datetime
+from app.services.sheets_service import SheetsService
+from app.models.task import Task, TaskCreate, TaskUpdate, TaskBulkUpdateItem
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TaskService:
+    """Service for Kanban task operations."""
+
+    def __init__(self, sheets_service: SheetsService):
+        """Initialize task service with sheets service."""
+        self.sheets = sheets_service
+        self.sheet_name = "Tasks"
+
+    def _generate_task_id(self) -> str:
+        """Generate next sequential task ID."""
+        try:
+            rows = self.sheets.get_all_rows(self.sheet_name)
+
+            # Extract numeric part from existing IDs
+            max_num = 0
+            for row in rows:
+                task_id = row.get('task_id', '')
+                if task_id.startswith('T'):
+                    try:
+                        num = int(task_id[1:])
+                        max_num = max(max_num, num)
+                    except ValueError:
+                        continue
+
+            return f"T{max_num + 1:03d}"
+
+        except Exception as e:
+            logger.error(f"Error generating task ID: {e}")
+            # Fallback to timestamp-based ID
+            return f"T{datetime.now().strftime('%Y%m%d%H%M%S')}"
+
+    def _to_task(self, row: Dict) -> Task:
+        """Build a Task from a sheet row, treating empty cells as unset."""
+        return Task(**{
+            key: value for key, value in row.items()
+            if value != '' or key in ("title", "task_id", "created_date", "updated_date")
+        })
+
+    def list_tasks(self, status: Optional[str] = None) -> List[Task]:
+        """
+        List all tasks with optional status filter.
+
+        Args:
+            status: Filter by status
+
+        Returns:
+            List of tasks
+        """
+        rows = self.sheets.get_all_rows(self.sheet_name)
+
+        tasks = []
+        for row_dict in rows:
+            if not row_dict or not row_dict.get('task_id'):
+                continue
+
+            if status and row_dict.get('status') != status:
+                continue
+
+            try:
+                tasks.append(self._to_task(row_dict))
+            except Exception as e:
+                logger.warning(f"Error parsing task row: {e}")
+                continue
+
+        logger.info(f"Retrieved {len(tasks)} tasks")
+        return tasks
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """
+        Get a single task by ID.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Task if found, None otherwise
+        """
+        task_row = self.sheets.find_row(self.sheet_name, "task_id", task_id)
+
+        if not task_row:
+            return None
+
+        return self._to_task(task_row)
+
+    def create_task(self, task_data: TaskCreate) -> Task:
+        """
+        Create a new task.
+
+        Args:
+            task_data: Task creation data
+
+        Returns:
+            Created task
+        """
+        task_id = self._generate_task_id()
+        now = datetime.now().isoformat()
+
+        task_row = {
+            "task_id": task_id,
+            "title": task_data.title,
+            "description": task_data.description or "",
+            "status": task_data.status,
+            "priority": task_data.priority,
+            "assigned_to": task_data.assigned_to or "",
+            "client_id": task_data.client_id or "",
+            "invoice_id": task_data.invoice_id or "",
+            "due_date": task_data.due_date or "",
+            "created_date": now,
+            "updated_date": now
+        }
+
+        success = self.sheets.append_row(self.sheet_name, task_row)
+
+        if not success:
+            raise Exception("Failed to create task in Google Sheets")
+
+        logger.info(f"Created task {task_id}")
+
+        return self._to_task(task_row)
+
+    def _build_update_data(self, updates: TaskUpdate) -> Dict:
+        """Build the sheet update for the provided task fields."""
+        update_data = {
+            field: value
+            for field, value in updates.model_dump(exclude_none=True).items()
+            if field in TaskUpdate.model_fields
+        }
+        update_data["updated_date"] = datetime.now().isoformat()
+        return update_data
+
+    def update_task(self, task_id: str, updates: TaskUpdate) -> Optional[Task]:
+        """
+        Update task details.
+
+        Args:
+            task_id: Task ID
+            updates: Fields to update (only provided fields are changed)
+
+        Returns:
+            Updated task, or None if not found
+        """
+        task_row = self.sheets.update_row(
+            sheet_name=self.sheet_name,
+            key="task_id",
+            value=task_id,
+            data=self._build_update_data(updates)
+        )
+
+        if task_row is None:
+            return None
+
+        logger.info(f"Updated task {task_id}")
+
+        # update_row returns the row as written: no re-read needed
+        return self._to_task(task_row)
+
+    def update_task_status(self, task_id: str, status: str) -> Optional[Task]:
+        """
+        Update task status only.
+
+        Args:
+            task_id: Task ID
+            status: New status
+
+        Returns:
+            Updated task, or None if not found
+        """
+        task_row = self.sheets.update_row(
+            sheet_name=self.sheet_name,
+            key="task_id",
+            value=task_id,
+            data={
+                "status": status,
+                "updated_date": datetime.now().isoformat()
+            }
+        )
+
+        if task_row is None:
+            return None
+
+        logger.info(f"Updated task {task_id} status to {status}")
+
+        return self._to_task(task_row)
+
+    def delete_task(self, task_id: str) -> bool:
+        """
+        Delete a task.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        success = self.sheets.delete_row(self.sheet_name, "task_id", task_id)
+
+        if success:
+            logger.info(f"Deleted task {task_id}")
+
+        return success
+
+    def bulk_update_tasks(self, updates: List[TaskBulkUpdateItem]) -> List[Dict]:
+        """
+        Update many tasks with one read and one batched write.
+
+        Args:
+            updates: Per-task changes (last one wins for duplicate IDs)
+
+        Returns:
+            Per-task results with success flag, error or updated task
+        """
+        patches = {
+            item.task_id: self._build_update_data(item)
+            for item in updates
+        }
+
+        rows = self.sheets.batch_update_rows(self.sheet_name, "task_id", patches)
+
+        results = []
+        for task_id in patches:
+            row = rows.get(task_id)
+            if row is None:
+                results.append({
+                    "task_id": task_id,
+                    "success": False,
+                    "error": f"Task {task_id} not found"
+                })
+            else:
+                results.append({
+                    "task_id": task_id,
+                    "success": True,
+                    "data": self._to_task(row).model_dump()
+                })
+
+        logger.info(f"Bulk updated {len(patches)} tasks")
+        return results
@@ -2,21 +2,37 @@
 Service for managing Support Tickets in Google Sheets.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from app.services.sheets_service import SheetsService
-from app.schemas.ticket import Ticket, TicketCreate, TicketUpdate
+from app.services.ticket_table import TicketTable
+from app.services.revenue_rollup import parse_date
+from app.schemas.ticket import Ticket, TicketCreate, TicketUpdate, TicketBulkUpdateItem
 import logging
 
 logger = logging.getLogger(__name__)
 
+TICKET_STATUSES = ["open", "in_progress", "resolved", "closed"]
+
 
 class TicketService:
     """Service for support ticket operations."""
     
-    def __init__(self, sheets_service: SheetsService):
-        """Initialize ticket service with sheets service."""
+    def __init__(
+        self,
+        sheets_service: SheetsService,
+        ticket_table: Optional[TicketTable] = None
+    ):
+        """
+        Initialize ticket service.
+        
+        Args:
+            sheets_service: Google Sheets service instance
+            ticket_table: Cached Support_Tickets table with filter and date
+                indexes for listing (reads the sheet directly when None)
+        """
         self.sheets = sheets_service
+        self.ticket_table = ticket_table
         self.sheet_name = "Support_Tickets"
     
     def _generate_ticket_id(self) -> str:
@@ -86,56 +102,91 @@ class TicketService:
         
         return Ticket(**ticket_row)
     
+    def _filter_rows(
+        self,
+        filters: Dict[str, Optional[str]],
+        sort: Optional[str],
+        descending: bool,
+        offset: int,
+        limit: Optional[int]
+    ) -> Tuple[List[Dict], int]:
+        """Page of matching rows from a full sheet read (no cached table)."""
+        rows = [
+            row for row in self.sheets.get_all_rows(self.sheet_name)
+            if row and row.get('ticket_id')
+            and all(value is None or (row.get(field) or "") == value for field, value in filters.items())
+        ]
+        
+        if sort == "created_date":
+            dated = [(parse_date(row.get('created_date', '')), position) for position, row in enumerate(rows)]
+            ordered = sorted(
+                ((day, position) for day, position in dated if day), reverse=descending
+            )
+            positions = [position for _, position in ordered]
+            positions += [position for day, position in dated if not day]
+            rows = [rows[position] for position in positions]
+        elif descending:
+            rows.reverse()
+        
+        stop = None if limit is None else offset + limit
+        return rows[offset:stop], len(rows)
+    
     def list_tickets(
         self,
         status: Optional[str] = None,
         priority: Optional[str] = None,
         client_id: Optional[str] = None,
-        limit: Optional[int] = None
-    ) -> List[Ticket]:
+        limit: Optional[int] = None,
+        assigned_to: Optional[str] = None,
+        offset: int = 0,
+        sort: Optional[str] = None,
+        descending: bool = False
+    ) -> Tuple[List[Ticket], int]:
         """
-        List all tickets with optional filters.
+        List tickets with optional filters, sorting and pagination.
+        
+        With a cached table the filters are hash-index lookups and the
+        sort uses its created_date index, so only matching rows are
+        visited; Ticket models are built for the returned page only.
         
         Args:
             status: Filter by status
             priority: Filter by priority  
             client_id: Filter by client ID
             limit: Maximum number of tickets to return
+            assigned_to: Filter by assignee
+            offset: Number of matching tickets to skip
+            sort: "created_date", or None for sheet order
+            descending: Reverse the order (newest first)
             
         Returns:
-            List of tickets
+            Tuple of (page of tickets, total matching tickets)
         """
-        rows = self.sheets.get_all_rows(self.sheet_name)
+        # Empty filters match everything
+        filters = {
+            "status": status or None,
+            "priority": priority or None,
+            "client_id": client_id or None,
+            "assigned_to": assigned_to or None
+        }
+        if limit is not None and limit <= 0:
+            limit = None
         
-        if not rows:
-            return []
+        if self.ticket_table is not None:
+            rows, total = self.ticket_table.query(filters, sort, descending, offset, limit)
+        else:
+            rows, total = self._filter_rows(filters, sort, descending, offset, limit)
         
         tickets = []
         for row_dict in rows:
-            if not row_dict or 'ticket_id' not in row_dict:
-                continue
-            
-            # Apply filters
-            if status and row_dict.get('status') != status:
-                continue
-            if priority and row_dict.get('priority') != priority:
-                continue
-            if client_id and row_dict.get('client_id') != client_id:
-                continue
-            
             try:
-                ticket = Ticket(**row_dict)
-                tickets.append(ticket)
+                tickets.append(Ticket(**row_dict))
             except Exception as e:
                 logger.warning(f"Error parsing ticket row: {e}")
                 continue
         
-        # Apply limit
-        if limit and limit > 0:
-            tickets = tickets[:limit]
-        
-        logger.info(f"Retrieved {len(tickets)} tickets")
-        return tickets
+        logger.info(f"Retrieved {len(tickets)} of {total} tickets")
+        return tickets, total
     
     def get_ticket(self, ticket_id: str) -> Optional[Ticket]:
         """
@@ -147,24 +198,18 @@ class TicketService:
         Returns:
             Ticket if found, None otherwise
         """
-        ticket_row = self.sheets.find_row(self.sheet_name, "ticket_id", ticket_id)
+        if self.ticket_table is not None:
+            ticket_row = self.ticket_table.get(ticket_id)
+        else:
+            ticket_row = self.sheets.find_row(self.sheet_name, "ticket_id", ticket_id)
         
         if not ticket_row:
             return None
         
         return Ticket(**ticket_row)
     
-    def update_ticket(self, ticket_id: str, updates: TicketUpdate) -> Ticket:
-        """
-        Update ticket details.
-        
-        Args:
-            ticket_id: Ticket ID
-            updates: Fields to update
-            
-        Returns:
-            Updated ticket
-        """
+    def _build_update_data(self, updates: TicketUpdate) -> Dict:
+        """Build the sheet update for the provided ticket fields."""
         # Build update dictionary (only include provided fields)
         update_data = {}
         if updates.title is not None:
@@ -186,23 +231,44 @@ class TicketService:
         # Always update the updated_date
         update_data["updated_date"] = datetime.now().date().isoformat()
         
-        # Update in Google Sheets
-        success = self.sheets.update_row(
+        return update_data
+    
+    def _update_row(self, ticket_id: str, update_data: Dict) -> Optional[Dict]:
+        """
+        Write a ticket patch and return the row as written.
+        
+        The cached table's row number lets the write skip the full-sheet
+        lookup; the table itself is patched by the row listener.
+        """
+        return self.sheets.update_row(
             sheet_name=self.sheet_name,
             key="ticket_id",
             value=ticket_id,
-            data=update_data
+            data=update_data,
+            row_number=self.ticket_table.row_number(ticket_id) if self.ticket_table is not None else None
         )
+    
+    def update_ticket(self, ticket_id: str, updates: TicketUpdate) -> Optional[Ticket]:
+        """
+        Update ticket details.
         
-        if not success:
-            raise Exception(f"Failed to update ticket {ticket_id}")
+        Args:
+            ticket_id: Ticket ID
+            updates: Fields to update
+            
+        Returns:
+            Updated ticket, or None if not found
+        """
+        ticket_row = self._update_row(ticket_id, self._build_update_data(updates))
+        
+        if ticket_row is None:
+            return None
         
         logger.info(f"Updated ticket {ticket_id}")
         
-        # Return updated ticket
-        return self.get_ticket(ticket_id)
+        return Ticket(**ticket_row)
     
-    def update_status(self, ticket_id: str, status: str) -> Ticket:
+    def update_status(self, ticket_id: str, status: str) -> Optional[Ticket]:
         """
         Update ticket status only.
         
@@ -211,7 +277,7 @@ class TicketService:
             status: New status
             
         Returns:
-            Updated ticket
+            Updated ticket, or None if not found
         """
         update_data = {
             "status": status,
@@ -222,16 +288,56 @@ class TicketService:
         if status == "resolved":
             update_data["resolved_date"] = datetime.now().date().isoformat()
         
-        success = self.sheets.update_row(
-            sheet_name=self.sheet_name,
-            key="ticket_id",
-            value=ticket_id,
-            data=update_data
-        )
+        ticket_row = self._update_row(ticket_id, update_data)
         
-        if not success:
-            raise Exception(f"Failed to update ticket {ticket_id} status")
+        if ticket_row is None:
+            return None
         
         logger.info(f"Updated ticket {ticket_id} status to {status}")
         
-        return self.get_ticket(ticket_id)
+        return Ticket(**ticket_row)
+    
+    def bulk_update_tickets(self, updates: List[TicketBulkUpdateItem]) -> List[Dict]:
+        """
+        Update many tickets with one read and one batched write.
+        
+        Args:
+            updates: Per-ticket changes (last one wins for duplicate IDs)
+            
+        Returns:
+            Per-ticket results with success flag, error or updated ticket
+        """
+        results = {}
+        patches = {}
+        
+        for item in updates:
+            if item.status is not None and item.status not in TICKET_STATUSES:
+                results[item.ticket_id] = {
+                    "ticket_id": item.ticket_id,
+                    "success": False,
+                    "error": f"Invalid status. Must be one of: {', '.join(TICKET_STATUSES)}"
+                }
+                patches.pop(item.ticket_id, None)
+                continue
+            patches[item.ticket_id] = self._build_update_data(item)
+            results.pop(item.ticket_id, None)
+        
+        rows = self.sheets.batch_update_rows(self.sheet_name, "ticket_id", patches)
+        
+        for ticket_id in patches:
+            row = rows.get(ticket_id)
+            if row is None:
+                results[ticket_id] = {
+                    "ticket_id": ticket_id,
+                    "success": False,
+                    "error": f"Ticket {ticket_id} not found"
+                }
+            else:
+                results[ticket_id] = {
+                    "ticket_id": ticket_id,
+                    "success": True,
+                    "data": Ticket(**row).dict()
+                }
+        
+        logger.info(f"Bulk updated {len(patches)} tickets")
+        return list(results.values())
@@ -0,0 +1,257 @@
+"""
+Ticket Table - Cached Support_Tickets sheet with filter and date indexes.
+Rows stay in sheet order; hash indexes map each status, priority,
+client_id and assigned_to value to its row positions, and a sorted list
+of (created_date, row) orders tickets by date, so a filtered, sorted page
+only visits the rows that match.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import bisect
+import itertools
+import logging
+import time
+
+from app.services.sheets_service import SheetsService, RowChange, add_row_listener
+from app.services.revenue_rollup import parse_date
+
+logger = logging.getLogger(__name__)
+
+# Fields with an exact-match hash index
+INDEXED_FIELDS = ("status", "priority", "client_id", "assigned_to")
+
+# Matches at most this share of the table are sorted directly; larger ones
+# are read off the date index in order
+SORT_DIRECT_RATIO = 8
+
+# Sort key of a dated row: (ISO created date, row position)
+DateKey = Tuple[str, int]
+
+
+class TicketTable:
+    """In-memory Support_Tickets sheet kept current from ticket writes."""
+
+    def __init__(self, sheets_service: SheetsService, ttl_seconds: int = 0):
+        """
+        Initialize table and subscribe to ticket writes.
+
+        Args:
+            sheets_service: Google Sheets service instance
+            ttl_seconds: Reload from the sheet when older than this, to pick
+                up edits made directly in Google Sheets (0 = never)
+        """
+        self.sheets = sheets_service
+        self.sheet_name = "Support_Tickets"
+        self.ttl_seconds = ttl_seconds
+
+        # Ticket rows in sheet order (blank ticket IDs skipped)
+        self.rows: List[Dict] = []
+        self._positions: Dict[str, int] = {}
+        # Sheet row numbers as of the last load (write hints; appends unknown)
+        self._row_numbers: Dict[str, int] = {}
+        # field -> value -> positions of the rows holding it
+        self._index: Dict[str, Dict[str, Set[int]]] = {}
+        # Rows with a valid created_date, sorted by date then sheet order,
+        # and the positions of the rest
+        self._date_keys: List[DateKey] = []
+        self._undated: List[int] = []
+        # ISO created date per position (None when missing or invalid)
+        self._dates: List[Optional[str]] = []
+
+        self._loaded_at: Optional[float] = None
+        # Bumped when a load finds different rows, and on every change
+        # (for ETags); TTL reloads of an unchanged sheet keep it
+        self.version = 0
+        add_row_listener(self._on_row_change)
+
+    @staticmethod
+    def _date_key(row: Dict) -> Optional[str]:
+        """Normalized ISO created date of a row, None when missing or invalid."""
+        day = parse_date(row.get("created_date", ""))
+        return day.isoformat() if day else None
+
+    def load(self) -> None:
+        """Load all tickets with one read and build the indexes once."""
+        previous_rows = self.rows
+        self.rows = []
+        self._positions = {}
+        self._row_numbers = {}
+        self._index = {field: {} for field in INDEXED_FIELDS}
+        date_keys = []
+        self._undated = []
+        self._dates = []
+
+        # Row 1 is headers
+        for row_number, row in enumerate(self.sheets.get_all_rows(self.sheet_name), start=2):
+            ticket_id = row.get("ticket_id")
+            if not ticket_id:
+                continue
+            position = len(self.rows)
+            self.rows.append(row)
+            self._positions[ticket_id] = position
+            self._row_numbers.setdefault(ticket_id, row_number)
+            self._index_fields(row, position)
+            day = self._date_key(row)
+            self._dates.append(day)
+            if day:
+                date_keys.append((day, position))
+            else:
+                self._undated.append(position)
+
+        date_keys.sort()
+        self._date_keys = date_keys
+        if self._loaded_at is None or self.rows != previous_rows:
+            self.version += 1
+        self._loaded_at = time.monotonic()
+        logger.info(f"Loaded ticket table with {len(self.rows)} tickets")
+
+    def ensure_loaded(self) -> None:
+        """Load on first use and when the TTL has expired."""
+        if self._loaded_at is None or (
+            self.ttl_seconds > 0
+            and time.monotonic() - self._loaded_at > self.ttl_seconds
+        ):
+            self.load()
+
+    def _index_fields(self, row: Dict, position: int) -> None:
+        for field in INDEXED_FIELDS:
+            self._index[field].setdefault(row.get(field) or "", set()).add(position)
+
+    def _unindex_fields(self, row: Dict, position: int) -> None:
+        for field in INDEXED_FIELDS:
+            value = row.get(field) or ""
+            positions = self._index[field].get(value)
+            if positions is None:
+                continue
+            positions.discard(position)
+            if not positions:
+                del self._index[field][value]
+
+    def _add_date_key(self, row: Dict, position: int) -> None:
+        day = self._date_key(row)
+        self._dates[position] = day
+        if day:
+            bisect.insort(self._date_keys, (day, position))
+        else:
+            bisect.insort(self._undated, position)
+
+    def _remove_date_key(self, position: int) -> None:
+        day = self._dates[position]
+        keys = self._date_keys if day else self._undated
+        key = (day, position) if day else position
+        index = bisect.bisect_left(keys, key)
+        if index < len(keys) and keys[index] == key:
+            keys.pop(index)
+
+    def _on_row_change(self, sheet_name: str, changes: List[RowChange]) -> None:
+        """Apply ticket writes made by the app to the table."""
+        if sheet_name != self.sheet_name or self._loaded_at is None:
+            return
+
+        for before, after in changes:
+            ticket_id = (after or before or {}).get("ticket_id")
+            position = self._positions.get(ticket_id) if ticket_id else None
+
+            if after is None or (before and before.get("ticket_id") != after.get("ticket_id")):
+                # Deletes (and ID changes) shift row positions; reload on next use
+                self._loaded_at = None
+                self.version += 1
+                return
+
+            if position is None:
+                position = len(self.rows)
+                self.rows.append(after)
+                self._dates.append(None)
+                self._positions[ticket_id] = position
+            else:
+                self._unindex_fields(self.rows[position], position)
+                self._remove_date_key(position)
+                self.rows[position] = after
+            self._index_fields(after, position)
+            self._add_date_key(after, position)
+        self.version += 1
+
+    def get(self, ticket_id: str) -> Optional[Dict]:
+        """Ticket row by ID."""
+        self.ensure_loaded()
+        position = self._positions.get(ticket_id)
+        return self.rows[position] if position is not None else None
+
+    def row_number(self, ticket_id: str) -> Optional[int]:
+        """Sheet row of a ticket as of the last load, None when unknown."""
+        return self._row_numbers.get(ticket_id) if self._loaded_at is not None else None
+
+    def _matches(self, filters: Dict[str, Optional[str]]) -> Optional[Set[int]]:
+        """Positions matching every given filter (None when nothing is filtered)."""
+        sets = []
+        for field, value in filters.items():
+            if value is None:
+                continue
+            positions = self._index[field].get(value)
+            if not positions:
+                return set()
+            sets.append(positions)
+        if not sets:
+            return None
+        # Intersect from the rarest value: never touches more than its rows
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def _date_order(self, matches: Optional[Set[int]], descending: bool) -> Iterable[int]:
+        """Positions by created_date (undated rows last, in sheet order)."""
+        if matches is not None and len(matches) * SORT_DIRECT_RATIO < len(self.rows):
+            dated = sorted(
+                ((self._dates[position], position) for position in matches if self._dates[position]),
+                reverse=descending
+            )
+            undated = sorted(position for position in matches if not self._dates[position])
+            return itertools.chain((position for _, position in dated), undated)
+
+        keys = reversed(self._date_keys) if descending else iter(self._date_keys)
+        dated: Iterator[int] = (position for _, position in keys)
+        undated: Iterator[int] = iter(self._undated)
+        if matches is not None:
+            dated = (position for position in dated if position in matches)
+            undated = (position for position in undated if position in matches)
+        return itertools.chain(dated, undated)
+
+    def query(
+        self,
+        filters: Dict[str, Optional[str]],
+        sort: Optional[str] = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Tuple[List[Dict], int]:
+        """
+        A page of tickets matching exact-value filters.
+
+        Filters intersect the hash indexes starting from the rarest value;
+        a created_date sort either sorts the matches or, when they are a
+        large share of the table, walks the date index until the page is
+        full.
+
+        Args:
+            filters: INDEXED_FIELDS field -> required value (None = any)
+            sort: "created_date", or None for sheet order
+            descending: Reverse the order
+            offset: Matching rows to skip
+            limit: Maximum rows to return (None = all)
+
+        Returns:
+            (page of ticket rows, total matching rows)
+        """
+        self.ensure_loaded()
+        matches = self._matches(filters)
+        total = len(self.rows) if matches is None else len(matches)
+        stop = None if limit is None else offset + limit
+
+        if sort == "created_date":
+            positions = itertools.islice(self._date_order(matches, descending), offset, stop)
+        elif matches is None:
+            ordered = range(len(self.rows) - 1, -1, -1) if descending else range(len(self.rows))
+            positions = ordered[offset:stop]
+        else:
+            positions = sorted(matches, reverse=descending)[offset:stop]
+
+        return [self.rows[position] for position in positions], total
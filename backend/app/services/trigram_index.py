@@ -0,0 +1,142 @@
+"""
+Trigram Index - Typo-tolerant lookup over short text fields.
+Words are split into padded character trigrams (as in PostgreSQL's
+pg_trgm), so "Acme Copr" still shares most trigrams with "Acme Corp".
+Postings are scanned rarest trigram first, verifying each new row once;
+a row missing from the first p postings shares at most |Q| - p trigrams,
+so the scan stops as soon as no unseen row can reach the threshold or
+enter the current top K, and common trigrams are rarely read at all.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+import heapq
+import math
+import re
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Trigrams of every word, each padded with two leading and one trailing space."""
+    grams = set()
+    for word in _WORD_RE.findall(str(text or "").lower()):
+        padded = f"  {word} "
+        grams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class TrigramIndex:
+    """Trigram postings over weighted fields of rows keyed by ID."""
+
+    def __init__(self, fields: Dict[str, float]):
+        """
+        Initialize an empty index.
+
+        Args:
+            fields: Field -> weight; a fuzzy hit scores weight x similarity
+                of its best field
+        """
+        self.fields = fields
+        self.postings: Dict[str, Set[str]] = {}
+        # row ID -> [(weight, trigrams)] of its non-empty fields
+        self._row_grams: Dict[str, List[Tuple[float, FrozenSet[str]]]] = {}
+
+    def add(self, row_id: str, row: Dict) -> None:
+        field_grams = []
+        for field, weight in self.fields.items():
+            grams = trigrams(row.get(field, ""))
+            if grams:
+                field_grams.append((weight, grams))
+        if not field_grams:
+            return
+        self._row_grams[row_id] = field_grams
+        for _, grams in field_grams:
+            for gram in grams:
+                self.postings.setdefault(gram, set()).add(row_id)
+
+    def remove(self, row_id: str) -> None:
+        for _, grams in self._row_grams.pop(row_id, ()):
+            for gram in grams:
+                ids = self.postings.get(gram)
+                if ids is None:
+                    continue
+                ids.discard(row_id)
+                if not ids:
+                    del self.postings[gram]
+
+    def clear(self) -> None:
+        self.postings = {}
+        self._row_grams = {}
+
+    def search(
+        self,
+        query: str,
+        threshold: float,
+        limit: int,
+        exclude: Optional[Set[str]] = None
+    ) -> List[Tuple[float, float, str]]:
+        """
+        Rows with a field similar to the query.
+
+        Similarity is the share of the query's trigrams found in a field,
+        so it does not drop for long values that contain the query; among
+        equal scores, fields with fewer extra trigrams (higher Jaccard
+        similarity) come first.
+
+        Args:
+            query: Search text
+            threshold: Minimum similarity (0-1]
+            limit: Maximum rows to return
+            exclude: Row IDs to skip (e.g. already found exactly)
+
+        Returns:
+            (score, similarity, row ID) of the best rows, best first,
+            with score = field weight x similarity
+        """
+        query_grams = trigrams(query)
+        if not query_grams or limit <= 0:
+            return []
+        size = len(query_grams)
+        required = max(1, math.ceil(threshold * size - 1e-9))
+        top_weight = max(self.fields.values())
+
+        # Scan postings rarest first: a row not seen after `scanned` of them
+        # lacks all those trigrams, so shares at most size - scanned
+        rarest = sorted(query_grams, key=lambda gram: len(self.postings.get(gram, ())))
+        row_grams = self._row_grams
+        seen: Set[str] = set()
+        # Min-heap of (score, jaccard, similarity, row ID)
+        heap: List[Tuple[float, float, float, str]] = []
+        for scanned, gram in enumerate(rarest):
+            unseen_best = size - scanned
+            if unseen_best < required:
+                break
+            if len(heap) >= limit and top_weight * unseen_best / size < heap[0][0]:
+                break
+            ids = self.postings.get(gram)
+            if not ids:
+                continue
+            new_ids = ids - seen
+            seen |= new_ids
+            if exclude:
+                new_ids -= exclude
+            for row_id in new_ids:
+                best = None
+                for weight, grams in row_grams[row_id]:
+                    shared = len(query_grams & grams)
+                    if shared < required:
+                        continue
+                    score = weight * shared / size
+                    if (len(heap) >= limit and score < heap[0][0]) or (best is not None and score < best[0]):
+                        continue
+                    entry = (score, shared / (size + len(grams) - shared), shared / size, row_id)
+                    if best is None or entry > best:
+                        best = entry
+                if best is None:
+                    continue
+                if len(heap) < limit:
+                    heapq.heappush(heap, best)
+                elif best > heap[0]:
+                    heapq.heapreplace(heap, best)
+
+        return [(score, similarity, row_id) for score, _, similarity, row_id in sorted(heap, reverse=True)]
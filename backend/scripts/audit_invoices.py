@@ -0,0 +1,120 @@
+"""
+Audit invoice totals against Invoice_Items.
+
+Usage:
+    python scripts/audit_invoices.py                 # audit the live spreadsheet
+    python scripts/audit_invoices.py --synthetic 1000000
+                                                     # time the audit on N synthetic items
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from app.services.audit_service import InvoiceAuditService
+
+
+class SyntheticColumns:
+    """Column source with N items spread over N / 4 invoices and a few planted errors."""
+
+    def __init__(self, item_count: int):
+        rng = np.random.default_rng(42)
+        invoice_count = max(item_count // 4, 1)
+
+        quantity = rng.integers(1, 20, item_count)
+        unit_price = rng.integers(100, 100000, item_count) / 100
+        tax = rng.choice([0, 5, 12, 18], item_count)
+        discount = rng.choice([0, 0, 5, 10], item_count)
+        line_subtotal = quantity * unit_price
+        line_total = line_subtotal * (1 + tax / 100 - discount / 100)
+        owner = rng.integers(0, invoice_count, item_count)
+
+        subtotal = np.bincount(owner, line_subtotal, invoice_count)
+        total_tax = np.bincount(owner, line_subtotal * tax / 100, invoice_count)
+        total_discount = np.bincount(owner, line_subtotal * discount / 100, invoice_count)
+        grand_total = subtotal + total_tax - total_discount
+
+        # Plant one bad line total, one bad header and one orphan
+        line_total[0] += 1
+        grand_total[-1] += 5
+        invoice_ids = [f"INV-2026-{i:06d}" for i in range(invoice_count)]
+        item_invoice_ids = [invoice_ids[i] for i in owner]
+        item_invoice_ids[-1] = "INV-MISSING"
+
+        def fmt(values):
+            return [f"{v:.2f}" for v in values]
+
+        self.sheets = {
+            "Invoices": {
+                "invoice_id": invoice_ids,
+                "subtotal": fmt(subtotal),
+                "total_tax": fmt(total_tax),
+                "total_discount": fmt(total_discount),
+                "grand_total": fmt(grand_total),
+            },
+            "Invoice_Items": {
+                "item_id": [f"ITEM-{i}" for i in range(item_count)],
+                "invoice_id": item_invoice_ids,
+                "quantity": [str(q) for q in quantity],
+                "unit_price": fmt(unit_price),
+                "tax_percent": [str(t) for t in tax],
+                "discount_percent": [str(d) for d in discount],
+                "line_total": fmt(line_total),
+            },
+        }
+
+    def get_columns(self, sheet_name, columns):
+        return {column: self.sheets[sheet_name][column] for column in columns}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit invoice totals")
+    parser.add_argument("--synthetic", type=int, help="Run on N synthetic items instead of the spreadsheet")
+    parser.add_argument("--tolerance", type=float, default=0.01)
+    parser.add_argument("--max-results", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.synthetic:
+        print(f"Building {args.synthetic:,} synthetic items...")
+        source = SyntheticColumns(args.synthetic)
+    else:
+        from app.services.sheets_service import SheetsService
+        from app.core.config import settings
+        source = SheetsService(
+            credentials_path=settings.google_sheets_credentials_path,
+            spreadsheet_id=settings.spreadsheet_id
+        )
+
+    started = time.perf_counter()
+    report = InvoiceAuditService(source).audit(
+        tolerance=args.tolerance,
+        max_results=args.max_results
+    )
+    elapsed = time.perf_counter() - started
+
+    print("\n" + "=" * 80)
+    print(f"INVOICE AUDIT: {report['invoices_checked']:,} invoices, {report['items_checked']:,} items")
+    print("=" * 80)
+    for finding, count in report["summary"].items():
+        marker = "✓" if count == 0 else "❌"
+        print(f"{marker} {finding}: {count:,}")
+
+    for mismatch in report["header_mismatches"]:
+        print(f"  {mismatch['invoice_id']} {mismatch['field']}: "
+              f"stored {mismatch['stored']} vs computed {mismatch['computed']}")
+    for mismatch in report["line_mismatches"]:
+        print(f"  {mismatch['item_id']} ({mismatch['invoice_id']}) line_total: "
+              f"stored {mismatch['stored']} vs computed {mismatch['computed']}")
+    for orphan in report["orphaned_items"]:
+        print(f"  orphan {orphan['item_id']} -> {orphan['invoice_id']}")
+
+    print(f"\nLoad {report['load_seconds']}s, total {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark the Decimal and NumPy dashboard engines.
+
+Builds revenue rollups from synthetic invoices, times one aggregation
+per engine for several date ranges and checks that both engines produce
+identical dashboards. No Google Sheets access needed.
+
+Usage:
+    python scripts/benchmark_dashboard.py [invoice_count ...]
+"""
+import sys
+import time
+import random
+from pathlib import Path
+from datetime import date, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.dashboard_service import DashboardService
+
+
+class SyntheticInvoices:
+    """Row source standing in for SheetsService.get_all_rows."""
+
+    def __init__(self, count: int):
+        rng = random.Random(42)
+        start = date(2023, 1, 1)
+        self.rows = []
+        for i in range(count):
+            grand_total = rng.randint(1000, 5000000) / 100
+            self.rows.append({
+                "invoice_id": f"INV-{i:07d}",
+                "client_id": f"CLT{rng.randint(1, 2000):04d}",
+                "client_name": "Client",
+                "invoice_date": (start + timedelta(days=rng.randint(0, 3 * 365))).isoformat(),
+                "grand_total": f"{grand_total:.2f}",
+                "total_tax": f"{grand_total * 0.18:.2f}",
+                "total_discount": f"{grand_total * 0.02:.2f}",
+                "status": rng.choice(["paid", "pending", "overdue", "draft"]),
+                "sales_person": f"Sales {rng.randint(1, 40)}",
+            })
+
+    def get_all_rows(self, sheet_name):
+        return self.rows if sheet_name == "Invoices" else []
+
+
+RANGES = [
+    ("all time", None, None),
+    ("one year", "2024-01-01", "2024-12-31"),
+    ("one month", "2025-06-01", "2025-06-30"),
+]
+
+
+def timed(fn, repeat: int = 3) -> float:
+    """Best of several runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def views(service: DashboardService, start_date, end_date):
+    return (
+        service.get_executive_metrics(start_date, end_date),
+        service.get_sales_metrics(start_date, end_date),
+        service.get_financial_metrics(start_date, end_date),
+    )
+
+
+def run(count: int):
+    source = SyntheticInvoices(count)
+    decimal_service = DashboardService(source, engine="decimal")
+    numpy_service = DashboardService(source, engine="numpy")
+
+    started = time.perf_counter()
+    decimal_service.rollups.rebuild()
+    build_ms = (time.perf_counter() - started) * 1000
+    numpy_service.rollups.rebuild()
+
+    cells = sum(1 for _ in numpy_service.rollups.iter_cells())
+    started = time.perf_counter()
+    numpy_service.columnar._build()
+    columns_ms = (time.perf_counter() - started) * 1000
+
+    print(f"\n{count:,} invoices -> {cells:,} rollup cells "
+          f"(rollup build {build_ms:.0f} ms, column build {columns_ms:.0f} ms)")
+    print(f"{'range':<12}{'decimal ms':>12}{'numpy ms':>12}{'speedup':>10}  match")
+
+    for label, start_date, end_date in RANGES:
+        start, end, dated_only = decimal_service._resolve_range(start_date, end_date)
+
+        decimal_ms = timed(lambda: decimal_service._aggregate_cells(start, end, dated_only))
+        numpy_ms = timed(lambda: numpy_service.columnar.aggregate(start, end, dated_only))
+        match = views(decimal_service, start_date, end_date) == views(numpy_service, start_date, end_date)
+
+        print(f"{label:<12}{decimal_ms:>12.1f}{numpy_ms:>12.1f}{decimal_ms / numpy_ms:>9.1f}x  "
+              f"{'✓' if match else '❌'}")
+
+    # Writes patch both engines in place
+    changes = []
+    for row in source.rows[:100]:
+        changes.append((dict(row), dict(row, status="paid", grand_total="123.45")))
+    started = time.perf_counter()
+    for service in (decimal_service, numpy_service):
+        service.rollups._on_row_change("Invoices", changes)
+    update_ms = (time.perf_counter() - started) * 1000
+    match = views(decimal_service, None, None) == views(numpy_service, None, None)
+    print(f"100 invoice updates applied in {update_ms:.1f} ms, engines "
+          f"{'still match ✓' if match else 'differ ❌'}")
+
+
+if __name__ == "__main__":
+    counts = [int(arg) for arg in sys.argv[1:]] or [10000, 50000, 200000]
+    for count in counts:
+        run(count)
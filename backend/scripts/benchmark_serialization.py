@@ -0,0 +1,108 @@
+"""
+Benchmark per-row serialization cost of the invoice list response.
+
+Compares the model path (InvoiceResponse -> .dict() -> ApiResponse -> JSON)
+with the fast path (RowSerializer -> orjson bytes), after checking that
+both produce the same JSON.
+No Google Sheets access needed; rows are synthetic.
+"""
+import sys
+import json
+import time
+from pathlib import Path
+from datetime import date, datetime
+from decimal import Decimal
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.schemas.invoice import InvoiceResponse, ApiResponse, INVOICE_SUMMARY_SERIALIZER
+from app.core.serialization import dumps
+
+
+def make_rows(count: int):
+    """Build synthetic Invoices sheet rows."""
+    rows = []
+    for i in range(count):
+        rows.append({
+            "invoice_id": f"INV-2026-{i:05d}",
+            "client_id": f"CLT{i % 250:03d}",
+            "client_name": f"Client {i % 250}",
+            "invoice_date": "2026-01-23",
+            "due_date": "2026-02-23",
+            "subtotal": "500000",
+            "total_tax": "90000.00",
+            "total_discount": "50000.0",
+            "grand_total": "540000.00",
+            "status": "pending",
+            "sales_person": "Rajesh Kumar",
+            "created_by": "System",
+            "created_at": "2026-01-23T10:15:30.123456",
+            "updated_at": "2026-01-23T10:15:30.123456"
+        })
+    return rows
+
+
+def model_path(rows):
+    """Original path: build models, dump, wrap, encode (as the response_model route did)."""
+    invoices = []
+    for invoice in rows:
+        invoices.append(InvoiceResponse(
+            invoice_id=invoice.get("invoice_id", ""),
+            client_id=invoice.get("client_id", ""),
+            client_name=invoice.get("client_name", ""),
+            invoice_date=date.fromisoformat(invoice.get("invoice_date", "")),
+            due_date=date.fromisoformat(invoice.get("due_date", "")),
+            subtotal=Decimal(invoice.get("subtotal", 0)),
+            total_tax=Decimal(invoice.get("total_tax", 0)),
+            total_discount=Decimal(invoice.get("total_discount", 0)),
+            grand_total=Decimal(invoice.get("grand_total", 0)),
+            status=invoice.get("status", "draft"),
+            sales_person=invoice.get("sales_person", ""),
+            items=[],
+            created_at=datetime.fromisoformat(invoice.get("created_at", ""))
+        ))
+    response = ApiResponse(
+        success=True,
+        message=f"Retrieved {len(invoices)} invoices",
+        data={"invoices": [inv.dict() for inv in invoices], "total": len(invoices)}
+    )
+    return json.dumps(response.model_dump(mode="json")).encode()
+
+
+def fast_path(rows):
+    """Fast path: pre-built serializer straight to orjson bytes."""
+    invoices = INVOICE_SUMMARY_SERIALIZER.serialize_many(rows)
+    return dumps({
+        "success": True,
+        "message": f"Retrieved {len(invoices)} invoices",
+        "data": {"invoices": invoices, "total": len(invoices)}
+    })
+
+
+def bench(fn, rows, repeat: int = 5) -> float:
+    """Return best per-row time in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - start)
+    return best / len(rows) * 1_000_000
+
+
+def main():
+    """Check both paths agree, then run benchmark for a few table sizes."""
+    rows = make_rows(100)
+    assert json.loads(model_path(rows)) == json.loads(fast_path(rows)), \
+        "fast path output differs from the model path"
+
+    print(f"{'rows':>8} {'model us/row':>14} {'fast us/row':>13} {'speedup':>9}")
+    for count in (100, 1_000, 10_000):
+        rows = make_rows(count)
+        before = bench(model_path, rows)
+        after = bench(fast_path, rows)
+        print(f"{count:>8} {before:>14.2f} {after:>13.2f} {before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
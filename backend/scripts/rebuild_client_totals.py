@@ -0,0 +1,36 @@
+"""
+Rebuild Clients.total_invoices / total_revenue from the Invoices sheet.
+
+Totals are kept current incrementally by the API; run this to backfill
+existing data or to correct drift after editing invoices in the sheet.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.sheets_service import SheetsService
+from app.services.client_totals_service import ClientTotalsService
+from app.core.config import settings
+
+sheets = SheetsService(
+    credentials_path=settings.google_sheets_credentials_path,
+    spreadsheet_id=settings.spreadsheet_id
+)
+
+print("\n" + "="*80)
+print("REBUILDING CLIENT TOTALS")
+print("="*80)
+
+result = ClientTotalsService(sheets).rebuild()
+
+for correction in result["corrections"]:
+    stored = correction["stored"]
+    rebuilt = correction["rebuilt"]
+    print(f"\n📝 {correction['client_id']}: "
+          f"{stored['total_invoices'] or '-'} invoices / {stored['total_revenue'] or '-'} revenue "
+          f"→ {rebuilt['total_invoices']} / {rebuilt['total_revenue']}")
+
+for client_id in result["unknown_client_ids"]:
+    print(f"\n❌ Invoices reference unknown client {client_id}")
+
+print(f"\n✅ Checked {result['clients_checked']} clients, corrected {result['clients_corrected']}")
@@ -0,0 +1,142 @@
+"""
+Shared fixtures: an in-memory Google Sheets API behind a real SheetsService.
+
+Sheets are lists of rows (row 1 is headers), so tests can also edit them
+directly to simulate changes made in Google Sheets.
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services import sheets_service as sheets_module  # noqa: E402
+from app.services.sheets_service import SheetsService  # noqa: E402
+
+
+class _Request:
+    def __init__(self, run):
+        self._run = run
+
+    def execute(self):
+        return self._run()
+
+
+class FakeValues:
+    """The spreadsheets().values() calls SheetsService makes."""
+
+    def __init__(self, sheets: Dict[str, List[List[str]]]):
+        self.sheets = sheets
+
+    def _range(self, range_name: str):
+        sheet_name, cells = range_name.split("!")
+        rows = self.sheets.setdefault(sheet_name, [])
+        match = re.match(r"A(\d+):Z(\d+)$", cells)
+        if match:
+            first, last = int(match.group(1)), int(match.group(2))
+        else:
+            first, last = 1, len(rows)
+        return sheet_name, first, last
+
+    def _read(self, range_name: str) -> Dict:
+        sheet_name, first, last = self._range(range_name)
+        values = [list(row) for row in self.sheets[sheet_name][first - 1:last]]
+        return {"values": values} if values else {}
+
+    def get(self, spreadsheetId, range):
+        return _Request(lambda: self._read(range))
+
+    def batchGet(self, spreadsheetId, ranges):
+        return _Request(lambda: {"valueRanges": [self._read(name) for name in ranges]})
+
+    def append(self, spreadsheetId, range, valueInputOption, body, insertDataOption=None):
+        sheet_name, _, _ = self._range(range)
+
+        def run():
+            self.sheets[sheet_name].extend(list(row) for row in body["values"])
+            return {}
+        return _Request(run)
+
+    def _write(self, range_name: str, values: List[List[str]]) -> None:
+        sheet_name, first, _ = self._range(range_name)
+        self.sheets[sheet_name][first - 1] = list(values[0])
+
+    def update(self, spreadsheetId, range, valueInputOption, body):
+        return _Request(lambda: self._write(range, body["values"]) or {})
+
+    def batchUpdate(self, spreadsheetId, body):
+        def run():
+            for data in body["data"]:
+                self._write(data["range"], data["values"])
+            return {}
+        return _Request(run)
+
+
+class FakeSpreadsheets:
+    """The spreadsheets() calls SheetsService makes (values, metadata, row deletes)."""
+
+    def __init__(self, sheets: Dict[str, List[List[str]]]):
+        self.sheets = sheets
+        self._values = FakeValues(sheets)
+
+    def values(self):
+        return self._values
+
+    def _sheet_ids(self) -> List[str]:
+        return list(self.sheets)
+
+    def get(self, spreadsheetId, fields=None):
+        return _Request(lambda: {"sheets": [
+            {"properties": {"title": name, "sheetId": index}}
+            for index, name in enumerate(self._sheet_ids())
+        ]})
+
+    def batchUpdate(self, spreadsheetId, body):
+        def run():
+            for request in body["requests"]:
+                rows = request["deleteDimension"]["range"]
+                sheet_name = self._sheet_ids()[rows["sheetId"]]
+                del self.sheets[sheet_name][rows["startIndex"]:rows["endIndex"]]
+            return {}
+        return _Request(run)
+
+
+class FakeSheetsApi:
+    """Stand-in for the googleapiclient service object."""
+
+    def __init__(self, sheets: Dict[str, List[List[str]]]):
+        self._spreadsheets = FakeSpreadsheets(sheets)
+
+    def spreadsheets(self):
+        return self._spreadsheets
+
+
+@pytest.fixture(autouse=True)
+def isolated_listeners():
+    """Drop row listeners and sheet versions registered by each test."""
+    listeners = list(sheets_module._row_change_listeners)
+    yield
+    sheets_module._row_change_listeners[:] = listeners
+    sheets_module._sheet_versions.clear()
+    sheets_module._sheet_fingerprints.clear()
+    sheets_module._sheet_checked_at.clear()
+
+
+@pytest.fixture
+def sheet_data() -> Dict[str, List[List[str]]]:
+    """Sheet name -> rows (headers first); fill before building services."""
+    return {}
+
+
+@pytest.fixture
+def sheets(sheet_data) -> SheetsService:
+    """SheetsService reading and writing sheet_data."""
+    service = SheetsService.__new__(SheetsService)
+    service.spreadsheet_id = "test"
+    service.service = FakeSheetsApi(sheet_data)
+    return service
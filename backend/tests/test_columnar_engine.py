@@ -0,0 +1,112 @@
+"""
+The NumPy columnar engine must give the same dashboards as the Decimal path.
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.services.dashboard_service import DashboardService  # noqa: E402
+
+INVOICE_HEADERS = [
+    "invoice_id", "client_id", "client_name", "invoice_date",
+    "total_tax", "total_discount", "grand_total", "status", "sales_person",
+]
+RANGES = [
+    (None, None),
+    ("2025-01-01", "2025-06-30"),
+    ("2025-03-15", "2025-03-15"),
+    ("2024-12-01", None),
+    (None, "2025-02-28"),
+]
+
+
+def _amount(rng: random.Random, places: int = 2) -> str:
+    return f"{rng.randint(0, 10 ** 7) / 10 ** places:.{places}f}"
+
+
+def _invoice(rng: random.Random, invoice_id: str) -> dict:
+    day = date(2025, 1, 1) + timedelta(days=rng.randint(-60, 240))
+    return {
+        "invoice_id": invoice_id,
+        "client_id": f"CLT{rng.randrange(15):03d}",
+        "client_name": "Client",
+        "invoice_date": rng.choice([day.isoformat()] * 9 + ["", "not a date"]),
+        "total_tax": _amount(rng),
+        "total_discount": _amount(rng),
+        "grand_total": _amount(rng),
+        "status": rng.choice(["draft", "pending", "paid", "overdue"]),
+        "sales_person": rng.choice(["Asha", "Ravi", "Meera", "Unknown"]),
+    }
+
+
+@pytest.fixture
+def rng(sheet_data):
+    rng = random.Random(36)
+    sheet_data["Clients"] = [["client_id", "created_date"]]
+    sheet_data["Invoices"] = [INVOICE_HEADERS] + [
+        [_invoice(rng, f"INV-{i:04d}").get(header, "") for header in INVOICE_HEADERS]
+        for i in range(300)
+    ]
+    return rng
+
+
+def _dashboards(dashboard: DashboardService) -> list:
+    results = []
+    for start, end in RANGES:
+        sections = dashboard.get_dashboard(start, end)["sections"]
+        results.append(sections)
+    return results
+
+
+def _assert_same(sheets) -> DashboardService:
+    columnar = DashboardService(sheets, engine="numpy")
+    assert columnar.columnar is not None
+    assert _dashboards(columnar) == _dashboards(DashboardService(sheets))
+    return columnar
+
+
+def test_columnar_matches_decimal(sheets, rng):
+    columnar = _assert_same(sheets)
+    assert columnar.columnar.exact
+
+
+def test_columnar_matches_decimal_after_writes(sheets, rng):
+    columnar = DashboardService(sheets, engine="numpy")
+    _dashboards(columnar)
+
+    for i in range(60):
+        invoice_ids = [row["invoice_id"] for row in sheets.get_all_rows("Invoices")]
+        if i % 3 == 0:
+            sheets.append_row("Invoices", _invoice(rng, f"INV-{1000 + i}"))
+        elif i % 3 == 1:
+            changed = _invoice(rng, "")
+            sheets.update_row("Invoices", "invoice_id", rng.choice(invoice_ids), {
+                "grand_total": changed["grand_total"], "status": changed["status"],
+            })
+        else:
+            sheets.delete_row("Invoices", "invoice_id", rng.choice(invoice_ids))
+
+    assert _dashboards(columnar) == _dashboards(DashboardService(sheets))
+
+
+def test_columnar_rescales_for_extra_decimal_places(sheets, rng):
+    columnar = DashboardService(sheets, engine="numpy")
+    _dashboards(columnar)
+
+    invoice = _invoice(rng, "INV-PRECISE")
+    invoice["grand_total"] = _amount(rng, places=5)
+    sheets.append_row("Invoices", invoice)
+
+    assert _dashboards(columnar) == _dashboards(DashboardService(sheets))
+    assert columnar.columnar.exact
+
+
+def test_columnar_falls_back_when_amounts_overflow(sheets, sheet_data, rng):
+    sheet_data["Invoices"][1][INVOICE_HEADERS.index("grand_total")] = "9" * 25 + ".99"
+
+    columnar = _assert_same(sheets)
+    assert not columnar.columnar.exact
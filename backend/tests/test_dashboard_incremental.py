@@ -0,0 +1,178 @@
+"""
+Incrementally maintained dashboard state must match a rebuild from the sheet.
+
+Covers revenue rollups, leaderboards and client cohorts after a mix of
+invoice and client writes made through SheetsService.
+"""
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.services.dashboard_service import DashboardService
+from app.services.leaderboards import LEADERBOARD_DIMENSIONS, LEADERBOARD_WINDOWS
+
+INVOICE_HEADERS = [
+    "invoice_id", "client_id", "client_name", "invoice_date", "due_date",
+    "subtotal", "total_tax", "total_discount", "grand_total", "status",
+    "sales_person", "created_by", "created_at", "updated_at",
+]
+CLIENT_HEADERS = ["client_id", "name", "created_date"]
+
+STATUSES = ["draft", "pending", "paid", "overdue"]
+SALESPEOPLE = ["Asha", "Ravi", "Meera"]
+
+
+def _day(rng: random.Random) -> str:
+    # Mostly recent, so the rolling leaderboard windows see changes too
+    return (date.today() - timedelta(days=rng.randint(0, 400))).isoformat()
+
+
+def _invoice(rng: random.Random, invoice_id: str, client_count: int) -> dict:
+    client = rng.randrange(client_count)
+    total = Decimal(rng.randint(100, 100000)) / 100
+    return {
+        "invoice_id": invoice_id,
+        "client_id": f"CLT{client:03d}",
+        "client_name": f"Client {client}",
+        "invoice_date": rng.choice([_day(rng), _day(rng), _day(rng), ""]),
+        "due_date": "",
+        "subtotal": str(total),
+        "total_tax": str(total / 10),
+        "total_discount": str(total / 20),
+        "grand_total": str(total),
+        "status": rng.choice(STATUSES),
+        "sales_person": rng.choice(SALESPEOPLE),
+    }
+
+
+@pytest.fixture
+def seeded(sheet_data):
+    rng = random.Random(34)
+    sheet_data["Clients"] = [CLIENT_HEADERS] + [
+        [f"CLT{i:03d}", f"Client {i}", _day(rng)] for i in range(12)
+    ]
+    sheet_data["Invoices"] = [INVOICE_HEADERS] + [
+        [_invoice(rng, f"INV-{i:04d}", 12).get(header, "") for header in INVOICE_HEADERS]
+        for i in range(150)
+    ]
+    return rng
+
+
+def _apply_writes(sheets, rng: random.Random, count: int) -> None:
+    """Random invoice appends, edits and deletes plus client writes."""
+    next_id = 1000
+    for _ in range(count):
+        invoice_ids = [row["invoice_id"] for row in sheets.get_all_rows("Invoices")]
+        action = rng.random()
+        if action < 0.3:
+            sheets.append_row("Invoices", _invoice(rng, f"INV-{next_id:04d}", 14))
+            next_id += 1
+        elif action < 0.7:
+            changed = _invoice(rng, "", 14)
+            del changed["invoice_id"]
+            for field in rng.sample(sorted(changed), rng.randint(1, 4)):
+                sheets.update_row(
+                    "Invoices", "invoice_id", rng.choice(invoice_ids), {field: changed[field]}
+                )
+        elif action < 0.85:
+            sheets.delete_row("Invoices", "invoice_id", rng.choice(invoice_ids))
+        elif action < 0.93:
+            client = len(sheets.get_all_rows("Clients"))
+            sheets.append_row("Clients", {
+                "client_id": f"CLT{client:03d}",
+                "name": f"Client {client}",
+                "created_date": _day(rng),
+            })
+        else:
+            client = rng.randrange(12)
+            sheets.update_row(
+                "Clients", "client_id", f"CLT{client:03d}", {"created_date": _day(rng)}
+            )
+
+
+def _rollup_cells(dashboard: DashboardService) -> dict:
+    with dashboard.rollups.lock:
+        return {
+            (day, key): (cell.count, cell.grand_total, cell.total_tax, cell.total_discount)
+            for day, key, cell in dashboard.rollups.iter_cells()
+        }
+
+
+def _boards(dashboard: DashboardService) -> dict:
+    boards = {}
+    for dimension in LEADERBOARD_DIMENSIONS:
+        for window in LEADERBOARD_WINDOWS:
+            entries = dashboard.get_leaderboard(dimension, window, limit=1000)["entries"]
+            revenues = [entry["revenue"] for entry in entries]
+            assert revenues == sorted(revenues, reverse=True)
+            # Equal totals may rank in either order
+            boards[(dimension, window)] = sorted(
+                (entry["id"], entry["revenue"], entry["invoices"]) for entry in entries
+            )
+    return boards
+
+
+def _metrics(dashboard: DashboardService) -> dict:
+    start = (date.today() - timedelta(days=90)).isoformat()
+    end = date.today().isoformat()
+    executive = dashboard.get_executive_metrics(start, end)
+    return {
+        "financial": dashboard.get_financial_metrics(),
+        "financial_range": dashboard.get_financial_metrics(start, end),
+        "executive_range": {
+            key: executive[key]
+            for key in ("total_revenue", "total_invoices", "active_clients", "new_clients",
+                        "client_growth", "revenue_growth", "monthly_revenue")
+        },
+        "compare": dashboard.compare_periods(6, "month"),
+    }
+
+
+def test_incremental_updates_match_rebuild(sheets, seeded):
+    dashboard = DashboardService(sheets)
+    # Build everything before the writes so they are applied incrementally
+    _metrics(dashboard)
+    _boards(dashboard)
+    dashboard.get_client_cohorts(months=6)
+
+    _apply_writes(sheets, seeded, 120)
+
+    rebuilt = DashboardService(sheets)
+    assert _rollup_cells(dashboard) == _rollup_cells(rebuilt)
+    assert _boards(dashboard) == _boards(rebuilt)
+    assert dashboard.get_client_cohorts(months=6) == rebuilt.get_client_cohorts(months=6)
+    assert _metrics(dashboard) == _metrics(rebuilt)
+
+
+def test_rollup_refresh_keeps_generation_when_sheet_unchanged(sheets, sheet_data, seeded):
+    dashboard = DashboardService(sheets)
+    dashboard.get_financial_metrics()
+    generation = dashboard.rollups.generation
+
+    sheets.append_row("Invoices", _invoice(seeded, "INV-9000", 12))
+    dashboard.rollups.refresh()
+    assert dashboard.rollups.generation == generation
+
+    # Direct sheet edit: picked up by the next refresh
+    sheet_data["Invoices"][1][INVOICE_HEADERS.index("grand_total")] = "12345.67"
+    dashboard.rollups.refresh()
+    assert dashboard.rollups.generation == generation + 1
+    assert _rollup_cells(dashboard) == _rollup_cells(DashboardService(sheets))
+
+
+def test_top_client_name_comes_from_first_invoice(sheets, sheet_data):
+    sheet_data["Clients"] = [CLIENT_HEADERS]
+    sheet_data["Invoices"] = [INVOICE_HEADERS]
+    dashboard = DashboardService(sheets)
+    for invoice_id, name in (("INV-1", "First Name"), ("INV-2", "Renamed")):
+        sheets.append_row("Invoices", {
+            "invoice_id": invoice_id, "client_id": "CLT001", "client_name": name,
+            "invoice_date": date.today().isoformat(), "grand_total": "10", "status": "paid",
+        })
+        dashboard.get_executive_metrics()
+
+    assert dashboard.get_executive_metrics()["top_clients"][0]["name"] == "First Name"
+    assert DashboardService(sheets).get_executive_metrics()["top_clients"][0]["name"] == "First Name"
@@ -0,0 +1,170 @@
+"""
+Search query readings, and ranked index hits against a brute-force scan.
+"""
+
+import random
+
+import pytest
+
+from app.services.search_index import (
+    EXACT_ID_SCORE, PREFIX_FACTOR, SearchIndex, query_terms
+)
+
+CLIENT_HEADERS = ["client_id", "name", "email", "phone", "company"]
+INVOICE_HEADERS = ["invoice_id", "client_id", "client_name", "grand_total", "status", "sales_person"]
+TICKET_HEADERS = [
+    "ticket_id", "title", "description", "client_id", "client_name",
+    "status", "priority", "assigned_to", "category",
+]
+TASK_HEADERS = ["task_id", "title", "description", "status", "assigned_to", "client_id", "invoice_id"]
+LOG_HEADERS = ["log_id", "type", "title", "description", "entity_id", "entity_type", "user"]
+
+NAMES = ["Acme Corp", "Globex", "Initech Ltd", "Umbrella", "Stark Industries", "Acme Supplies"]
+WORDS = "login error invoice acme payment refund crash slow export report globex".split()
+
+QUERIES = [
+    "acme", "globex 5", "clt01", "user1@", "555", "inv-1", "INV-0042", "5", "a", "12",
+    "acme 12", "login error", "invoice acme", "refund", "ann", "tkt00", "e", "0001",
+    "clt0001", "555-01", "(555) 1", "0042-1", "2024-0", "inv-0042 555-1", "nothing here",
+]
+
+
+@pytest.fixture
+def seeded(sheet_data):
+    rng = random.Random(44)
+    sheet_data["Clients"] = [CLIENT_HEADERS] + [
+        [
+            f"CLT{i:04d}", f"{rng.choice(NAMES)} {i}",
+            f"user{i}@{rng.choice(['acme', 'globex', 'mail'])}.com",
+            f"+1 (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+            rng.choice(["acme", "co", ""]),
+        ]
+        for i in range(400)
+    ]
+    sheet_data["Invoices"] = [INVOICE_HEADERS] + [
+        [f"INV-2024-{i:04d}" if i % 2 else f"INV-{i:04d}", f"CLT{rng.randrange(400):04d}",
+         rng.choice(NAMES), str(i), "paid", rng.choice(["Ann", "Bob"])]
+        for i in range(600)
+    ]
+    sheet_data["Support_Tickets"] = [TICKET_HEADERS] + [
+        [f"TKT{i:03d}", " ".join(rng.sample(WORDS, 3)), " ".join(rng.sample(WORDS, 5)),
+         f"CLT{rng.randrange(400):04d}", "n", "open", "low", "Ann", "billing"]
+        for i in range(300)
+    ]
+    sheet_data["Tasks"] = [TASK_HEADERS] + [
+        [f"TASK{i:03d}", " ".join(rng.sample(WORDS, 2)), "", "todo", "Bob", "", "INV-0001"]
+        for i in range(200)
+    ]
+    sheet_data["Activity_Logs"] = [LOG_HEADERS] + [
+        [f"LOG{i:05d}", "x", "Invoice generated", f"Invoice INV-{i:04d} for acme",
+         f"INV-{i:04d}", "invoice", "Admin"]
+        for i in range(300)
+    ]
+    return rng
+
+
+@pytest.fixture
+def search_index(sheets, seeded):
+    index = SearchIndex(sheets)
+    yield index
+    index.shutdown()
+
+
+def _brute_force(search_index: SearchIndex, sheets, sheet_name: str, query: str) -> dict:
+    """Score of every matching row, by row ID, from a scan of the sheet."""
+    index = search_index.indexes[sheet_name]
+    scores = {}
+    for row in sheets.get_all_rows(sheet_name):
+        row_id = row.get(index.id_field)
+        if not row_id:
+            continue
+        row_terms = index.row_terms(row)
+        best = None
+        for terms in query_terms(query):
+            total = 0
+            for term in terms:
+                term_score = max(
+                    (weight if candidate == term else weight * PREFIX_FACTOR
+                     for candidate, weight in row_terms.items() if candidate.startswith(term)),
+                    default=0
+                )
+                if not term_score:
+                    break
+                total += term_score
+            else:
+                best = total if best is None else max(best, total)
+        if row_id.lower() == query.strip().lower():
+            best = EXACT_ID_SCORE
+        if best is not None:
+            scores[row_id] = best
+    return scores
+
+
+def _assert_ranked_like_scan(search_index: SearchIndex, sheets) -> None:
+    for sheet_name, index in search_index.indexes.items():
+        for query in QUERIES:
+            expected = _brute_force(search_index, sheets, sheet_name, query)
+            ranked = sorted(expected.values(), reverse=True)
+            for limit in (None, 10, 3):
+                hits = search_index.search(sheet_name, query, limit, 0)
+                assert [score for score, _ in hits] == ranked[:limit], (sheet_name, query, limit)
+                for score, row in hits:
+                    assert expected[row[index.id_field]] == score
+
+
+def test_query_readings():
+    assert query_terms("Acme  Corp") == [["acme", "corp"]]
+    assert query_terms("user1@acme.com") == [["user1@acme.com"]]
+    assert query_terms("acme 555-0142 2024-01-15") == [
+        ["acme", "555", "0142", "2024", "01", "15"],
+        ["acme", "555", "0142", "20240115"],
+        ["acme", "5550142", "2024", "01", "15"],
+        ["acme", "5550142", "20240115"],
+    ]
+    # Digits already a single word have one reading
+    assert query_terms("12 12") == [["12"]]
+    assert query_terms("") == []
+    assert len(query_terms(" ".join(["1-2"] * 10))) <= 8
+
+
+def test_phone_and_id_fragments_match(search_index, sheets, sheet_data):
+    phone = sheet_data["Clients"][1][CLIENT_HEADERS.index("phone")]
+    hits = search_index.search("Clients", phone[-8:], None, 0)
+    assert "CLT0000" in [row["client_id"] for _, row in hits]
+
+    hits = search_index.search("Invoices", "2024-0001", None, 0)
+    assert [row["invoice_id"] for _, row in hits] == ["INV-2024-0001"]
+
+    hits = search_index.search("Invoices", "inv-0042", 1, 0)
+    assert hits[0] == (EXACT_ID_SCORE, sheets.get_all_rows("Invoices")[42])
+
+
+def test_ranking_matches_scan(search_index, sheets):
+    _assert_ranked_like_scan(search_index, sheets)
+
+
+def test_ranking_matches_scan_after_writes(search_index, sheets, seeded):
+    for sheet_name in search_index.indexes:
+        search_index.ensure_loaded(sheet_name)
+
+    for i in range(80):
+        client_ids = [row["client_id"] for row in sheets.get_all_rows("Clients")]
+        action = i % 4
+        if action == 0:
+            sheets.append_row("Clients", {
+                "client_id": f"CLT9{i:03d}", "name": f"{seeded.choice(NAMES)} {i}",
+                "email": f"new{i}@acme.com", "phone": f"555-01{i:02d}",
+            })
+        elif action == 1:
+            sheets.update_row("Clients", "client_id", seeded.choice(client_ids), {
+                "name": f"Renamed {seeded.choice(NAMES)}", "phone": f"+1 555 0{i:03d}",
+            })
+        elif action == 2:
+            sheets.delete_row("Clients", "client_id", seeded.choice(client_ids))
+        else:
+            ticket_ids = [row["ticket_id"] for row in sheets.get_all_rows("Support_Tickets")]
+            sheets.update_row("Support_Tickets", "ticket_id", seeded.choice(ticket_ids), {
+                "title": " ".join(seeded.sample(WORDS, 2)),
+            })
+
+    _assert_ranked_like_scan(search_index, sheets)
@@ -0,0 +1,138 @@
+"""
+Ticket lists from the indexed TicketTable must match a linear scan of the sheet.
+"""
+
+import itertools
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from app.schemas.ticket import TicketCreate, TicketUpdate
+from app.services.ticket_service import TicketService
+from app.services.ticket_table import TicketTable
+
+TICKET_HEADERS = [
+    "ticket_id", "title", "description", "client_id", "client_name", "status",
+    "priority", "assigned_to", "category", "created_date", "updated_date", "resolved_date",
+]
+STATUSES = ["open", "in_progress", "resolved", "closed"]
+PRIORITIES = ["low", "medium", "high", "critical"]
+AGENTS = ["Ann", "Bob", "Cleo", ""]
+
+# A common value (index walk), rare ones (direct sort) and a missing one
+FILTERS = [
+    {},
+    {"status": "open"},
+    {"priority": "critical", "assigned_to": "Cleo"},
+    {"client_id": "CLT003"},
+    {"client_id": "CLT003", "status": "closed"},
+    {"status": "open", "priority": "low", "assigned_to": "Ann"},
+    {"status": "no such status"},
+]
+PAGES = [(0, None), (0, 10), (7, 5), (195, 20), (1000, 10)]
+
+
+def _created_date(rng: random.Random) -> str:
+    day = date(2025, 1, 1) + timedelta(days=rng.randint(0, 30))
+    # Few distinct days, so date ties fall back to sheet order
+    return rng.choice([day.isoformat()] * 8 + [f"{day.isoformat()}T09:30:00", "", "not a date"])
+
+
+def _ticket(rng: random.Random, ticket_id: str) -> list:
+    client = rng.randrange(20)
+    row = {
+        "ticket_id": ticket_id,
+        "title": "Issue",
+        "description": "Details",
+        "client_id": f"CLT{client:03d}",
+        "client_name": f"Client {client}",
+        "status": rng.choice(STATUSES),
+        "priority": rng.choice(PRIORITIES),
+        "assigned_to": rng.choice(AGENTS),
+        "category": "general",
+        "created_date": _created_date(rng),
+        "updated_date": "2025-01-01",
+    }
+    return [row.get(header, "") for header in TICKET_HEADERS]
+
+
+@pytest.fixture
+def seeded(sheet_data):
+    rng = random.Random(49)
+    sheet_data["Support_Tickets"] = [TICKET_HEADERS] + [
+        _ticket(rng, f"TKT{i:03d}") for i in range(1, 201)
+    ]
+    return rng
+
+
+@pytest.fixture
+def services(sheets, seeded):
+    """(service listing from a TicketTable, service scanning the sheet)"""
+    table = TicketTable(sheets)
+    return TicketService(sheets, ticket_table=table), TicketService(sheets)
+
+
+def _listing(service: TicketService, filters: dict, **kwargs):
+    tickets, total = service.list_tickets(**filters, **kwargs)
+    return [ticket.ticket_id for ticket in tickets], total
+
+
+def _assert_matches_scan(indexed: TicketService, scanned: TicketService) -> None:
+    for filters, sort, descending, (offset, limit) in itertools.product(
+        FILTERS, (None, "created_date"), (False, True), PAGES
+    ):
+        kwargs = dict(sort=sort, descending=descending, offset=offset, limit=limit)
+        assert _listing(indexed, filters, **kwargs) == _listing(scanned, filters, **kwargs), (
+            filters, kwargs
+        )
+
+
+def test_queries_match_scan(services):
+    _assert_matches_scan(*services)
+
+
+def test_queries_match_scan_after_writes(services, sheets, seeded):
+    indexed, scanned = services
+    _listing(indexed, {})
+
+    for i in range(60):
+        ticket_ids = [row["ticket_id"] for row in sheets.get_all_rows("Support_Tickets")]
+        action = i % 4
+        if action == 0:
+            indexed.create_ticket(TicketCreate(
+                title="New", description="Details", client_id="CLT003",
+                client_name="Client 3", priority=seeded.choice(PRIORITIES),
+                assigned_to=seeded.choice(AGENTS) or None,
+            ))
+        elif action == 1:
+            indexed.update_ticket(seeded.choice(ticket_ids), TicketUpdate(
+                priority=seeded.choice(PRIORITIES), assigned_to=seeded.choice(AGENTS[:3]),
+            ))
+        elif action == 2:
+            indexed.update_status(seeded.choice(ticket_ids), seeded.choice(STATUSES))
+        else:
+            sheets.update_row("Support_Tickets", "ticket_id", seeded.choice(ticket_ids), {
+                "created_date": _created_date(seeded),
+            })
+        if i % 15 == 14:
+            sheets.delete_row("Support_Tickets", "ticket_id", seeded.choice(ticket_ids))
+        if i % 10 == 9:
+            _assert_matches_scan(indexed, scanned)
+
+    _assert_matches_scan(indexed, scanned)
+
+
+def test_reload_keeps_version_unless_rows_change(services, sheet_data):
+    indexed, scanned = services
+    table = indexed.ticket_table
+    table.load()
+    version = table.version
+
+    table.load()
+    assert table.version == version
+
+    sheet_data["Support_Tickets"][5][TICKET_HEADERS.index("status")] = "closed"
+    table.load()
+    assert table.version == version + 1
+    _assert_matches_scan(indexed, scanned)
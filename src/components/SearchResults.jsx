@@ -1,6 +1,45 @@
 import { useNavigate } from 'react-router-dom';
 import './SearchResults.css';
 
+// Icon, title, subtitle, meta and route of each hit type
+const HIT_DISPLAY = {
+    client: {
+        icon: '👤',
+        title: (hit) => hit.name,
+        subtitle: (hit) => `${hit.id} • ${hit.email}`,
+        meta: (hit) => hit.company,
+        path: (hit) => `/clients/${hit.id}`,
+    },
+    invoice: {
+        icon: '📋',
+        title: (hit) => hit.id,
+        subtitle: (hit) => `${hit.client_name} • ₹${hit.grand_total.toLocaleString()}`,
+        meta: (hit) => `${hit.status} • ${hit.invoice_date}`,
+        path: (hit) => `/invoice/${hit.id}`,
+    },
+    ticket: {
+        icon: '🎫',
+        title: (hit) => hit.title,
+        subtitle: (hit) => `${hit.id} • ${hit.client_name}`,
+        meta: (hit) => `${hit.status} • ${hit.priority}`,
+        path: () => '/dashboard/support',
+    },
+    task: {
+        icon: '✅',
+        title: (hit) => hit.title,
+        subtitle: (hit) => `${hit.id}${hit.assigned_to ? ` • ${hit.assigned_to}` : ''}`,
+        meta: (hit) => `${hit.status} • ${hit.priority}`,
+        path: () => '/dashboard/operations',
+    },
+    activity: {
+        icon: '🕒',
+        title: (hit) => hit.title,
+        subtitle: (hit) => hit.description,
+        meta: (hit) => hit.timestamp,
+        path: () => '/activity',
+    },
+};
+
 const SearchResults = ({ results, isLoading, query, onClose }) => {
     const navigate = useNavigate();
 
@@ -15,7 +54,11 @@ const SearchResults = ({ results, isLoading, query, onClose }) => {
         );
     }
 
-    if (!results || (results.clients.length === 0 && results.invoices.length === 0)) {
+    // Best hits across every entity type, already ranked by the backend
+    const hits = (results?.top ?? [...(results?.clients ?? []), ...(results?.invoices ?? [])])
+        .filter((hit) => HIT_DISPLAY[hit.type]);
+
+    if (hits.length === 0) {
         return (
             <div className="search-results">
                 <div className="search-empty">
@@ -26,73 +69,37 @@ const SearchResults = ({ results, isLoading, query, onClose }) => {
         );
     }
 
-    const handleClientClick = (clientId) => {
-        navigate(`/clients/${clientId}`);
-        onClose();
-    };
-
-    const handleInvoiceClick = (invoiceId) => {
-        navigate(`/invoice/${invoiceId}`);
+    const handleHitClick = (hit) => {
+        navigate(HIT_DISPLAY[hit.type].path(hit));
         onClose();
     };
 
     return (
         <div className="search-results">
-            {/* Clients Section */}
-            {results.clients.length > 0 && (
-                <div className="search-section">
-                    <div className="search-section-header">
-                        <span className="section-icon">👥</span>
-                        <h4>Clients ({results.clients.length})</h4>
-                    </div>
-                    {results.clients.map((client) => (
-                        <div
-                            key={client.id}
-                            className="search-result-item"
-                            onClick={() => handleClientClick(client.id)}
-                        >
-                            <div className="result-icon">👤</div>
-                            <div className="result-content">
-                                <div className="result-title">{client.name}</div>
-                                <div className="result-subtitle">
-                                    {client.id} • {client.email}
-                                </div>
-                                {client.company && (
-                                    <div className="result-meta">{client.company}</div>
-                                )}
-                            </div>
-                        </div>
-                    ))}
+            <div className="search-section">
+                <div className="search-section-header">
+                    <span className="section-icon">⭐</span>
+                    <h4>Best matches ({hits.length})</h4>
                 </div>
-            )}
-
-            {/* Invoices Section */}
-            {results.invoices.length > 0 && (
-                <div className="search-section">
-                    <div className="search-section-header">
-                        <span className="section-icon">📄</span>
-                        <h4>Invoices ({results.invoices.length})</h4>
-                    </div>
-                    {results.invoices.map((invoice) => (
+                {hits.map((hit) => {
+                    const display = HIT_DISPLAY[hit.type];
+                    const meta = display.meta(hit);
+                    return (
                         <div
-                            key={invoice.id}
+                            key={`${hit.type}-${hit.id}`}
                             className="search-result-item"
-                            onClick={() => handleInvoiceClick(invoice.id)}
+                            onClick={() => handleHitClick(hit)}
                         >
-                            <div className="result-icon">📋</div>
+                            <div className="result-icon">{display.icon}</div>
                             <div className="result-content">
-                                <div className="result-title">{invoice.id}</div>
-                                <div className="result-subtitle">
-                                    {invoice.client_name} • ₹{invoice.grand_total.toLocaleString()}
-                                </div>
-                                <div className="result-meta">
-                                    {invoice.status} • {invoice.invoice_date}
-                                </div>
+                                <div className="result-title">{display.title(hit)}</div>
+                                <div className="result-subtitle">{display.subtitle(hit)}</div>
+                                {meta && <div className="result-meta">{meta}</div>}
                             </div>
                         </div>
-                    ))}
-                </div>
-            )}
+                    );
+                })}
+            </div>
         </div>
     );
 };
@@ -40,7 +40,8 @@ const TopBar = () => {
         }
     };
 
-    // Debounce search
+    // Suggest completions while typing, then run the full ranked search
+    // once typing pauses
     useEffect(() => {
         if (!query || query.length < 2) {
             setSearchResults(null);
@@ -48,22 +49,39 @@ const TopBar = () => {
             return;
         }
 
+        let cancelled = false;
         setIsSearching(true);
-        const timeoutId = setTimeout(async () => {
+        const suggestId = setTimeout(async () => {
+            try {
+                const response = await searchAPI.suggest(query);
+                if (!cancelled && response.success && response.suggestions.length > 0) {
+                    setSearchResults({ top: response.suggestions });
+                    setShowResults(true);
+                    setIsSearching(false);
+                }
+            } catch (error) {
+                console.error('Suggest error:', error);
+            }
+        }, 100);
+        const searchId = setTimeout(async () => {
             try {
                 const response = await searchAPI.search(query);
-                if (response.success) {
+                if (!cancelled && response.success) {
                     setSearchResults(response.results);
                     setShowResults(true);
                 }
             } catch (error) {
                 console.error('Search error:', error);
             } finally {
-                setIsSearching(false);
+                if (!cancelled) setIsSearching(false);
             }
-        }, 300); // 300ms debounce
+        }, 500);
 
-        return () => clearTimeout(timeoutId);
+        return () => {
+            cancelled = true;
+            clearTimeout(suggestId);
+            clearTimeout(searchId);
+        };
     }, [query]);
 
     // Close dropdowns when clicking outside
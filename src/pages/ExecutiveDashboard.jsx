@@ -28,6 +28,9 @@ const ExecutiveDashboard = () => {
         };
 
         fetchDashboardData();
+
+        // Live updates: only changed metrics are pushed
+        return dashboardAPI.subscribe('executive', setDashboardData);
     }, []);
 
     // Show loading state
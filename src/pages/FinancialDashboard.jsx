@@ -22,6 +22,9 @@ const FinancialDashboard = () => {
             }
         };
         fetchData();
+
+        // Live updates: only changed metrics are pushed
+        return dashboardAPI.subscribe('financial', setDashboardData);
     }, []);
 
     if (loading) {
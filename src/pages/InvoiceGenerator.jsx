@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react';
 import Button from '../components/Button';
 import { Input, Select } from '../components/Input';
-import { invoiceAPI } from '../services/api';
+import { invoiceAPI, searchAPI } from '../services/api';
 import { generateInvoicePDF } from '../utils/pdfGenerator';
 import './InvoiceGenerator.css';
 
@@ -27,8 +27,7 @@ const InvoiceGenerator = () => {
         { id: 1, service: '', description: '', quantity: 1, unitPrice: 0, tax: 18, discount: 0 }
     ]);
 
-    // Client data for suggestions - Fetch from backend
-    const [clients, setClients] = useState([]);
+    // Client suggestions for the typed name - from the backend typeahead index
     const [clientSuggestions, setClientSuggestions] = useState([]);
 
     // Sales person suggestions
@@ -50,24 +49,41 @@ const InvoiceGenerator = () => {
         address: ''
     });
 
-    // Fetch clients on mount
+    // Suggest clients as the name is typed
     useEffect(() => {
-        const fetchClients = async () => {
+        const prefix = clientName.trim();
+        if (!prefix) {
+            setClientSuggestions([]);
+            return;
+        }
+
+        let cancelled = false;
+        const timeoutId = setTimeout(async () => {
             try {
-                const response = await fetch('http://localhost:8000/api/v1/clients', {
-                    headers: { 'X-API-Key': 'dev-api-key-12345' }
-                });
-                const data = await response.json();
-                if (data.success && data.data) {
-                    setClients(data.data);
-                    setClientSuggestions(data.data.map(c => c.name));
+                const response = await searchAPI.suggest(prefix, { type: 'client', limit: 10 });
+                if (!cancelled && response.success) {
+                    setClientSuggestions(response.suggestions);
                 }
             } catch (error) {
-                console.error('Failed to fetch clients:', error);
+                console.error('Failed to fetch client suggestions:', error);
             }
+        }, 100);
+
+        return () => {
+            cancelled = true;
+            clearTimeout(timeoutId);
         };
-        fetchClients();
-    }, []);
+    }, [clientName]);
+
+    // Client whose name equals the typed one, from the suggestions or the backend
+    const findClientByName = async (name) => {
+        const matches = (list) => list.find(c => c.name.toLowerCase() === name.toLowerCase());
+        const suggested = matches(clientSuggestions);
+        if (suggested) return suggested;
+
+        const response = await searchAPI.suggest(name, { type: 'client', limit: 10 });
+        return response.success ? matches(response.suggestions) : undefined;
+    };
 
     // Check invoice ID uniqueness
     const checkInvoiceId = async (invId) => {
@@ -189,12 +205,12 @@ const InvoiceGenerator = () => {
 
         try {
             // Find the actual client by name to get their client_id
-            const selectedClient = clients.find(c => c.name.toLowerCase() === clientName.trim().toLowerCase());
+            const selectedClient = await findClientByName(clientName.trim());
 
             let finalClientId;
             if (selectedClient) {
                 // Use existing client's ID
-                finalClientId = selectedClient.client_id;
+                finalClientId = selectedClient.id;
                 console.log(`Using existing client: ${clientName} (${finalClientId})`);
             } else if (clientId) {
                 // Use the clientId if it was set from "Add New Client"
@@ -228,9 +244,6 @@ const InvoiceGenerator = () => {
             const result = await invoiceAPI.createInvoice(invoiceData);
 
             // Add new names to suggestions if not already there
-            if (!clientSuggestions.includes(clientName.trim())) {
-                setClientSuggestions([...clientSuggestions, clientName.trim()]);
-            }
             if (!salesPersonSuggestions.includes(salesPerson.trim())) {
                 setSalesPersonSuggestions([...salesPersonSuggestions, salesPerson.trim()]);
             }
@@ -342,11 +355,6 @@ const InvoiceGenerator = () => {
                 address: newClient.address.trim() || null
             });
 
-            // Add to suggestions
-            if (!clientSuggestions.includes(savedClient.name)) {
-                setClientSuggestions([...clientSuggestions, savedClient.name]);
-            }
-
             // Set as current client (use the name from saved client)
             setClientName(savedClient.name);
             setClientId(savedClient.client_id); // Set the generated client ID
@@ -422,8 +430,8 @@ const InvoiceGenerator = () => {
                                 onChange={(e) => setClientName(e.target.value)}
                             />
                             <datalist id="client-list">
-                                {clientSuggestions.map((client, idx) => (
-                                    <option key={idx} value={client} />
+                                {clientSuggestions.map((client) => (
+                                    <option key={client.id} value={client.name} />
                                 ))}
                             </datalist>
                         </div>
@@ -23,6 +23,9 @@ const SalesDashboard = () => {
             }
         };
         fetchData();
+
+        // Live updates: only changed metrics are pushed
+        return dashboardAPI.subscribe('sales', setDashboardData);
     }, []);
 
     if (loading) {
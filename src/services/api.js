@@ -221,7 +221,11 @@ export const ticketAPI = {
             if (filters.status) queryParams.append('status', filters.status);
             if (filters.priority) queryParams.append('priority', filters.priority);
             if (filters.client_id) queryParams.append('client_id', filters.client_id);
+            if (filters.assigned_to) queryParams.append('assigned_to', filters.assigned_to);
+            if (filters.sort) queryParams.append('sort', filters.sort);
+            if (filters.order) queryParams.append('order', filters.order);
             if (filters.limit) queryParams.append('limit', filters.limit);
+            if (filters.offset) queryParams.append('offset', filters.offset);
 
             const url = `${API_BASE_URL}/tickets${queryParams.toString() ? '?' + queryParams.toString() : ''}`;
             const response = await fetch(url, {
@@ -492,6 +496,184 @@ export const dashboardAPI = {
             throw error;
         }
     },
+
+    /**
+     * Get several dashboards in one request (one shared backend pass)
+     * @param {Object} params - Query parameters (start_date, end_date)
+     * @param {string[]} sections - Sections to load (executive, sales, financial); default all
+     * @returns {Promise<Object>} Metrics keyed by section
+     */
+    getAllMetrics: async (params = {}, sections = []) => {
+        const queryParams = new URLSearchParams();
+
+        if (params.start_date) queryParams.append('start_date', params.start_date);
+        if (params.end_date) queryParams.append('end_date', params.end_date);
+        if (sections.length) queryParams.append('sections', sections.join(','));
+
+        try {
+            const response = await fetch(
+                `${API_BASE_URL}/dashboard/all?${queryParams.toString()}`,
+                {
+                    method: 'GET',
+                    headers: getHeaders(),
+                }
+            );
+
+            if (!response.ok) {
+                throw new Error('Failed to fetch dashboard metrics');
+            }
+
+            const result = await response.json();
+            return result.data;
+        } catch (error) {
+            console.error('Error fetching dashboard metrics:', error);
+            throw error;
+        }
+    },
+
+    /**
+     * Compare revenue over the last N periods
+     * @param {Object} params - Query parameters (periods, granularity, end_date, status, sales_person)
+     * @returns {Promise<Array>} Periods with revenue and change vs the previous period
+     */
+    comparePeriods: async (params = {}) => {
+        const queryParams = new URLSearchParams();
+
+        if (params.periods) queryParams.append('periods', params.periods);
+        if (params.granularity) queryParams.append('granularity', params.granularity);
+        if (params.end_date) queryParams.append('end_date', params.end_date);
+        if (params.status) queryParams.append('status', params.status);
+        if (params.sales_person) queryParams.append('sales_person', params.sales_person);
+
+        try {
+            const response = await fetch(
+                `${API_BASE_URL}/dashboard/compare?${queryParams.toString()}`,
+                {
+                    method: 'GET',
+                    headers: getHeaders(),
+                }
+            );
+
+            if (!response.ok) {
+                throw new Error('Failed to fetch period comparison');
+            }
+
+            const result = await response.json();
+            return result.data;
+        } catch (error) {
+            console.error('Error fetching period comparison:', error);
+            throw error;
+        }
+    },
+
+    /**
+     * Get a page of the client or salesperson leaderboard
+     * @param {Object} params - Query parameters (board, window, limit, offset)
+     * @returns {Promise<Object>} Ranked entries and total
+     */
+    getLeaderboard: async (params = {}) => {
+        const queryParams = new URLSearchParams();
+
+        if (params.board) queryParams.append('board', params.board);
+        if (params.window) queryParams.append('window', params.window);
+        if (params.limit) queryParams.append('limit', params.limit);
+        if (params.offset) queryParams.append('offset', params.offset);
+
+        try {
+            const response = await fetch(
+                `${API_BASE_URL}/dashboard/leaderboard?${queryParams.toString()}`,
+                {
+                    method: 'GET',
+                    headers: getHeaders(),
+                }
+            );
+
+            if (!response.ok) {
+                throw new Error('Failed to fetch leaderboard');
+            }
+
+            const result = await response.json();
+            return result.data;
+        } catch (error) {
+            console.error('Error fetching leaderboard:', error);
+            throw error;
+        }
+    },
+
+    /**
+     * Subscribe to live dashboard metric changes (Server-Sent Events)
+     * @param {string} section - Dashboard section (executive, sales, financial, support, operations)
+     * @param {Function} onChange - State setter; called with an updater that applies the changes
+     * @returns {Function} Unsubscribe
+     */
+    subscribe: (section, onChange) => {
+        // Connect tokens are short-lived, so reconnects fetch a new one
+        const RETRY_MS = 3000;
+        const prefix = `${section}.`;
+        let source = null;
+        let closed = false;
+
+        const apply = (changes) => {
+            const updates = Object.entries(changes).filter(([key]) => key.startsWith(prefix));
+            if (!updates.length) return;
+
+            onChange((data) => {
+                const next = { ...(data || {}) };
+                updates.forEach(([key, value]) => {
+                    const path = key.slice(prefix.length).split('.');
+                    let target = next;
+                    path.slice(0, -1).forEach((part) => {
+                        target[part] = { ...(target[part] || {}) };
+                        target = target[part];
+                    });
+                    const last = path[path.length - 1];
+                    if (value === null) {
+                        delete target[last];
+                    } else {
+                        target[last] = value;
+                    }
+                });
+                return next;
+            });
+        };
+
+        const connect = async () => {
+            try {
+                const response = await fetch(`${API_BASE_URL}/dashboard/stream/token`, {
+                    method: 'POST',
+                    headers: getHeaders(),
+                });
+
+                if (!response.ok) {
+                    throw new Error('Failed to get dashboard stream token');
+                }
+
+                const result = await response.json();
+                if (closed) return;
+
+                source = new EventSource(
+                    `${API_BASE_URL}/dashboard/stream?token=${encodeURIComponent(result.data.token)}`
+                );
+                source.addEventListener('snapshot', (event) => apply(JSON.parse(event.data).metrics));
+                source.addEventListener('delta', (event) => apply(JSON.parse(event.data).changes));
+                // EventSource would retry with the same (possibly expired) token
+                source.onerror = () => {
+                    source.close();
+                    if (!closed) setTimeout(connect, RETRY_MS);
+                };
+            } catch (error) {
+                console.error('Error connecting to dashboard stream:', error);
+                if (!closed) setTimeout(connect, RETRY_MS);
+            }
+        };
+
+        connect();
+
+        return () => {
+            closed = true;
+            if (source) source.close();
+        };
+    },
 };
 
 /**
@@ -628,10 +810,10 @@ export const taskAPI = {
  */
 export const searchAPI = {
     /**
-     * Search across clients and invoices
+     * Search across clients, invoices, tickets, tasks and activity logs
      * @param {string} query - Search query
      * @param {Object} params - Optional parameters (type, limit)
-     * @returns {Promise<Object>} Search results
+     * @returns {Promise<Object>} Search results (results.top holds the ranked best hits)
      */
     search: async (query, params = {}) => {
         const queryParams = new URLSearchParams({ q: query });
@@ -657,6 +839,37 @@ export const searchAPI = {
             throw error;
         }
     },
+
+    /**
+     * Typeahead completions of client names and IDs, invoice IDs and ticket IDs
+     * @param {string} prefix - Typed text
+     * @param {Object} params - Optional parameters (type: client|invoice|ticket, limit)
+     * @returns {Promise<Object>} Suggestions, shaped like search hits
+     */
+    suggest: async (prefix, params = {}) => {
+        const queryParams = new URLSearchParams({ q: prefix });
+        if (params.type) queryParams.append('type', params.type);
+        if (params.limit) queryParams.append('limit', params.limit);
+
+        try {
+            const response = await fetch(
+                `${API_BASE_URL}/search/suggest?${queryParams.toString()}`,
+                {
+                    method: 'GET',
+                    headers: getHeaders(),
+                }
+            );
+
+            if (!response.ok) {
+                throw new Error('Suggest failed');
+            }
+
+            return await response.json();
+        } catch (error) {
+            console.error('Error fetching suggestions:', error);
+            throw error;
+        }
+    },
 };
 
 export default {